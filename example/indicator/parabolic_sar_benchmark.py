@@ -0,0 +1,37 @@
+import time
+
+import pandas as pd
+
+from lettrade.indicator import parabolic_sar
+from test.indicator.test_parabolic_sar import parabolic_sar_loop
+
+
+def _benchmark(fn, df: pd.DataFrame, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(
+        "example/data/data/EURUSD_5m-0_10000.csv",
+        index_col=0,
+        parse_dates=["datetime"],
+    )
+
+    # Warm up kernel compilation when numba is installed
+    parabolic_sar(df.iloc[:10])
+
+    loop = _benchmark(parabolic_sar_loop, df, rounds=1)
+    kernel = _benchmark(parabolic_sar, df)
+    print(f"Rows: {len(df)}")
+    print(f"Row loop: {loop * 1000:.2f}ms")
+    print(f"Kernel:   {kernel * 1000:.2f}ms, {loop / kernel:.1f}x faster")
+
+    # Large dataframe, kernel only
+    big = pd.concat([df] * 100, ignore_index=True)
+    kernel = _benchmark(parabolic_sar, big)
+    print(f"Rows: {len(big)}, kernel: {kernel * 1000:.2f}ms")
@@ -0,0 +1,37 @@
+import time
+
+import pandas as pd
+
+from lettrade.indicator.vendor.qtpylib import qtpylib
+from test.indicator.test_qtpylib import heikinashi_loop, rsi_loop
+
+
+def _benchmark(fn, *args, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(
+        "example/data/data/EURUSD_5m-0_10000.csv",
+        index_col=0,
+        parse_dates=["datetime"],
+    )
+
+    # 1M bars
+    big = pd.concat([df] * 100, ignore_index=True)
+    print(f"Rows: {len(big)}")
+
+    loop = _benchmark(heikinashi_loop, big, rounds=1)
+    kernel = _benchmark(qtpylib.heikinashi, big)
+    print(f"heikinashi row loop: {loop * 1000:.2f}ms")
+    print(f"heikinashi filter:   {kernel * 1000:.2f}ms, {loop / kernel:.1f}x faster")
+
+    loop = _benchmark(rsi_loop, big.close, rounds=1)
+    kernel = _benchmark(qtpylib.rsi, big.close)
+    print(f"rsi row loop: {loop * 1000:.2f}ms")
+    print(f"rsi filter:   {kernel * 1000:.2f}ms, {loop / kernel:.1f}x faster")
@@ -0,0 +1,52 @@
+import pandas as pd
+
+from lettrade import DataFeed, Strategy
+from lettrade.exchange.backtest import ForexBackTestAccount, let_backtest
+
+_windows = range(5, 50)
+
+
+class SmaCrossBatch(Strategy):
+    ema1_window = 9
+    ema2_window = 21
+
+    # EMA of all windows, computed once per optimize worker process
+    _emas: pd.DataFrame | None = None
+
+    def indicators(self, df: DataFeed):
+        cls = self.__class__
+        if cls._emas is None or len(cls._emas) != len(df):
+            cls._emas = df.i.ema(window=_windows)
+
+        df["ema1"] = cls._emas[self.ema1_window]
+        df["ema2"] = cls._emas[self.ema2_window]
+
+        df["signal_ema_crossover"] = df.i.crossover(df.ema1, df.ema2)
+        df["signal_ema_crossunder"] = df.i.crossunder(df.ema1, df.ema2)
+
+    def next(self, df: DataFeed):
+        if len(self.orders) > 0 or len(self.positions) > 0:
+            return
+
+        if df.l.signal_ema_crossover[-1]:
+            price = df.l.close[-1]
+            self.buy(size=0.1, sl=price - 0.001, tp=price + 0.001)
+        elif df.l.signal_ema_crossunder[-1]:
+            price = df.l.close[-1]
+            self.sell(size=0.1, sl=price + 0.001, tp=price - 0.001)
+
+
+if __name__ == "__main__":
+    lt = let_backtest(
+        strategy=SmaCrossBatch,
+        datas="example/data/data/EURUSD_5m-0_10000.csv",
+        account=ForexBackTestAccount,
+    )
+
+    lt.optimize(
+        ema1_window=_windows,
+        ema2_window=_windows,
+    )
+
+    lt.plot()
+    lt.plotter.heatmap()
@@ -0,0 +1,48 @@
+import logging
+import time
+
+import example.logger
+from lettrade import DataFeed, Strategy
+from lettrade.exchange.replay import let_replay
+
+logger = logging.getLogger(__name__)
+
+
+class AlternateTrade(Strategy):
+    """Keep one position open to load order and event paths every few bars"""
+
+    def indicators(self, df: DataFeed):
+        df["ema"] = df.i.ema(window=21)
+
+    def next(self, df: DataFeed):
+        if len(self.orders) > 0 or len(self.positions) > 0:
+            return
+
+        price = df.l.close[-1]
+        if price > df.l.ema[-1]:
+            self.buy(size=0.01, sl=price - 0.001, tp=price + 0.001)
+        else:
+            self.sell(size=0.01, sl=price + 0.001, tp=price - 0.001)
+
+
+if __name__ == "__main__":
+    logging.getLogger("lettrade").setLevel(logging.WARNING)
+
+    lt = let_replay(
+        strategy=AlternateTrade,
+        datas=[("EURUSD", "1h", "EURUSD_1h")],
+        replay_datas={("EURUSD", "1h"): "test/assets/EURUSD_1h-0_1000.csv"},
+        replay_start=500,
+        # As fast as possible, with broker round trip of 1-5ms
+        replay_speed=0,
+        replay_latency=(0.001, 0.005),
+    )
+
+    start = time.perf_counter()
+    lt.run()
+    seconds = time.perf_counter() - start
+
+    exchange = lt._bot.exchange
+    bars = len(exchange.data) - 500
+    print(f"Bars: {bars} in {seconds:.2f}s, {bars / seconds:.1f} bars/s")
+    print(exchange.order_latency)
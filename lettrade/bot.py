@@ -95,7 +95,7 @@ class LetTradeBot:
         """Init objects from classes"""
         # Feeder
         self.feeder = self._feeder_cls(**self._kwargs.get("feeder_kwargs", {}))
-        self.feeder.init(self.datas)
+        self.feeder.init(self.datas, panels=self._kwargs.get("panels", None))
 
         # Account
         self.account = self._account_cls(**self._kwargs.get("account_kwargs", {}))
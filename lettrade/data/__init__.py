@@ -1,5 +1,8 @@
+from .compact import data_compact, data_compact_validate
 from .data import DataFeed
 from .error import *
 from .feeder import DataFeeder
+from .panel import PanelDataFeed
+from .quality import DataQualityReport, data_quality
 from .resample import resample
 from .timeframe import TimeFrame
@@ -0,0 +1,130 @@
+import logging
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COMPACT_PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def data_compact(
+    dataframe: pd.DataFrame,
+    float_dtype: Any = np.float32,
+    signal_dtype: Any = np.int8,
+    columns: list[str] | None = None,
+    validate: bool = False,
+    rtol: float = 1e-6,
+    atol: float = 0.0,
+) -> dict[str, np.dtype]:
+    """Cast columns of DataFrame to compact dtypes inplace.
+
+    - float64 columns are casted to `float_dtype`
+    - Signal columns (integer or integral float values) fit in range of
+    `signal_dtype` are casted to `signal_dtype`. Price columns are never casted to signal.
+    - bool columns are kept, they are 1 byte already and casting breaks boolean
+    mask indexing like `df.loc[df.flag]`
+
+    Args:
+        dataframe (pd.DataFrame): DataFrame/DataFeed to compact
+        float_dtype (Any, optional): dtype of float columns. Defaults to np.float32.
+        signal_dtype (Any, optional): dtype of signal columns. Defaults to np.int8.
+        columns (list[str] | None, optional): Columns to compact. Defaults to None, all columns.
+        validate (bool, optional): Validate compacted values match original values
+            within tolerance. Defaults to False.
+        rtol (float, optional): Relative tolerance of validation. Defaults to 1e-6.
+        atol (float, optional): Absolute tolerance of validation. Defaults to 0.0.
+
+    Raises:
+        RuntimeError: Compacted values do not match original values
+
+    Returns:
+        dict[str, np.dtype]: Casted columns and their new dtype
+    """
+    float_dtype = np.dtype(float_dtype)
+    signal_dtype = np.dtype(signal_dtype)
+    signal_info = np.iinfo(signal_dtype)
+
+    if columns is None:
+        columns = list(dataframe.columns)
+
+    casted: dict[str, np.dtype] = dict()
+    origins: dict[str, np.ndarray] = dict()
+    for column in columns:
+        values = dataframe[column].values
+        if not isinstance(values, np.ndarray):
+            continue
+
+        dtype = None
+        kind = values.dtype.kind
+        if kind in "iu" and column not in COMPACT_PRICE_COLUMNS:
+            if len(values) == 0 or (
+                values.min() >= signal_info.min and values.max() <= signal_info.max
+            ):
+                dtype = signal_dtype
+        elif kind == "f":
+            if column not in COMPACT_PRICE_COLUMNS and _is_signal(values, signal_info):
+                dtype = signal_dtype
+            elif values.dtype.itemsize > float_dtype.itemsize:
+                dtype = float_dtype
+
+        if dtype is None or dtype == values.dtype:
+            continue
+
+        if validate:
+            origins[column] = values
+        dataframe[column] = values.astype(dtype)
+        casted[column] = dtype
+
+    if validate and origins:
+        data_compact_validate(dataframe, origins, rtol=rtol, atol=atol)
+
+    if __debug__:
+        logger.debug("Compacted %d columns: %s", len(casted), list(casted.keys()))
+
+    return casted
+
+
+def data_compact_validate(
+    compact: pd.DataFrame,
+    origin: pd.DataFrame | dict[str, np.ndarray],
+    columns: list[str] | None = None,
+    rtol: float = 1e-6,
+    atol: float = 0.0,
+) -> None:
+    """Validate compacted values match float64 values within tolerance
+
+    Args:
+        compact (pd.DataFrame): Compacted DataFrame
+        origin (pd.DataFrame | dict[str, np.ndarray]): Original float64 DataFrame or columns
+        columns (list[str] | None, optional): Columns to validate. Defaults to None, all common columns.
+        rtol (float, optional): Relative tolerance. Defaults to 1e-6.
+        atol (float, optional): Absolute tolerance. Defaults to 0.0.
+
+    Raises:
+        RuntimeError: Columns do not match within tolerance
+    """
+    if columns is None:
+        columns = [c for c in compact.columns if c in origin]
+
+    invalids = []
+    for column in columns:
+        values = np.asarray(compact[column], dtype=np.float64)
+        origin_values = np.asarray(origin[column], dtype=np.float64)
+        if not np.allclose(values, origin_values, rtol=rtol, atol=atol, equal_nan=True):
+            diff = np.nanmax(np.abs(values - origin_values))
+            invalids.append(f"{column}(max diff {diff})")
+
+    if invalids:
+        raise RuntimeError(
+            f"Compacted columns not match origin within tolerance: {', '.join(invalids)}"
+        )
+
+
+def _is_signal(values: np.ndarray, signal_info: np.iinfo) -> bool:
+    if len(values) == 0 or np.isnan(values).any():
+        return False
+    if values.min() < signal_info.min or values.max() > signal_info.max:
+        return False
+    return bool((values == np.round(values)).all())
@@ -10,9 +10,13 @@ from .wrapper import LetDataFeedWrapper
 if TYPE_CHECKING:
     from lettrade import indicator
 
+    from .quality import DataQualityReport
+
 logger = logging.getLogger(__name__)
 
 _data_name_pattern = re.compile(r"^[\w\_\-\.]+$")
+_push_columns = ["open", "high", "low", "close", "volume"]
+_push_bulk_size = 32
 
 
 class DataFeed(pd.DataFrame):
@@ -21,6 +25,8 @@ class DataFeed(pd.DataFrame):
     l: LetDataFeedWrapper
     """LetTrade DataFeed wrapper using to manage index pointer of DataFeed"""
 
+    _lt_lazy: dict[str, tuple[Callable, tuple[str, ...]]] | None = None
+
     def __init__(
         self,
         *args,
@@ -64,6 +70,25 @@ class DataFeed(pd.DataFrame):
         if not hasattr(self, "l"):
             object.__setattr__(self, "l", LetDataFeedWrapper(self))
 
+    def __getitem__(self, key):
+        lazy = self._lt_lazy
+        if lazy:
+            if isinstance(key, str):
+                if key in lazy:
+                    self._lazy_load(key)
+            elif isinstance(key, list):
+                for name in key:
+                    if isinstance(name, str) and name in lazy:
+                        self._lazy_load(name)
+
+        return super().__getitem__(key)
+
+    def __getattr__(self, name: str):
+        lazy = self._lt_lazy
+        if lazy and name in lazy:
+            self._lazy_load(name)
+        return super().__getattr__(name)
+
     # Internal
     def _init_index(self):
         if not isinstance(self.index, pd.DatetimeIndex):
@@ -95,8 +120,103 @@ class DataFeed(pd.DataFrame):
             meta=self.meta.copy(),
             **kwargs,
         )
+
+        # Lazy columns are not loaded yet
+        if self._lt_lazy:
+            object.__setattr__(df, "_lt_lazy", self._lt_lazy.copy())
         return df
 
+    def lazy(
+        self,
+        name: str,
+        fn: Callable[["DataFeed"], pd.Series],
+        depends: list[str] | None = None,
+    ):
+        """Register a column computed by `fn` only when it is first read
+        by `df[name]`, `df.<name>` or `df.l.<name>`, then cached as normal column.
+
+        Lazy column is not in `columns` until loaded. Register an existed column
+        name replaces that column.
+
+        Args:
+            name (str): Column name
+            fn (Callable[[DataFeed], pd.Series]): Function of DataFeed return column values
+            depends (list[str] | None, optional): Columns are loaded before `fn`.
+                Defaults to None.
+
+        Example:
+            ```python
+            def indicators(self, df: DataFeed):
+                # Computed only when active parameters read them
+                for window in range(5, 100):
+                    df.lazy(f"ema{window}", lambda df, w=window: df.i.ema(window=w))
+
+                df.lazy(
+                    "signal",
+                    lambda df: df.i.crossover(df[f"ema{self.fast}"], df[f"ema{self.slow}"]),
+                    depends=[f"ema{self.fast}", f"ema{self.slow}"],
+                )
+            ```
+        """
+        if __debug__:
+            if not callable(fn):
+                raise RuntimeError(f"Lazy column {name} function {fn} is not callable")
+
+        if name in self.columns:
+            self.drop(columns=name, inplace=True)
+
+        if self._lt_lazy is None:
+            object.__setattr__(self, "_lt_lazy", dict())
+        self._lt_lazy[name] = (fn, tuple(depends or ()))
+
+    def _lazy_load(self, name: str):
+        lazy = self._lt_lazy
+        if lazy[name] is None:
+            raise RuntimeError(f"Lazy column {name} has dependency cycle")
+        fn, depends = lazy[name]
+
+        # Mark loading to detect dependency cycle
+        lazy[name] = None
+        try:
+            for depend in depends:
+                self[depend]
+
+            value = fn(self)
+        except BaseException:
+            lazy[name] = (fn, depends)
+            raise
+
+        del lazy[name]
+        self[name] = value
+
+        if __debug__:
+            logger.debug("[%s] Lazy column %s loaded", self.name, name)
+
+    def compact(self, **kwargs) -> dict:
+        """Cast columns to compact dtypes inplace, float32 prices and int8 signals.
+        Parameters reflect of [data_compact](compact.md#lettrade.data.compact.data_compact)
+
+        Returns:
+            dict: Casted columns and their new dtype
+        """
+        from .compact import data_compact
+
+        return data_compact(self, **kwargs)
+
+    def quality(self, repair: bool = False) -> "DataQualityReport":
+        """Detect gaps, duplicate timestamps, non-monotonic index and zero-range bars.
+        Reflect of [data_quality](quality.md#lettrade.data.quality.data_quality)
+
+        Args:
+            repair (bool, optional): Build repaired index. Defaults to False.
+
+        Returns:
+            DataQualityReport: _description_
+        """
+        from .quality import data_quality
+
+        return data_quality(self, timeframe=self.timeframe, repair=repair)
+
     def next(self, size=1):
         """Load next data
 
@@ -130,6 +250,9 @@ class DataFeed(pd.DataFrame):
             unit (str | None, optional): pandas.Timestamp parsing unit. Defaults to None.
             utc (bool, optional): _description_. Defaults to True.
         """
+        if len(rows) >= _push_bulk_size:
+            return self._push_bulk(rows, unit=unit, utc=utc, **kwargs)
+
         for row in rows:
             dt = pd.to_datetime(row[0], unit=unit, utc=utc, **kwargs)
             self.at[
@@ -152,6 +275,34 @@ class DataFeed(pd.DataFrame):
         if __debug__:
             logger.debug("[%s] Update bar: \n%s", self.name, self.tail(len(rows)))
 
+    def _push_bulk(self, rows: list[list[int | float]], unit=None, utc=True, **kwargs):
+        # Row by row enlargement copies DataFeed every row, append all rows at once
+        index = pd.to_datetime([row[0] for row in rows], unit=unit, utc=utc, **kwargs)
+        frame = pd.DataFrame(
+            [row[1:6] for row in rows],
+            index=index.rename("datetime"),
+            columns=_push_columns,
+            dtype="float64",
+        )
+        self._push_frame(frame[~frame.index.duplicated(keep="last")])
+
+        if __debug__:
+            logger.debug("[%s] Pushed %d bars", self.name, len(rows))
+
+    def _push_frame(self, frame: pd.DataFrame):
+        if self.empty:
+            result = frame.reindex(columns=self.columns)
+        else:
+            # Existed rows are updated, keep their extra columns
+            exist = frame.index.isin(self.index)
+            if exist.any():
+                self.loc[frame.index[exist], _push_columns] = frame[exist].values
+            result = pd.concat([pd.DataFrame(self, copy=False), frame[~exist]])
+            if not result.index.is_monotonic_increasing:
+                result = result.sort_index()
+
+        self._update_inplace(result)
+
     def drop(
         self,
         *args,
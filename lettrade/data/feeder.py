@@ -1,15 +1,22 @@
 from abc import ABCMeta, abstractmethod
 
 from .data import DataFeed
+from .panel import PanelDataFeed
 
 
 class DataFeeder(metaclass=ABCMeta):
     datas: list[DataFeed]
     data: DataFeed
+    panels: list[PanelDataFeed]
 
-    def init(self, datas: list[DataFeed]):
+    def init(
+        self,
+        datas: list[DataFeed],
+        panels: list[PanelDataFeed] | None = None,
+    ):
         self.datas = datas
         self.data = datas[0]
+        self.panels = panels or []
 
     @property
     def is_continous(self):
@@ -0,0 +1,381 @@
+import logging
+import re
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .timeframe import TimeFrame
+from .wrapper import LetIndexWapper
+
+logger = logging.getLogger(__name__)
+
+_panel_name_pattern = re.compile(r"^[\w\_\-\.]+$")
+
+
+def _data_symbol(data: pd.DataFrame, index: int) -> str:
+    # DataFeed keeps name in metadata, plain DataFrame could set attrs["name"]
+    meta = data.attrs.get("lt_meta")
+    if meta is not None and "name" in meta:
+        return meta["name"]
+    return data.attrs.get("name", f"data_{index}")
+
+
+class LetPanelFieldWrapper:
+    """Wrap a field of PanelDataFeed, get item return cross-sectional values"""
+
+    _values: np.ndarray
+    _owner: "LetPanelWrapper"
+
+    def __init__(self, values: np.ndarray, owner: "LetPanelWrapper") -> None:
+        """_summary_
+
+        Args:
+            values (np.ndarray): 2D array `(bars, symbols)` of field
+            owner (LetPanelWrapper): Panel wrapper own pointer
+        """
+        self._values = values
+        self._owner = owner
+
+    def __getitem__(self, item: int | slice) -> np.ndarray:
+        if isinstance(item, int):
+            item += self._owner._pointer
+        elif isinstance(item, slice):
+            item = slice(
+                item.start + self._owner._pointer,
+                item.stop + self._owner._pointer,
+                item.step,
+            )
+        else:
+            raise NotImplementedError(
+                f"Get item {item} type {type(item)} is not implement yet"
+            )
+        return self._values[item]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    # Property
+    @property
+    def pointer(self):
+        return self._owner._pointer
+
+
+class LetPanelWrapper:
+    """Wrap PanelDataFeed, manage single pointer shared by all symbols"""
+
+    _panel: "PanelDataFeed"
+    _pointer: int
+    _wrappers: dict[str, LetPanelFieldWrapper | LetIndexWapper]
+
+    def __init__(self, panel: "PanelDataFeed") -> None:
+        """_summary_
+
+        Args:
+            panel (PanelDataFeed): PanelDataFeed object
+        """
+        self._pointer = 0
+        self._panel = panel
+        self._wrappers = dict()
+
+    def __getattr__(self, name: str) -> LetPanelFieldWrapper | LetIndexWapper:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if name in self._wrappers:
+            return self._wrappers[name]
+
+        if name == "index":
+            wrapper = LetIndexWapper(self._panel.index, self)
+        elif name in self._panel._field_locs:
+            wrapper = LetPanelFieldWrapper(
+                self._panel.values[:, self._panel._field_locs[name], :],
+                self,
+            )
+        else:
+            raise AttributeError(f"PanelDataFeed field {name} is not exist")
+
+        self._wrappers[name] = wrapper
+        return wrapper
+
+    def __getitem__(self, item: int | slice) -> np.ndarray:
+        if isinstance(item, int):
+            return self._panel.values[item + self._pointer]
+        if isinstance(item, slice):
+            return self._panel.values[
+                slice(
+                    item.start + self._pointer,
+                    item.stop + self._pointer,
+                    item.step,
+                )
+            ]
+        raise NotImplementedError(
+            f"Get item {item} type {type(item)} is not implement yet"
+        )
+
+    # Function
+    def next(self, size=1):
+        """Move pointer to next"""
+        self._pointer += size
+
+    def go_start(self) -> None:
+        """Move pointer to begin"""
+        self._pointer = 0
+
+    def go_stop(self) -> None:
+        """Move pointer to end"""
+        self._pointer = len(self._panel) - 1
+
+    def reset(self) -> None:
+        """Reset pointer to begin"""
+        self._pointer = 0
+
+    # Property
+    @property
+    def pointer(self):
+        """Get current pointer value"""
+        return self._pointer
+
+    @property
+    def pointer_start(self):
+        """Get start pointer value"""
+        return -self._pointer
+
+    @property
+    def pointer_stop(self):
+        """Get stop pointer value"""
+        return len(self._panel) - self._pointer
+
+
+class PanelDataFeed:
+    """Multi-symbols aligned DataFeed.
+
+    All symbols are aligned to an union datetime index and stored in one contiguous
+    3D array `(bars, fields, symbols)`, so a cross-sectional read of a field at a bar
+    is a contiguous slice and all symbols share a single pointer.
+
+    Usage:
+        ```python
+        panel = PanelDataFeed(datas=[df_eurusd, df_gbpusd, df_usdjpy], name="forex")
+
+        # Close price of all symbols at current bar
+        panel.l.close[0]
+        # Close price of all symbols at previous bar
+        panel.l.close[-1]
+        ```
+    """
+
+    l: LetPanelWrapper
+    """LetTrade panel wrapper using to manage shared index pointer of all symbols"""
+
+    values: np.ndarray
+    """Contiguous 3D array `(bars, fields, symbols)`"""
+    index: pd.DatetimeIndex
+    """Union datetime index of all symbols"""
+    symbols: list[str]
+    """Symbol names, order of last axis"""
+    fields: list[str]
+    """Field names, order of middle axis"""
+
+    def __init__(
+        self,
+        datas: list[pd.DataFrame] | dict[str, pd.DataFrame],
+        name: str = "panel",
+        timeframe: str | int | pd.Timedelta | TimeFrame | None = None,
+        fields: list[str] | tuple[str, ...] = (
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+        ),
+        fill: str | None = "ffill",
+        dtype: Any = np.float64,
+        meta: dict | None = None,
+    ) -> None:
+        """_summary_
+
+        Args:
+            datas (list[pd.DataFrame] | dict[str, pd.DataFrame]): List of `DataFeed` or dict of `{symbol: DataFrame}`.
+                Symbol of plain `pd.DataFrame` in list is `attrs["name"]` or `data_<position>`
+            name (str, optional): _description_. Defaults to "panel".
+            timeframe (str | int | pd.Timedelta | TimeFrame | None, optional): Timeframe of panel.
+                Defaults to None, use timeframe of first `DataFeed`.
+            fields (list[str] | tuple[str, ...], optional): Columns to store in panel.
+                Defaults to ("open", "high", "low", "close", "volume").
+            fill (str | None, optional): Missing bar fill method, `ffill` or `None` to keep `nan`.
+                Defaults to "ffill".
+            dtype (Any, optional): dtype of panel values. Defaults to np.float64.
+            meta (dict | None, optional): _description_. Defaults to None.
+
+        Raises:
+            RuntimeError: _description_
+        """
+        if not _panel_name_pattern.match(name):
+            raise RuntimeError(
+                f"Panel name {name} is not valid format {_panel_name_pattern}"
+            )
+
+        if isinstance(datas, dict):
+            symbols = list(datas.keys())
+            frames = list(datas.values())
+        else:
+            symbols = [_data_symbol(d, i) for i, d in enumerate(datas)]
+            frames = list(datas)
+
+        if not frames:
+            raise RuntimeError("PanelDataFeed datas is empty")
+        if len(set(symbols)) != len(symbols):
+            raise RuntimeError(f"PanelDataFeed symbols {symbols} is duplicated")
+
+        if timeframe is None:
+            timeframe = getattr(frames[0], "timeframe", None)
+            if timeframe is None:
+                raise RuntimeError("PanelDataFeed timeframe is missing")
+
+        # Union index
+        index = frames[0].index
+        for df in frames[1:]:
+            if not index.equals(df.index):
+                index = index.union(df.index)
+        if not isinstance(index, pd.DatetimeIndex):
+            raise RuntimeError("Index is not pandas.DatetimeIndex format")
+        index = index.rename("datetime")
+
+        # Contiguous storage (bars, fields, symbols)
+        fields = list(fields)
+        values = np.empty((len(index), len(fields), len(symbols)), dtype=dtype)
+        for s, df in enumerate(frames):
+            df = pd.DataFrame(df[fields])
+            if not df.index.equals(index):
+                df = df.reindex(index)
+                if fill == "ffill":
+                    df = df.ffill()
+            values[:, :, s] = df.to_numpy(dtype=dtype)
+
+        self.values = values
+        self.index = index
+        self.symbols = symbols
+        self.fields = fields
+
+        self._field_locs: dict[str, int] = {f: i for i, f in enumerate(fields)}
+        self._symbol_locs: dict[str, int] = {s: i for i, s in enumerate(symbols)}
+        self._index_ns: np.ndarray = index.asi8
+
+        # Metadata
+        if not meta:
+            meta = dict()
+        meta["name"] = name
+        meta["timeframe"] = TimeFrame(timeframe)
+        self.meta: dict = meta
+
+        # LetWrapper
+        self.l = LetPanelWrapper(self)
+
+        if __debug__:
+            logger.debug(
+                "PanelDataFeed %s: %d bars x %d fields x %d symbols",
+                name,
+                *values.shape,
+            )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {self.name} bars={len(self)} "
+            f"fields={self.fields} symbols={len(self.symbols)}>"
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("l", None)
+        state["_pointer"] = self.l._pointer
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        pointer = state.pop("_pointer", 0)
+        self.__dict__.update(state)
+        self.l = LetPanelWrapper(self)
+        self.l._pointer = pointer
+
+    # Function
+    def next(self, size: int = 1, to: pd.Timestamp | None = None) -> bool:
+        """Move shared pointer of all symbols
+
+        Args:
+            size (int, optional): Number of bars to move. Defaults to 1.
+            to (pd.Timestamp | None, optional): Move to the last bar not after `to`. Defaults to None.
+
+        Returns:
+            bool: `True` if there is a bar after new pointer
+        """
+        if to is not None:
+            pos = int(np.searchsorted(self._index_ns, to.value, side="right")) - 1
+            if pos > self.l._pointer:
+                self.l._pointer = pos
+        elif size > 0:
+            self.l.next(size)
+        return self.l._pointer + 1 < len(self.index)
+
+    def alive(self) -> bool:
+        return self.l.pointer_stop > 1
+
+    def field(self, name: str) -> pd.DataFrame:
+        """Get a field of all symbols as `pandas.DataFrame` `(bars, symbols)`
+
+        Args:
+            name (str): Field name
+
+        Returns:
+            pd.DataFrame: _description_
+        """
+        return pd.DataFrame(
+            self.values[:, self._field_locs[name], :],
+            index=self.index,
+            columns=self.symbols,
+            copy=False,
+        )
+
+    def symbol(self, name: str) -> pd.DataFrame:
+        """Get all fields of a symbol as `pandas.DataFrame` `(bars, fields)`
+
+        Args:
+            name (str): Symbol name
+
+        Returns:
+            pd.DataFrame: _description_
+        """
+        return pd.DataFrame(
+            self.values[:, :, self._symbol_locs[name]],
+            index=self.index,
+            columns=self.fields,
+        )
+
+    def symbol_loc(self, name: str) -> int:
+        """Get position of symbol in last axis
+
+        Args:
+            name (str): Symbol name
+
+        Returns:
+            int: _description_
+        """
+        return self._symbol_locs[name]
+
+    # Property
+    @property
+    def now(self) -> pd.Timestamp:
+        """Property to get current index value of PanelDataFeed"""
+        return self.l.index[0]
+
+    @property
+    def name(self) -> str:
+        """Property to get name of PanelDataFeed"""
+        return self.meta["name"]
+
+    @property
+    def timeframe(self) -> TimeFrame:
+        """Property to get timeframe of PanelDataFeed"""
+        return self.meta["timeframe"]
@@ -0,0 +1,203 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .timeframe import TimeFrame
+
+logger = logging.getLogger(__name__)
+
+
+class DataQualityReport:
+    """Data quality report of a DataFeed"""
+
+    name: str | None
+    """Name of DataFeed"""
+    timeframe: TimeFrame
+    """TimeFrame used to detect gaps and misaligned bars"""
+    size: int
+    """Number of bars"""
+    gaps: pd.DataFrame
+    """Gaps with columns `start`, `end` and number of `missing` bars"""
+    duplicates: pd.DatetimeIndex
+    """Duplicated timestamps"""
+    unordered: pd.DatetimeIndex
+    """Timestamps smaller than previous timestamp"""
+    zero_ranges: pd.DatetimeIndex
+    """Timestamps of bars with `high == low`"""
+    misaligned: pd.DatetimeIndex
+    """Timestamps not aligned to timeframe"""
+    index: pd.DatetimeIndex | None
+    """Repaired index: sorted, unique and aligned. `None` if repair is not requested"""
+
+    def __init__(
+        self,
+        timeframe: TimeFrame,
+        size: int,
+        gaps: pd.DataFrame,
+        duplicates: pd.DatetimeIndex,
+        unordered: pd.DatetimeIndex,
+        zero_ranges: pd.DatetimeIndex,
+        misaligned: pd.DatetimeIndex,
+        index: pd.DatetimeIndex | None = None,
+        name: str | None = None,
+    ) -> None:
+        self.name = name
+        self.timeframe = timeframe
+        self.size = size
+        self.gaps = gaps
+        self.duplicates = duplicates
+        self.unordered = unordered
+        self.zero_ranges = zero_ranges
+        self.misaligned = misaligned
+        self.index = index
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} name={self.name} timeframe={self.timeframe}"
+            f" size={self.size} gaps={len(self.gaps)} missing={self.missing}"
+            f" duplicates={len(self.duplicates)} unordered={len(self.unordered)}"
+            f" zero_ranges={len(self.zero_ranges)} misaligned={len(self.misaligned)}>"
+        )
+
+    def to_dict(self) -> dict:
+        """Compact summary of report
+
+        Returns:
+            dict: _description_
+        """
+        return dict(
+            name=self.name,
+            timeframe=str(self.timeframe),
+            size=self.size,
+            gaps=len(self.gaps),
+            missing=self.missing,
+            duplicates=len(self.duplicates),
+            unordered=len(self.unordered),
+            zero_ranges=len(self.zero_ranges),
+            misaligned=len(self.misaligned),
+        )
+
+    @property
+    def missing(self) -> int:
+        """Total number of missing bars"""
+        return int(self.gaps["missing"].sum()) if len(self.gaps) else 0
+
+    @property
+    def has_gaps(self) -> bool:
+        """Flag check DataFeed has missing bars"""
+        return len(self.gaps) > 0
+
+    @property
+    def is_index_valid(self) -> bool:
+        """Flag check index is ordered, unique and aligned"""
+        return (
+            len(self.duplicates) == 0
+            and len(self.unordered) == 0
+            and len(self.misaligned) == 0
+        )
+
+    @property
+    def ok(self) -> bool:
+        """Flag check DataFeed has no quality issue"""
+        return self.is_index_valid and not self.has_gaps and len(self.zero_ranges) == 0
+
+
+def data_quality(
+    dataframe: pd.DataFrame,
+    timeframe: TimeFrame | str | int | pd.Timedelta | None = None,
+    repair: bool = False,
+) -> DataQualityReport:
+    """Detect gaps, duplicate timestamps, non-monotonic index, zero-range and
+    misaligned bars in one vectorized sweep
+
+    Args:
+        dataframe (pd.DataFrame): DataFeed or DataFrame with `pd.DatetimeIndex`
+        timeframe (TimeFrame | str | int | pd.Timedelta | None, optional): TimeFrame of bars.
+            Defaults to None, use `dataframe.timeframe`.
+        repair (bool, optional): Build repaired index. Defaults to False.
+
+    Raises:
+        RuntimeError: _description_
+
+    Returns:
+        DataQualityReport: _description_
+    """
+    if timeframe is None:
+        timeframe = getattr(dataframe, "timeframe", None)
+        if timeframe is None:
+            raise RuntimeError("DataFrame timeframe is missing")
+    timeframe = TimeFrame(timeframe)
+
+    index = dataframe.index
+    if not isinstance(index, pd.DatetimeIndex):
+        raise RuntimeError("Index is not pandas.DatetimeIndex format")
+
+    ns = _wall_ns(index)
+    delta = np.diff(ns)
+    step = timeframe.delta.value
+
+    # Index order
+    unordered = index[1:][delta < 0]
+    duplicates = index[index.duplicated()]
+
+    # Gaps
+    gap_locs = np.flatnonzero(delta > step)
+    gaps = pd.DataFrame(
+        dict(
+            start=index[gap_locs],
+            end=index[gap_locs + 1],
+            missing=delta[gap_locs] // step - 1,
+        )
+    )
+    gaps = gaps[gaps["missing"] > 0].reset_index(drop=True)
+
+    # Bars
+    if "high" in dataframe.columns and "low" in dataframe.columns:
+        zero_ranges = index[dataframe["high"].values == dataframe["low"].values]
+    else:
+        zero_ranges = index[:0]
+
+    floors = timeframe.floor_ns(ns)
+    misaligned = index[floors != ns]
+
+    # Repair
+    repaired = None
+    if repair:
+        repaired = timeframe.floor(index)
+        repaired = repaired[~repaired.duplicated(keep="last")].sort_values()
+
+    return DataQualityReport(
+        name=dataframe.attrs.get("lt_meta", {}).get("name", None),
+        timeframe=timeframe,
+        size=len(index),
+        gaps=gaps,
+        duplicates=duplicates,
+        unordered=unordered,
+        zero_ranges=zero_ranges,
+        misaligned=misaligned,
+        index=repaired,
+    )
+
+
+def data_repair(dataframe: pd.DataFrame, timeframe: TimeFrame) -> pd.DataFrame:
+    """Align index to timeframe, drop duplicated bars (keep last) and sort index
+
+    Args:
+        dataframe (pd.DataFrame): _description_
+        timeframe (TimeFrame): _description_
+
+    Returns:
+        pd.DataFrame: Repaired DataFrame
+    """
+    dataframe = dataframe.copy(deep=False)
+    dataframe.index = timeframe.floor(dataframe.index)
+    dataframe = dataframe[~dataframe.index.duplicated(keep="last")]
+    return dataframe.sort_index()
+
+
+def _wall_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    tz = index.tz
+    if tz is not None and str(tz) != "UTC":
+        return index.tz_localize(None).asi8
+    return index.asi8
@@ -2,7 +2,9 @@ import logging
 import math
 import re
 from datetime import datetime, timedelta
+from typing import Callable
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -44,15 +46,45 @@ TIMEFRAME_DELTA_2_STR = {
 
 _pattern_timeframe_str = re.compile(r"^([0-9]+)([a-z]+)$")
 
+_NS_DAY = 86_400_000_000_000
+_NS_WEEK = 7 * _NS_DAY
+_NS_WEEK_OFFSET = 4 * _NS_DAY  # 1970-01-05 is the first Monday after epoch
+
+_timeframe_cache: dict = dict()
+
 
 class TimeFrame:
-    """DataFeed TimeFrame"""
+    """DataFeed TimeFrame.
+
+    TimeFrame instances are immutable and interned, so `TimeFrame("5m") is TimeFrame(5)`
+    """
 
     delta: pd.Timedelta
     unit: str
     unit_pandas: str
     value: int
 
+    def __new__(cls, tf: "int | str | list | pd.Timedelta | TimeFrame") -> "TimeFrame":
+        if isinstance(tf, TimeFrame):
+            return tf
+
+        key = tuple(tf) if isinstance(tf, list) else tf
+        try:
+            return _timeframe_cache[key]
+        except (KeyError, TypeError):
+            pass
+
+        self = super().__new__(cls)
+        self._init(tf)
+
+        # Interning by parsed string, then all formats share same instance
+        self = _timeframe_cache.setdefault(self.string, self)
+        try:
+            _timeframe_cache[key] = self
+        except TypeError:
+            pass
+        return self
+
     def __init__(self, tf: "int | str | list | pd.Timedelta | TimeFrame") -> None:
         """_summary_
 
@@ -63,10 +95,10 @@ class TimeFrame:
         Raises:
             RuntimeError: _description_
         """
-        if isinstance(tf, TimeFrame):
-            self.value = tf.value
-            self.unit = tf.unit
-        elif isinstance(tf, str):
+        # Already initialized by `__new__`
+
+    def _init(self, tf: "int | str | list | pd.Timedelta") -> None:
+        if isinstance(tf, str):
             match = _pattern_timeframe_str.search(tf)
             if not match:
                 raise RuntimeError(f"TimeFrame value {tf} is invalid")
@@ -80,6 +112,8 @@ class TimeFrame:
             self.value = int(tf[0])
             self.unit = tf[1]
         elif isinstance(tf, pd.Timedelta):
+            if tf not in TIMEFRAME_DELTA_2_STR:
+                raise RuntimeError(f"Timeframe {tf} is invalid format")
             map = TIMEFRAME_DELTA_2_STR[tf]
             self.value = map[0]
             self.unit = map[1]
@@ -92,6 +126,8 @@ class TimeFrame:
         # Setup
         self.unit_pandas = TIMEFRAME_UNIT_LET_2_PANDAS[self.unit]
         self.delta = pd.Timedelta(self.value, self.unit_pandas)
+        self._freq = self.string_pandas + ("in" if self.unit == "m" else "")
+        self._ns = self.delta.value
 
         # Warning
         if self.delta not in TIMEFRAME_DELTA_2_STR:
@@ -126,6 +162,13 @@ class TimeFrame:
             return self.string == other
         return False
 
+    def __hash__(self) -> int:
+        return hash(self.string)
+
+    def __reduce__(self):
+        # Unpickle/copy return the interned instance
+        return (TimeFrame, (self.string,))
+
     @property
     def string(self):
         """TimeFrame as lettrade string"""
@@ -137,29 +180,32 @@ class TimeFrame:
         return f"{self.value}{self.unit_pandas}"
 
     def floor(
-        self, at: datetime | timedelta | pd.Timestamp | pd.Timedelta
-    ) -> pd.Timestamp | pd.Timedelta:
+        self,
+        at: "datetime | timedelta | pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray",
+    ) -> "pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray":
         """Get floor of TimeFrame
 
         Args:
-            at (datetime | timedelta | pd.Timestamp | pd.Timedelta): _description_
+            at (datetime | timedelta | pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray):
+                Scalar or array of datetime. Arrays are floored by integer nanoseconds
+                and keep their type and timezone.
 
         Raises:
             RuntimeError: _description_
 
         Returns:
-            pd.Timestamp | pd.Timedelta: _description_
+            pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray: _description_
         """
+        if isinstance(at, (pd.DatetimeIndex, pd.Series, np.ndarray)):
+            return self._array_round(at, self.floor_ns)
+
         if isinstance(at, datetime):
             at = pd.Timestamp(at)
         elif isinstance(at, timedelta):
             at = pd.Timedelta(at)
 
         if self.unit in ["h", "m", "s"]:
-            freq = self.string_pandas
-            if self.unit == "m":
-                freq += "in"
-            return at.floor(freq=freq)
+            return at.floor(freq=self._freq)
 
         if isinstance(at, pd.Timestamp):
             if self.unit == "d":
@@ -177,29 +223,32 @@ class TimeFrame:
         raise RuntimeError(f"Unit {self.unit} is not implement yet for {at}")
 
     def ceil(
-        self, at: datetime | timedelta | pd.Timestamp | pd.Timedelta
-    ) -> pd.Timestamp | pd.Timedelta:
+        self,
+        at: "datetime | timedelta | pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray",
+    ) -> "pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray":
         """Get ceil of TimeFrame
 
         Args:
-            at (datetime | timedelta | pd.Timestamp | pd.Timedelta): _description_
+            at (datetime | timedelta | pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray):
+                Scalar or array of datetime. Arrays are ceiled by integer nanoseconds
+                and keep their type and timezone, aligned values are kept.
 
         Raises:
             RuntimeError: _description_
 
         Returns:
-            pd.Timestamp: _description_
+            pd.Timestamp | pd.Timedelta | pd.DatetimeIndex | pd.Series | np.ndarray: _description_
         """
+        if isinstance(at, (pd.DatetimeIndex, pd.Series, np.ndarray)):
+            return self._array_round(at, self.ceil_ns)
+
         if isinstance(at, datetime):
             at = pd.Timestamp(at)
         elif isinstance(at, timedelta):
             at = pd.Timedelta(at)
 
         if self.unit in ["h", "m", "s"]:
-            freq = self.string_pandas
-            if self.unit == "m":
-                freq += "in"
-            return at.ceil(freq=freq)
+            return at.ceil(freq=self._freq)
 
         if isinstance(at, pd.Timestamp):
             if self.unit == "d":
@@ -215,3 +264,67 @@ class TimeFrame:
                 return pd.Timedelta(weeks=weeks)
 
         raise RuntimeError(f"Unit {self.unit} is not implement yet for {at}")
+
+    # Integer nanoseconds
+    def floor_ns(self, values: np.ndarray) -> np.ndarray:
+        """Floor integer nanoseconds array of wall time
+
+        Args:
+            values (np.ndarray): int64 nanoseconds array
+
+        Returns:
+            np.ndarray: int64 nanoseconds array
+        """
+        step, offset = self._ns_step()
+        values = np.asarray(values, dtype=np.int64)
+        return values - (values - offset) % step
+
+    def ceil_ns(self, values: np.ndarray) -> np.ndarray:
+        """Ceil integer nanoseconds array of wall time, aligned values are kept
+
+        Args:
+            values (np.ndarray): int64 nanoseconds array
+
+        Returns:
+            np.ndarray: int64 nanoseconds array
+        """
+        step, offset = self._ns_step()
+        values = np.asarray(values, dtype=np.int64)
+        return values + (offset - values) % step
+
+    def _ns_step(self) -> tuple[int, int]:
+        if self.unit in ["h", "m", "s"]:
+            return self._ns, 0
+        if self.unit == "d":
+            return _NS_DAY, 0
+        if self.unit == "w":
+            return _NS_WEEK, _NS_WEEK_OFFSET
+        raise RuntimeError(f"Unit {self.unit} is not implement yet")
+
+    def _array_round(
+        self,
+        at: "pd.DatetimeIndex | pd.Series | np.ndarray",
+        fn: Callable[[np.ndarray], np.ndarray],
+    ) -> "pd.DatetimeIndex | pd.Series | np.ndarray":
+        if isinstance(at, pd.Series):
+            return pd.Series(
+                self._array_round(pd.DatetimeIndex(at), fn),
+                index=at.index,
+                name=at.name,
+            )
+
+        if isinstance(at, np.ndarray):
+            if at.dtype.kind == "M":
+                return fn(at.astype("datetime64[ns]").view(np.int64)).view(
+                    "datetime64[ns]"
+                )
+            return fn(at)
+
+        # DatetimeIndex, round on wall time
+        tz = at.tz
+        if tz is not None and str(tz) != "UTC":
+            wall = at.tz_localize(None)
+            return pd.DatetimeIndex(fn(wall.asi8).view("datetime64[ns]")).tz_localize(
+                tz
+            )
+        return pd.DatetimeIndex(fn(at.asi8).view("datetime64[ns]"), tz=tz)
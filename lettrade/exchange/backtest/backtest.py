@@ -21,6 +21,7 @@ from lettrade import (
     LetTradeBot,
     Strategy,
 )
+from lettrade.indicator.plot import indicator_plot_enable
 
 from .account import BackTestAccount
 from .commander import BackTestCommander
@@ -75,8 +76,9 @@ class LetTradeBackTest(LetTrade):
     def _strategy_cls(self) -> type[Strategy]:
         return self._kwargs.get("strategy_cls", None)
 
+    @classmethod
     def _datafeed(
-        self,
+        cls,
         data: str | DataFeed | BackTestDataFeed | pd.DataFrame,
         index: int,
         **kwargs,
@@ -125,6 +127,9 @@ class LetTradeBackTest(LetTrade):
         if self._plotter_cls:
             self._plotter_cls = None
 
+        # Disable indicator plotters until optimize_done()
+        indicator_plot_enable(False)
+
         # Enable Optimize plotter
         if self._optimize_plotter_cls == "PlotlyOptimizePlotter":
             from .plotly import PlotlyOptimizePlotter
@@ -429,6 +434,7 @@ class LetTradeBackTest(LetTrade):
     def optimize_done(self):
         """Clean and close optimize handlers"""
         self._stats.done()
+        indicator_plot_enable(True)
 
     # --- Optimize: run
     @classmethod
@@ -457,6 +463,9 @@ class LetTradeBackTest(LetTrade):
                     # logger.info("Optimize load cache: %s", cached["path"])
                     return result
 
+            # Optimize worker could be spawned process
+            indicator_plot_enable(False)
+
             # Load bot
             if datas:
                 kwargs["datas"] = datas
@@ -1,9 +1,12 @@
 import logging
 import re
+from typing import Literal
 
+import numpy as np
 import pandas as pd
 
-from lettrade.data import DataFeed
+from lettrade.data import DataFeed, TimeFrame
+from lettrade.data.quality import data_quality, data_repair
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,8 @@ class BackTestDataFeed(DataFeed):
         meta: dict | None = None,
         since: int | str | pd.Timestamp | None = None,
         to: int | str | pd.Timestamp | None = None,
+        compact: bool = False,
+        quality: Literal["bypass", "warning", "raise", "repair"] = "bypass",
         **kwargs,
     ) -> None:
         """_summary_
@@ -30,10 +35,34 @@ class BackTestDataFeed(DataFeed):
             meta (dict | None, optional): _description_. Defaults to None.
             since (int | str | pd.Timestamp | None, optional): Drop data before since. Defaults to None.
             to (int | str | pd.Timestamp | None, optional): Drop data after to. Defaults to None.
+            compact (bool, optional): Compact mode, store float32 prices and int8 signal columns.
+                Indicators are compacted after loaded. Defaults to False.
+            quality (Literal["bypass", "warning", "raise", "repair"], optional): Data quality
+                check at load. `warning` log report, `raise` raise error when index is invalid
+                or has gaps, `repair` align, deduplicate and sort index. Defaults to "bypass".
         """
         if timeframe is None:
             timeframe = self._find_timeframe(data)
             logger.info("DataFeed %s auto detect timeframe %s", name, timeframe)
+
+        report = None
+        if quality != "bypass":
+            if quality not in ("warning", "raise", "repair"):
+                raise RuntimeError(f"DataFeed quality {quality} is invalid")
+
+            report = data_quality(data, timeframe=timeframe)
+            if not report.ok:
+                match quality:
+                    case "warning":
+                        logger.warning("DataFeed %s quality: %s", name, report)
+                    case "raise":
+                        if not report.is_index_valid or report.has_gaps:
+                            raise RuntimeError(f"DataFeed {name} quality: {report}")
+                    case "repair":
+                        if not report.is_index_valid:
+                            logger.warning("DataFeed %s repair: %s", name, report)
+                            data = data_repair(data, TimeFrame(timeframe))
+                            report = data_quality(data, timeframe=timeframe)
         super().__init__(
             data=data,
             name=name,
@@ -44,6 +73,14 @@ class BackTestDataFeed(DataFeed):
         if since is not None or to is not None:
             self.drop(since=since, to=to)
 
+        if report is not None:
+            # No gap, per-bar missing validation is skipped in `next()`
+            self.meta["gapless"] = report.is_index_valid and not report.has_gaps
+
+        if compact:
+            self.meta["compact"] = True
+            self.compact(validate=__debug__)
+
     def _find_timeframe(self, df):
         if len(df.index) < 3:
             raise RuntimeError("DataFeed not enough data to detect timeframe")
@@ -65,19 +102,14 @@ class BackTestDataFeed(DataFeed):
     ) -> bool:
         has_to = True
         if to is not None:
-            size = 0
-            while True:
-                try:
-                    dt_to = self.l.index[size + 1]
-                    if dt_to > to:
-                        break
-                    size += 1
-                except (KeyError, IndexError):
-                    has_to = False
-                    break
+            # Search on integer nanoseconds index instead of walking bar by bar
+            pointer = self.l.pointer
+            loc = int(np.searchsorted(self.index.asi8, to.value, side="right")) - 1
+            size = max(loc - pointer, 0)
+            has_to = pointer + size + 1 < len(self.index)
 
             # Validate
-            if missing != "bypass":
+            if missing != "bypass" and not self.meta.get("gapless", False):
                 now = self.l.index[size]
                 floor = self.timeframe.floor(to)
                 if now != floor:
@@ -118,6 +150,7 @@ class CSVBackTestDataFeed(BackTestDataFeed):
         timeframe: str | int | pd.Timedelta | None = None,
         meta: dict | None = None,
         data: DataFeed | None = None,
+        compact: bool = False,
         **kwargs: dict,
     ) -> None:
         """_summary_
@@ -129,6 +162,7 @@ class CSVBackTestDataFeed(BackTestDataFeed):
             timeframe (str | int | pd.Timedelta | None, optional): _description_. Defaults to None.
             meta (dict | None, optional): _description_. Defaults to None.
             data (DataFeed | None, optional): _description_. Defaults to None.
+            compact (bool, optional): Compact mode, read prices as float32. Defaults to False.
             **kwargs (dict): [DataFeed](../../data/data.md#lettrade.data.data.DataFeed) dict parameters
         """
         if name is None:
@@ -141,6 +175,10 @@ class CSVBackTestDataFeed(BackTestDataFeed):
                 delimiter=",",
                 header=0,
             )
+            if compact:
+                csv_params.update(
+                    dtype={c: np.float32 for c in ("open", "high", "low", "close")}
+                )
             if csv is not None:
                 csv_params.update(**csv)
 
@@ -156,6 +194,7 @@ class CSVBackTestDataFeed(BackTestDataFeed):
             name=name,
             timeframe=timeframe,
             meta=meta,
+            compact=compact,
             **kwargs,
         )
 
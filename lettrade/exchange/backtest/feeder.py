@@ -38,6 +38,9 @@ class BackTestDataFeeder(DataFeeder):
                 to=next,
                 missing="bypass",
             )
+        for panel in self.panels:
+            panel.l.reset()
+            panel.next(to=next)
 
     # def _cleanup_data(self):
     #     # Synchronize start time
@@ -72,6 +75,9 @@ class BackTestDataFeeder(DataFeeder):
                     raise LetNoMoreDataFeedException()
                 no_to += 1
 
+        for panel in self.panels:
+            panel.next(to=to)
+
         if no_to >= len(self.datas):
             # Skip lastest available bar, because if next some data feeded some are not
             raise LetNoMoreDataFeedException()
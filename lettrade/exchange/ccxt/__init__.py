@@ -1,3 +1,4 @@
 from .api import CCXTAPI
 from .ccxt import *
+from .stream import CCXTStream
 from .trade import CCXTExecution, CCXTOrder, CCXTPosition
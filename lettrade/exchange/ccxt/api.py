@@ -6,10 +6,18 @@ from multiprocessing.managers import BaseManager
 from typing import TYPE_CHECKING, Literal
 
 import ccxt
+import ccxt.pro as ccxtpro
 from box import Box
 from ccxt.base.errors import RequestTimeout
 
 from lettrade.exchange.live import LetLiveOrderInvalidException, LiveAPI
+from lettrade.exchange.live.scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    backoff_jitter,
+)
+
+from .stream import CCXTStream
 
 if TYPE_CHECKING:
     from .ccxt import CCXTExchange
@@ -22,7 +30,7 @@ logger = logging.getLogger(__name__)
 def ccxt_connection(api_function):
     @functools.wraps(api_function)
     def wrapper(self: "CCXTAPIExchange", *args, api_retry: int = 3, **kwargs):
-        while api_retry > 0:
+        for attempt in range(api_retry):
             try:
                 return api_function(self, *args, **kwargs)
             except RequestTimeout:
@@ -30,12 +38,51 @@ def ccxt_connection(api_function):
 
             logger.warning("Retry functon %s", api_function)
 
-            time.sleep(1)
-            api_retry -= 1
+            time.sleep(backoff_jitter(attempt))
 
     return wrapper
 
 
+def ccxt_config(
+    key: str,
+    secret: str,
+    options: dict | None = None,
+    type: Literal["spot", "margin", "future"] = "spot",
+    sandbox: bool = True,
+    **kwargs,
+) -> dict:
+    """Build config of `ccxt` exchange
+
+    Args:
+        key (str): _description_
+        secret (str): _description_
+        options (dict | None, optional): _description_. Defaults to None.
+        type (Literal["spot", "margin", "future"], optional): _description_. Defaults to "spot".
+        sandbox (bool, optional): _description_. Defaults to True.
+
+    Returns:
+        dict: _description_
+    """
+    config = dict(
+        apiKey=key,
+        secret=secret,
+        enableRateLimit=True,
+        defaultType=type,
+        options={
+            "sandboxMode": sandbox,
+            "warnOnFetchOpenOrdersWithoutSymbol": False,
+            "tradesLimit": 1,
+            "ordersLimit": 1,
+            "OHLCVLimit": 1,
+        },
+    )
+    config.update(kwargs)
+
+    if options is not None:
+        config["options"].update(options)
+    return config
+
+
 class CCXTAPIExchange:
     """Single instance across multiprocessing. Help pickle-able result and send across multiprocessing"""
 
@@ -57,24 +104,14 @@ class CCXTAPIExchange:
         verbose: bool = False,
         **kwargs,
     ) -> None:
-        config = dict(
-            apiKey=key,
+        config = ccxt_config(
+            key=key,
             secret=secret,
-            enableRateLimit=True,
-            defaultType=type,
-            options={
-                "sandboxMode": sandbox,
-                "warnOnFetchOpenOrdersWithoutSymbol": False,
-                "tradesLimit": 1,
-                "ordersLimit": 1,
-                "OHLCVLimit": 1,
-            },
+            options=options,
+            type=type,
+            sandbox=sandbox,
+            **kwargs,
         )
-        config.update(kwargs)
-
-        if options is not None:
-            config["options"].update(options)
-
         self._exchange = getattr(ccxt, exchange)(config)
 
         # Must call sanbox function instead of option sandboxMode
@@ -181,6 +218,9 @@ class CCXTAPI(LiveAPI):
     _ccxt: CCXTAPIExchange
     _exchange: "CCXTExchange"
     _currency: str
+    _stream: CCXTStream | None
+    _scheduler: RequestScheduler | None
+    _retry_on: tuple[type[Exception], ...] = (ccxt.NetworkError,)
 
     def __new__(cls, *args, **kwargs):
         if not hasattr(cls, "_singleton"):
@@ -189,10 +229,24 @@ class CCXTAPI(LiveAPI):
 
     @classmethod
     def multiprocess(cls, kwargs, **other_kwargs):
+        # Share rate limit of one account across processes
+        scheduler = kwargs.get("scheduler", None)
+        if scheduler:
+            if isinstance(scheduler, RequestScheduler):
+                scheduler = kwargs["scheduler"] = scheduler.parameters()
+            elif not isinstance(scheduler, dict):
+                scheduler = kwargs["scheduler"] = dict()
+            RequestScheduler.multiprocess(kwargs=scheduler)
+
         BaseManager.register("CCXTAPIExchange", CCXTAPIExchange)
         manager = BaseManager()
         manager.start()
-        kwargs["ccxt"] = manager.CCXTAPIExchange(**kwargs)
+        kwargs["ccxt"] = manager.CCXTAPIExchange(
+            **cls._exchange_kwargs(
+                **{k: v for k, v in kwargs.items() if k not in ("stream", "scheduler")},
+                scheduler=scheduler,
+            )
+        )
 
     def __init__(
         self,
@@ -201,6 +255,8 @@ class CCXTAPI(LiveAPI):
         secret: str,
         currency: str = "USDT",
         ccxt: CCXTAPIExchange | None = None,
+        stream: bool | CCXTStream = False,
+        scheduler: bool | dict | RequestScheduler = False,
         **kwargs,
     ):
         """_summary_
@@ -210,12 +266,58 @@ class CCXTAPI(LiveAPI):
             key (str): _description_
             secret (str): _description_
             ccxt (CCXTAPIExchange | None, optional): _description_. Defaults to None.
+            stream (bool | CCXTStream, optional): Push bars, orders and trades from
+                `ccxt.pro` websocket instead of REST polling. Defaults to False.
+            scheduler (bool | dict | RequestScheduler, optional): Rate limit, prioritize
+                and coalesce requests by `RequestScheduler`, dict is its parameters.
+                Replace ccxt `enableRateLimit` throttle, retry requests on
+                `ccxt.NetworkError` except order placement. Defaults to False.
         """
         if ccxt is None:
-            ccxt = CCXTAPIExchange(exchange=exchange, key=key, secret=secret, **kwargs)
+            ccxt = CCXTAPIExchange(
+                **self._exchange_kwargs(
+                    exchange=exchange,
+                    key=key,
+                    secret=secret,
+                    scheduler=scheduler,
+                    **kwargs,
+                )
+            )
         self._ccxt = ccxt
         self._currency = ccxt
 
+        if stream is True:
+            stream = CCXTStream(self._stream_exchange(exchange, key, secret, **kwargs))
+        self._stream = stream or None
+
+        if scheduler is True:
+            scheduler = RequestScheduler()
+        elif isinstance(scheduler, dict):
+            scheduler = RequestScheduler(**scheduler)
+        self._scheduler = scheduler or None
+
+    @staticmethod
+    def _exchange_kwargs(scheduler=False, **kwargs) -> dict:
+        # Scheduler is the rate limiter, ccxt throttle would double the wait
+        if scheduler is not False and scheduler is not None:
+            kwargs.setdefault("enableRateLimit", False)
+        return kwargs
+
+    @staticmethod
+    def _stream_exchange(
+        exchange: str,
+        key: str,
+        secret: str,
+        sandbox: bool = True,
+        verbose: bool = False,
+        **kwargs,
+    ):
+        config = ccxt_config(key=key, secret=secret, sandbox=sandbox, **kwargs)
+        pro = getattr(ccxtpro, exchange)(config)
+        pro.set_sandbox_mode(sandbox)
+        pro.verbose = verbose
+        return pro
+
     # Bypass pickle
     def __copy__(self):
         return self.__class__._singleton
@@ -229,12 +331,61 @@ class CCXTAPI(LiveAPI):
 
         self._ccxt.start()
 
+        if self._stream is not None:
+            self._stream.start()
+            self._stream.subscribe("orders")
+            self._stream.subscribe("my_trades")
+
     def stop(self):
         """"""
         # self._ccxt.stop()
+        if self._stream is not None:
+            self._stream.stop()
 
     def next(self):
-        pass
+        if self._stream is None:
+            return
+
+        # Streamed updates, keep last update of each id
+        orders = self._stream_raws("orders")
+        if orders:
+            self._exchange.on_orders_event(new=orders)
+
+        trades = self._stream_raws("my_trades")
+        if trades:
+            self._exchange.on_executions_event(trades)
+
+    def _stream_raws(self, channel: str) -> list[Box]:
+        raws = dict()
+        for _, payload in self._stream.get(channel):
+            for raw in payload:
+                raws[raw["id"]] = Box(raw)
+        return list(raws.values())
+
+    def _request(
+        self,
+        function,
+        *args,
+        priority: RequestPriority = RequestPriority.Normal,
+        key=None,
+        **kwargs,
+    ):
+        if self._scheduler is None:
+            return function(*args, **kwargs)
+        return self._scheduler.call(
+            function,
+            *args,
+            priority=priority,
+            key=key,
+            # Order placement is not idempotent, never retry it
+            retry_on=self._retry_on if priority > RequestPriority.High else (),
+            **kwargs,
+        )
+
+    @property
+    def stream(self) -> CCXTStream | None:
+        """Stream of `ccxt.pro` exchange, `None` when streaming is disabled"""
+        return self._stream
 
     def heartbeat(self):
         return True
@@ -257,13 +408,21 @@ class CCXTAPI(LiveAPI):
         to: int | datetime | None = 1_000,
         **kwargs,
     ) -> list[list]:
-        return self._ccxt.fetch_ohlcv(symbol, timeframe, limit=to, **kwargs)
+        return self._request(
+            self._ccxt.fetch_ohlcv,
+            symbol,
+            timeframe,
+            limit=to,
+            priority=RequestPriority.Low,
+            key=("fetch_ohlcv", symbol, timeframe, to) if not kwargs else None,
+            **kwargs,
+        )
 
     ### Private
     # Account
     def account(self) -> dict:
         """"""
-        raw = self._ccxt.fetch_my_balance()
+        raw = self._request(self._ccxt.fetch_my_balance, key="fetch_my_balance")
         currency = raw[self._currency]
         return Box(
             balance=currency["free"],
@@ -277,7 +436,9 @@ class CCXTAPI(LiveAPI):
     def order_open(self, order: "CCXTOrder", **kwargs):
         """"""
         try:
-            result = self._ccxt.create_my_order(
+            result = self._request(
+                self._ccxt.create_my_order,
+                priority=RequestPriority.High,
                 symbol=order.data.symbol,
                 type=order.type.lower(),
                 side=order.side.lower(),
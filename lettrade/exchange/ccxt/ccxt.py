@@ -12,6 +12,7 @@ from lettrade.exchange.live import (
     let_live,
 )
 from lettrade.exchange.live.api import LiveAPI
+from lettrade.utils.latency import latency_probes
 
 from .api import CCXTAPI
 from .trade import CCXTExecution, CCXTOrder, CCXTPosition
@@ -24,13 +25,117 @@ class CCXTDataFeed(LiveDataFeed):
 
     _api_cls: type[CCXTAPI] = CCXTAPI
 
+    @property
+    def _stream_building(self) -> list | None:
+        return getattr(self, "__stream_building", None)
+
+    @_stream_building.setter
+    def _stream_building(self, value) -> None:
+        object.__setattr__(self, "__stream_building", value)
+
+    def on_candles(self, candles: list[list]) -> bool:
+        """Push streamed candles, a candle is closed when a newer candle arrives
+
+        Args:
+            candles (list[list]): Candles from `watch_ohlcv`, last one is building
+
+        Returns:
+            bool: True if new closed bars pushed
+        """
+        building = self._stream_building
+        closed = []
+        for candle in candles:
+            if building is None or candle[0] == building[0]:
+                building = candle
+            elif candle[0] > building[0]:
+                closed.append(building)
+                building = candle
+        self._stream_building = building
+
+        if not self.empty:
+            last = self.now.value // 1_000_000
+            closed = [bar for bar in closed if bar[0] > last]
+        if not closed:
+            return False
+
+        # Drop existed extra columns to skip reusing calculated data
+        self.drop(columns=self.columns.difference(self._base_columns), inplace=True)
+
+        self.push(closed, unit=self._bar_datetime_unit)
+        self.l.go_stop()
+        return True
+
 
 class CCXTDataFeeder(LiveDataFeeder):
-    """DataFeeder for CCXT"""
+    """DataFeeder for CCXT
+
+    When `CCXTAPI` streaming is enabled, bars are pushed from `watch_ohlcv` and
+    `next()` wakes up on bar close of main DataFeed instead of polling.
+    """
 
     _api_cls: type[CCXTAPI] = CCXTAPI
     _data_cls: type[CCXTDataFeed] = CCXTDataFeed
 
+    _api: CCXTAPI
+    _stream_timeout: float | None
+
+    def __init__(self, *args, stream_timeout: float | None = None, **kwargs) -> None:
+        """_summary_
+
+        Args:
+            stream_timeout (float | None, optional): Seconds without stream update before
+                falling back to REST fetch. Defaults to None, 2 bars of main DataFeed.
+        """
+        super().__init__(*args, **kwargs)
+        self._stream_timeout = stream_timeout
+
+    def start(self, size: int = 0):
+        super().start(size=size)
+
+        stream = self._api.stream
+        if stream is None:
+            return
+
+        stream.start()
+        for data in self.datas:
+            stream.subscribe("ohlcv", data.symbol, data.timeframe.string)
+
+    def next(self):
+        stream = self._api.stream
+        if stream is None:
+            return super().next()
+
+        datas = {(d.symbol, d.timeframe.string): d for d in self.datas}
+        if self._tick > 0:
+            timeout = self._tick
+        elif self._stream_timeout is not None:
+            timeout = self._stream_timeout
+        else:
+            timeout = 2 * self.data.timeframe.delta.total_seconds()
+
+        while True:
+            updates = stream.get("ohlcv", block=True, timeout=timeout)
+
+            # Stream is stalled or dead, fetch bars by REST
+            if not updates and (self._tick <= 0 or not stream.alive):
+                logger.warning(
+                    "Stream has no update in %.1fs, fallback to fetch bars", timeout
+                )
+                return super().next()
+
+            closed = False
+            for key, candles in updates:
+                data = datas.get(key)
+                if data is None:
+                    continue
+                if data.on_candles(candles) and data is self.data:
+                    closed = True
+
+            # Wake up on tick or bar close of main DataFeed
+            if closed or self._tick > 0:
+                latency_probes.tick()
+                return
+
 
 class CCXTAccount(LiveAccount):
     """Account for CCXT"""
@@ -90,6 +195,7 @@ def let_ccxt(
     ccxt_secret: str,
     ccxt_type: Literal["spot", "margin", "future"] = "spot",
     ccxt_verbose: bool = False,
+    ccxt_stream: bool = False,
     feeder: type[CCXTDataFeeder] = CCXTDataFeeder,
     exchange: type[CCXTExchange] = CCXTExchange,
     account: type[CCXTAccount] = CCXTAccount,
@@ -111,6 +217,8 @@ def let_ccxt(
         ccxt_secret (str): _description_
         ccxt_type (Literal["spot", "margin", "future"], optional): _description_. Defaults to "spot".
         ccxt_verbose (bool, optional): _description_. Defaults to False.
+        ccxt_stream (bool, optional): Stream bars, orders and trades by `ccxt.pro`
+            websocket instead of REST polling. Defaults to False.
         feeder (Type[CCXTDataFeeder], optional): _description_. Defaults to CCXTDataFeeder.
         exchange (Type[CCXTExchange], optional): _description_. Defaults to CCXTExchange.
         account (Type[CCXTAccount], optional): _description_. Defaults to CCXTAccount.
@@ -132,6 +240,7 @@ def let_ccxt(
         secret=ccxt_secret,
         type=ccxt_type,
         verbose=ccxt_verbose,
+        stream=ccxt_stream,
     )
 
     return let_live(
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import queue
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHANNELS = ("ohlcv", "ticker", "orders", "my_trades", "balance")
+
+
+class CCXTStream:
+    """Stream updates from a `ccxt.pro` exchange.
+
+    Every subscription is a `watch_*` loop on an asyncio event loop running in a
+    background thread. Updates are queued by channel and consumed on the main
+    thread by `CCXTDataFeeder` and `CCXTAPI.next()`, so DataFeeds and exchange
+    event handlers are never touched from the stream thread.
+    """
+
+    _exchange: Any
+    _loop: asyncio.AbstractEventLoop | None
+    _thread: threading.Thread | None
+    _queues: dict[str, queue.Queue]
+
+    def __init__(
+        self,
+        exchange: Any,
+        reconnect_delay: float = 1.0,
+        reconnect_delay_max: float = 30.0,
+    ) -> None:
+        """_summary_
+
+        Args:
+            exchange (Any): `ccxt.pro` exchange instance
+            reconnect_delay (float, optional): Seconds to wait before first reconnect,
+                doubled on every consecutive error. Defaults to 1.0.
+            reconnect_delay_max (float, optional): Maximum seconds to wait before
+                reconnect. Defaults to 30.0.
+        """
+        self._exchange = exchange
+        self._reconnect_delay = reconnect_delay
+        self._reconnect_delay_max = reconnect_delay_max
+
+        self._loop = None
+        self._thread = None
+        self._tasks: dict[tuple, asyncio.Task] = dict()
+        self._subscriptions: set[tuple] = set()
+        self._queues = {channel: queue.Queue() for channel in STREAM_CHANNELS}
+
+    @property
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start event loop thread"""
+        if self._thread is not None:
+            return
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="CCXTStream",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Cancel all subscriptions, close exchange and stop event loop thread"""
+        if self._thread is None:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        try:
+            future.result(timeout=timeout)
+        except Exception as e:
+            logger.warning("Stream shutdown error: %s", e)
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=timeout)
+        self._loop.close()
+
+        self._thread = None
+        self._loop = None
+        self._subscriptions.clear()
+
+    def subscribe(self, channel: str, *args):
+        """Subscribe channel, call `watch_{channel}(*args)` until stop
+
+        Args:
+            channel (str): One of `STREAM_CHANNELS`
+            *args (list): Arguments of `watch_{channel}`, also key of updates
+
+        Raises:
+            RuntimeError: Stream is not started or channel is not supported
+        """
+        if self._loop is None:
+            raise RuntimeError("Stream is not started")
+        if channel not in self._queues:
+            raise RuntimeError(f"Stream channel {channel} is not supported")
+
+        key = (channel, *args)
+        if key in self._subscriptions:
+            return
+
+        self._subscriptions.add(key)
+        self._loop.call_soon_threadsafe(self._subscribe, key)
+
+    def get(
+        self,
+        channel: str,
+        block: bool = False,
+        timeout: float | None = None,
+    ) -> list[tuple[tuple, Any]]:
+        """Get all queued updates of channel
+
+        Args:
+            channel (str): _description_
+            block (bool, optional): Wait for first update. Defaults to False.
+            timeout (float | None, optional): Seconds to wait when block. Defaults to None.
+
+        Returns:
+            list[tuple[tuple, Any]]: list of `(args, payload)`
+        """
+        q = self._queues[channel]
+        updates = []
+        if block:
+            try:
+                updates.append(q.get(timeout=timeout))
+            except queue.Empty:
+                return updates
+
+        while True:
+            try:
+                updates.append(q.get_nowait())
+            except queue.Empty:
+                return updates
+
+    # Event loop thread
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _subscribe(self, key: tuple):
+        self._tasks[key] = self._loop.create_task(self._watch(key))
+
+    async def _watch(self, key: tuple):
+        channel, *args = key
+        watch = getattr(self._exchange, f"watch_{channel}")
+        delay = self._reconnect_delay
+
+        while True:
+            try:
+                payload = await watch(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Stream %s error: %s, reconnect in %.1fs", key, e, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._reconnect_delay_max)
+                continue
+
+            delay = self._reconnect_delay
+            self._queues[channel].put((tuple(args), payload))
+
+    async def _shutdown(self):
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        close = getattr(self._exchange, "close", None)
+        if close is not None:
+            await close()
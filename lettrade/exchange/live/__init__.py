@@ -4,7 +4,9 @@ from .account import LiveAccount
 from .api import LiveAPI
 from .data import LiveDataFeed
 from .error import LetLiveAPIUnauthorizedException, LetLiveOrderInvalidException
-from .exchange import LiveExchange
-from .feeder import LiveDataFeeder
+from .exchange import LiveExchange, LiveOrderResultPending
+from .feeder import AsyncLiveDataFeeder, LiveDataFeeder
+from .hub import LiveDataHub, LiveDataHubClient
 from .live import LetTradeLive, LetTradeLiveBot, let_live
+from .scheduler import RequestPriority, RequestScheduler, TokenBucket
 from .trade import LiveExecution, LiveOrder, LivePosition
@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from lettrade.account import Account
 
@@ -14,19 +15,48 @@ class LiveAccount(Account):
 
     _balance: float
     _equity: float
-
-    def __init__(self, api: LiveAPI, **kwargs) -> None:
+    _unrealized_pl: float | None
+    _refresh_delay: float | None
+    _refresh_timer: threading.Timer | None
+
+    _pl_estimate: bool = False
+    """Estimate PnL of open positions by `pl()` between account refreshes.
+    Only enable when `pl()` matches broker contract size, else PnL reported by
+    last account refresh is used"""
+
+    def __init__(
+        self,
+        api: LiveAPI,
+        refresh_delay: float | None = 1.0,
+        **kwargs,
+    ) -> None:
         """Account for live trading
 
+        Balance is updated from exited position events, equity is balance plus
+        PnL of open positions, reported by last account refresh or estimated by
+        `pl()` when `_pl_estimate` is enabled. Reported PnL includes positions
+        exited after the refresh, so `pl()` estimate is used until next refresh.
+        Account is fetched from API in background after position events, all
+        events within `refresh_delay` share one request.
+
         Args:
             api (LiveAPI): _description_
+            refresh_delay (float | None, optional): Seconds to wait before reconcile account
+                with API after position events, None to disable. Defaults to 1.0.
             **kwargs (dict, optional): Mirror of [lettrade.account.Account()](site:/reference/account/account/#lettrade.account.account.Account).
         """
         super().__init__(**kwargs)
         self._api = api
+        self._refresh_delay = refresh_delay
+        self._refresh_timer = None
+        self._refresh_lock = threading.Lock()
+        self._exited: set[str] = set()
 
         self._balance = 0.0
         self._equity = 0.0
+        self._unrealized_pl = 0.0
+        # Number of exit events, refresh reply fetched before latest exit is outdated
+        self._exit_count = 0
 
     # def __repr__(self):
     #     return "<LiveAccount " + str(self) + ">"
@@ -37,6 +67,13 @@ class LiveAccount(Account):
         self._margin = self._account.margin
         self._leverage = self._account.leverage
 
+    def stop(self):
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+        return super().stop()
+
     # def next(self):
     #     """Live account next"""
     #     self.account_refresh()
@@ -52,18 +89,77 @@ class LiveAccount(Account):
 
     def account_refresh(self):
         """Refresh account balance"""
-        self._account = self._api.account()
+        exit_count = self._exit_count
+        account = self._api.account()
 
         if __debug__:
-            logger.debug("Account: %s", str(self._account))
-
-        self._balance = self._account.balance
-        self._equity = self._account.equity
+            logger.debug("Account: %s", str(account))
+
+        with self._refresh_lock:
+            # Broker may not settle exits after request, keep balance of events
+            if exit_count != self._exit_count:
+                logger.info("Skip account refresh fetched before latest exit")
+                return
+
+            self._account = account
+            self._balance = account.balance
+            self._equity = account.equity
+            self._unrealized_pl = self._equity - self._balance
+
+    def account_refresh_later(self):
+        """Schedule a background `account_refresh()`, coalesce with scheduled one"""
+        if self._refresh_delay is None:
+            return
+
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                return
+
+            self._refresh_timer = threading.Timer(
+                self._refresh_delay,
+                self._account_refresh_timer,
+            )
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _account_refresh_timer(self):
+        # Events after this point schedule next refresh
+        with self._refresh_lock:
+            self._refresh_timer = None
+
+        try:
+            self.account_refresh()
+        except Exception as e:
+            logger.warning("Account refresh error: %s", e)
 
     def on_positions(self, positions: list[LivePosition]):
-        self.account_refresh()
+        with self._refresh_lock:
+            for position in positions:
+                if not position.is_exited or position.id in self._exited:
+                    continue
+
+                self._exited.add(position.id)
+                if position.exit_pl is not None:
+                    self._balance += position.pl
+                    self._exit_count += 1
+                    # Reported PnL still includes exited position
+                    self._unrealized_pl = None
+
+        # Forget ids dropped from exchange history, recall of them is not possible
+        if len(self._exited) > len(self._exchange.history_positions):
+            self._exited.intersection_update(self._exchange.history_positions.keys())
+
+        self.account_refresh_later()
         return super().on_positions(positions)
 
     @property
     def equity(self) -> float:
-        return self._equity
+        equity = self._balance
+        if len(self._exchange.positions) > 0:
+            if self._pl_estimate or self._unrealized_pl is None:
+                equity += sum(
+                    position.pl for position in self._exchange.positions.values()
+                )
+            else:
+                equity += self._unrealized_pl
+        return equity
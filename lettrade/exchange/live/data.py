@@ -1,12 +1,18 @@
 import logging
+import os
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from lettrade.data import DataFeed
+from lettrade.utils.latency import latency_probes
 
 from .api import LiveAPI
 
+if TYPE_CHECKING:
+    from .hub import LiveDataHubClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,6 +76,14 @@ class LiveDataFeed(DataFeed):
     def _api(self, value) -> LiveAPI:
         object.__setattr__(self, "__api", value)
 
+    @property
+    def _hub(self) -> "LiveDataHubClient | None":
+        return getattr(self, "__hub", None)
+
+    @_hub.setter
+    def _hub(self, value) -> None:
+        object.__setattr__(self, "__hub", value)
+
     # Functions
     def symbol_info(self):
         """Get symbol information from API"""
@@ -78,21 +92,31 @@ class LiveDataFeed(DataFeed):
     def copy(self, deep: bool = False, **kwargs) -> DataFeed:
         return super().copy(deep, symbol=self.symbol, **kwargs)
 
-    def next(self, size=1) -> bool:
+    def next(self, size=1, limit: int = 1_000) -> bool:
         """Drop extra columns and load next DataFeed
 
         Args:
             size (int, optional): _description_. Defaults to 1.
+            limit (int, optional): Maximum bars to request when catching up
+                since last bar. Defaults to 1_000.
 
         Returns:
-            bool: _description_
+            bool: False if new bars are not continuous with existed bars
         """
         # Drop existed extra columns to skip reusing calculated data
         self.drop(columns=self.columns.difference(self._base_columns), inplace=True)
 
-        self.bars_load(since=0, to=size + 1)
+        length = len(self)
+        if self.empty:
+            ok = self.bars_load(since=0, to=size + 1)
+        else:
+            ok = self.bars_load_since_last(size=size, limit=limit)
         self.l.go_stop()
-        return True
+
+        # Only rewrite cache when new bars are appended
+        if self.meta.get("cache") is not None and len(self) > length:
+            self.cache_save()
+        return ok
 
     def bars_load(
         self,
@@ -109,7 +133,39 @@ class LiveDataFeed(DataFeed):
             bool: True if has data, False if no data
         """
         bars = self.bars(since=since, to=to)
+        return self._bars_push(bars, since=since)
+
+    def bars_load_since_last(self, size: int = 1, limit: int = 1_000) -> bool:
+        """Get bars since last bar of DataFeed, request size grows until
+        fetched bars are continuous with last bar
 
+        Args:
+            size (int, optional): First request size. Defaults to 1.
+            limit (int, optional): Maximum request size. Defaults to 1_000.
+
+        Returns:
+            bool: True if continuous, False if there are missing bars or no data
+        """
+        expect = self.now + self.timeframe.delta
+        while True:
+            bars = self.bars(since=0, to=size + 1)
+            if bars is None or len(bars) == 0:
+                break
+
+            first = pd.to_datetime(bars[0][0], unit=self._bar_datetime_unit, utc=True)
+            if first <= expect or size >= limit:
+                break
+            size = min(size * 4, limit)
+
+        if not self._bars_push(bars, since=0):
+            return False
+
+        if first > expect:
+            logger.warning("[%s] Missing bars from %s to %s", self.name, expect, first)
+            return False
+        return True
+
+    def _bars_push(self, bars: list, since: int | str | pd.Timestamp) -> bool:
         if bars is None or len(bars) == 0:
             logger.warning("No bars data for %s", self.name)
             return False
@@ -139,12 +195,74 @@ class LiveDataFeed(DataFeed):
         Returns:
             list: list of bar
         """
-        return self._api.bars(
-            symbol=self.symbol,
-            timeframe=self.timeframe.string,
-            since=since,
-            to=to,
-        )
+        # Shared market data hub serves bars instead of API
+        source = self._hub or self._api
+        with latency_probes.measure("bars_load"):
+            return source.bars(
+                symbol=self.symbol,
+                timeframe=self.timeframe.string,
+                since=since,
+                to=to,
+            )
+
+    # Cache
+    def cache_path(self, cache: str | None = None) -> str:
+        """Path of bars cache file
+
+        Args:
+            cache (str | None, optional): Cache directory. Defaults to None, `meta["cache"]`.
+
+        Returns:
+            str: _description_
+        """
+        return os.path.join(cache or self.meta["cache"], f"{self.name}.pkl")
+
+    def cache_load(self, cache: str | None = None) -> bool:
+        """Warm start DataFeed by cached bars
+
+        Args:
+            cache (str | None, optional): Cache directory. Defaults to None, `meta["cache"]`.
+
+        Returns:
+            bool: True if cache is loaded
+        """
+        path = self.cache_path(cache)
+        if not os.path.exists(path):
+            return False
+
+        try:
+            df = pd.read_pickle(path)
+        except Exception as e:
+            logger.warning("[%s] Cannot load bars cache %s: %s", self.name, path, e)
+            return False
+
+        if not self.empty or df.empty or list(df.columns) != list(self._base_columns):
+            return False
+
+        self._push_frame(df)
+        self.l.go_stop()
+
+        if __debug__:
+            logger.info("[%s] Loaded %d bars from cache %s", self.name, len(df), path)
+        return True
+
+    def cache_save(self, cache: str | None = None, size: int | None = None):
+        """Save last closed bars to cache
+
+        Args:
+            cache (str | None, optional): Cache directory. Defaults to None, `meta["cache"]`.
+            size (int | None, optional): Number of last bars. Defaults to None, `meta["cache_size"]`.
+        """
+        if size is None:
+            size = self.meta.get("cache_size", 1_000)
+
+        path = self.cache_path(cache)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write then rename, never leave a broken cache
+        df = pd.DataFrame(self[self._base_columns]).tail(size)
+        df.to_pickle(f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
 
     ### Extend
     def dump_csv(
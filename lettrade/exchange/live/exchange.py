@@ -1,7 +1,18 @@
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from lettrade.data import DataFeed
-from lettrade.exchange import Exchange, OrderResult, OrderType, PositionState
+from lettrade.exchange import (
+    Exchange,
+    OrderResult,
+    OrderResultError,
+    OrderType,
+    PositionState,
+)
+from lettrade.utils.latency import LatencyHistogram, latency_probes
 
 from .api import LiveAPI
 from .trade import LiveExecution, LiveOrder, LivePosition
@@ -9,6 +20,41 @@ from .trade import LiveExecution, LiveOrder, LivePosition
 logger = logging.getLogger(__name__)
 
 
+class LiveOrderResultPending(OrderResult):
+    """Result of an `Order` still waiting for broker answer.
+
+    Returned by `LiveExchange.new_order()` in asynchronous orders mode.
+    """
+
+    def __init__(self, order: LiveOrder, future: Future) -> None:
+        """_summary_
+
+        Args:
+            order (LiveOrder): Order own the result
+            future (Future): Future of final `OrderResult`
+        """
+        super().__init__(ok=True, order=order)
+        self.future: Future = future
+
+    def done(self) -> bool:
+        """Broker answered"""
+        return self.future.done()
+
+    def result(self, timeout: float | None = None) -> OrderResult:
+        """Wait for final result of order
+
+        Args:
+            timeout (float | None, optional): _description_. Defaults to None.
+
+        Returns:
+            OrderResult: `OrderResultOk` or `OrderResultError`
+        """
+        return self.future.result(timeout=timeout)
+
+    def _repr_params(self):
+        return f"done={self.done()} {super()._repr_params()}"
+
+
 class LiveExchange(Exchange):
     """MetaTrade 5 exchange module for `lettrade`"""
 
@@ -18,26 +64,72 @@ class LiveExchange(Exchange):
 
     _api: LiveAPI
 
-    def __init__(self, api: LiveAPI, *args, **kwargs):
+    _orders_window: int
+    _orders_executor: ThreadPoolExecutor | None
+    _orders_semaphore: threading.BoundedSemaphore | None
+    _events: queue.SimpleQueue
+    _thread_id: int | None
+    order_latency: LatencyHistogram
+    """Latency of order placement, from sending to broker answer"""
+
+    def __init__(
+        self,
+        api: LiveAPI,
+        *args,
+        orders_async: bool | int = False,
+        **kwargs,
+    ):
         """_summary_
 
         Args:
             api (LiveAPI): API connect to rpyc MeTrader 5 Terminal server through module `mt5linux`
+            orders_async (bool | int, optional): Place orders in background, `new_order()`
+                return `LiveOrderResultPending` immediately. Set int as maximum in-flight
+                orders, `True` is 8. Defaults to False.
             *args (list): `Exchange` list parameters
             **kwargs (dict): `Exchange` dict parameters
         """
         super().__init__(*args, **kwargs)
         self._api = api
 
+        if orders_async is True:
+            orders_async = 8
+        self._orders_window = int(orders_async)
+        self._orders_executor = None
+        self._orders_semaphore = None
+        self._events = queue.SimpleQueue()
+        self._thread_id = None
+        self.order_latency = LatencyHistogram(name="order_place")
+
     def start(self) -> None:
         """Start Live exchange by: Sync positions from server"""
+        self._thread_id = threading.get_ident()
+        if self._orders_window > 0:
+            self._orders_executor = ThreadPoolExecutor(
+                max_workers=self._orders_window,
+                thread_name_prefix="LiveExchangeOrder",
+            )
+            self._orders_semaphore = threading.BoundedSemaphore(self._orders_window)
+
         self._api.start(exchange=self)
         return super().start()
 
     def next(self) -> None:
+        self._events_flush()
         self._api.next()
         return super().next()
 
+    def next_next(self) -> None:
+        self._events_flush()
+        return super().next_next()
+
+    def stop(self) -> None:
+        if self._orders_executor is not None:
+            self._orders_executor.shutdown(wait=True)
+            self._orders_executor = None
+        self._events_flush()
+        return super().stop()
+
     def new_order(
         self,
         size: float,
@@ -85,13 +177,88 @@ class LiveExchange(Exchange):
             tag=tag,
             **kwargs,
         )
-        ok = order.place()
+        if self._orders_executor is not None:
+            return self._order_place_async(order)
+
+        with latency_probes.measure("new_order"):
+            ok = self._order_place(order)
 
         if __debug__:
             logger.info("New order %s at %s", order, data.now)
 
         return ok
 
+    def _order_place(self, order: LiveOrder) -> OrderResult:
+        start = time.perf_counter()
+        try:
+            return order.place()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.order_latency.record(elapsed)
+            latency_probes.record("order_open", elapsed)
+            latency_probes.since_tick("tick_to_order")
+
+    def _order_place_async(self, order: LiveOrder) -> LiveOrderResultPending:
+        # Block strategy when in-flight window is full
+        self._orders_semaphore.acquire()
+        try:
+            future = self._orders_executor.submit(self._order_place_worker, order)
+        except BaseException:
+            self._orders_semaphore.release()
+            raise
+
+        if __debug__:
+            logger.info("New async order %s at %s", order, order.data.now)
+
+        return LiveOrderResultPending(order=order, future=future)
+
+    def _order_place_worker(self, order: LiveOrder) -> OrderResult:
+        try:
+            return self._order_place(order)
+        except Exception as e:
+            logger.exception("Place order %s", order)
+            error = OrderResultError(error=str(e), order=order)
+            self.on_notify(error=error)
+            return error
+        finally:
+            self._orders_semaphore.release()
+
+    # Events from order workers are handled in exchange thread
+    def _events_defer(self, handler, *args, **kwargs) -> bool:
+        if self._thread_id is None or threading.get_ident() == self._thread_id:
+            return False
+
+        self._events.put((handler, args, kwargs))
+        return True
+
+    def _events_flush(self):
+        while True:
+            try:
+                handler, args, kwargs = self._events.get_nowait()
+            except queue.Empty:
+                return
+            handler(*args, **kwargs)
+
+    def on_executions(self, executions, broadcast: bool | None = True, **kwargs):
+        if self._events_defer(self.on_executions, executions, broadcast, **kwargs):
+            return
+        return super().on_executions(executions, broadcast=broadcast, **kwargs)
+
+    def on_orders(self, orders, broadcast: bool | None = True, **kwargs):
+        if self._events_defer(self.on_orders, orders, broadcast, **kwargs):
+            return
+        return super().on_orders(orders, broadcast=broadcast, **kwargs)
+
+    def on_positions(self, positions, broadcast: bool | None = True, **kwargs):
+        if self._events_defer(self.on_positions, positions, broadcast, **kwargs):
+            return
+        return super().on_positions(positions, broadcast=broadcast, **kwargs)
+
+    def on_notify(self, *args, **kwargs):
+        if self._events_defer(self.on_notify, *args, **kwargs):
+            return
+        return super().on_notify(*args, **kwargs)
+
     # Events
     def on_executions_event(self, raws, broadcast: bool | None = True):
         if __debug__:
@@ -106,6 +273,8 @@ class LiveExchange(Exchange):
         if __debug__:
             logger.debug("Raw orders new: %s, old: %s", new, old)
 
+        latency_probes.since_tick("tick_to_orders_event")
+
         if new is None:
             new = []
         if old is None:
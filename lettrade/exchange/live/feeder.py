@@ -1,10 +1,18 @@
+import asyncio
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Callable
 
 from lettrade.data import DataFeeder, TimeFrame
+from lettrade.utils.latency import latency_probes
 
 from .api import LiveAPI
 from .data import LiveDataFeed
+from .hub import LiveDataHubClient
+
+logger = logging.getLogger(__name__)
 
 
 class LiveDataFeeder(DataFeeder):
@@ -17,6 +25,7 @@ class LiveDataFeeder(DataFeeder):
     data: LiveDataFeed
 
     _api: LiveAPI
+    _hub: LiveDataHubClient | None
     _tick: bool
     _start_size: int
     _config: dict
@@ -28,6 +37,8 @@ class LiveDataFeeder(DataFeeder):
         tick: bool = 5,
         start_size: int = 500,
         api_kwargs: dict | None = None,
+        hub: LiveDataHubClient | dict | None = None,
+        cache: str | None = None,
         **kwargs,
     ) -> None:
         """
@@ -35,9 +46,21 @@ class LiveDataFeeder(DataFeeder):
             tick < 0: no tick, just get completed bar
             tick == 0: wait until new bar change value
             tick > 0: sleep tick time (in seconds) then update
+        hub:
+            `LiveDataHubClient` or its config, DataFeeds get bars from shared
+            `LiveDataHub` instead of API
+        cache:
+            Directory to persist received bars, DataFeeds warm start from it and
+            only request bars since last cached bar
         """
         super().__init__()
 
+        self._cache = cache
+
+        if isinstance(hub, dict):
+            hub = LiveDataHubClient(**hub)
+        self._hub = hub
+
         # API init
         if api is None:
             if api_kwargs is None:
@@ -49,11 +72,18 @@ class LiveDataFeeder(DataFeeder):
         self._start_size = start_size
         self._config = kwargs
 
-        if isinstance(self._tick, int):
+        if isinstance(self._tick, int) and self._tick > 0:
             self._wait_timeframe = TimeFrame(f"{self._tick}s")
         else:
             self._wait_timeframe = None
 
+    def init(self, datas: list[LiveDataFeed], **kwargs):
+        super().init(datas, **kwargs)
+
+        if self._hub is not None:
+            for data in self.datas:
+                data._hub = self._hub
+
     def alive(self):
         return self._api.heartbeat()
 
@@ -62,7 +92,23 @@ class LiveDataFeeder(DataFeeder):
             size = self._start_size
 
         for data in self.datas:
+            self._data_start(data, size=size)
+
+    def _data_start(self, data: LiveDataFeed, size: int):
+        if self._cache is None:
             data.next(size=size)
+            return
+
+        data.meta.update(cache=self._cache, cache_size=size)
+        if data.cache_load():
+            # Only request bars since last cached bar
+            if data.next(size=1, limit=size):
+                return
+
+            logger.warning("[%s] Bars cache is outdated, reload", data.name)
+            data.drop(index=data.index, inplace=True)
+
+        data.next(size=size)
 
     def next(self):
         if self._tick > 0:
@@ -70,6 +116,7 @@ class LiveDataFeeder(DataFeeder):
             if wait_seconds > 0:
                 time.sleep(wait_seconds)
 
+        latency_probes.tick()
         for data in self.datas:
             data.next()
 
@@ -119,3 +166,129 @@ class LiveDataFeeder(DataFeeder):
     #         api = cls._api_cls(**api_kwargs)
     #     obj = cls(api=api, **kwargs)
     #     return obj
+
+
+class AsyncLiveDataFeeder(LiveDataFeeder):
+    """LiveDataFeeder driven by an asyncio event loop.
+
+    Wake up on bar close of main DataFeed (or tick when `tick > 0`) instead of
+    sleep polling, then fetch all needed DataFeeds concurrently.
+    """
+
+    _loop: asyncio.AbstractEventLoop | None
+    _executor: ThreadPoolExecutor | None
+
+    def __init__(
+        self,
+        api: LiveAPI | None = None,
+        tick: bool = 5,
+        start_size: int = 500,
+        api_kwargs: dict | None = None,
+        workers: int | None = None,
+        delay: float = 0.0,
+        **kwargs,
+    ) -> None:
+        """_summary_
+
+        Args:
+            api (LiveAPI | None, optional): _description_. Defaults to None.
+            tick (bool, optional): tick <= 0: wake up on bar close of main DataFeed,
+                tick > 0: wake up on tick (in seconds) or bar close. Defaults to 5.
+            start_size (int, optional): _description_. Defaults to 500.
+            api_kwargs (dict | None, optional): _description_. Defaults to None.
+            workers (int | None, optional): Number of concurrent `LiveAPI.bars()` requests.
+                Defaults to None, one per DataFeed.
+            delay (float, optional): Seconds to wait after bar close, let broker finalize bar.
+                Defaults to 0.0.
+        """
+        super().__init__(
+            api=api,
+            tick=tick,
+            start_size=start_size,
+            api_kwargs=api_kwargs,
+            **kwargs,
+        )
+        self._workers = workers
+        self._delay = delay
+        self._loop = None
+        self._executor = None
+
+    def start(self, size: int = 0):
+        if not size:
+            size = self._start_size
+
+        self._loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers or len(self.datas),
+            thread_name_prefix="LiveDataFeeder",
+        )
+        self._loop.run_until_complete(
+            self._fetch(self.datas, size=size, function=self._data_start)
+        )
+
+    def next(self):
+        self._loop.run_until_complete(self._next())
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    async def _next(self):
+        wakeup = self._wakeup_at()
+        seconds = (wakeup - datetime.now(tz=timezone.utc)).total_seconds()
+        seconds += self._delay
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+        latency_probes.tick()
+        await self._fetch(self._needed_datas())
+
+    async def _fetch(
+        self,
+        datas: list[LiveDataFeed],
+        size: int = 1,
+        function: Callable | None = None,
+    ):
+        if function is None:
+            calls = [(data.next, size) for data in datas]
+        else:
+            calls = [(function, data, size) for data in datas]
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(self._loop.run_in_executor(self._executor, *call) for call in calls)
+        )
+
+        if __debug__:
+            logger.debug(
+                "Fetched %d DataFeeds in %.3fs",
+                len(datas),
+                time.perf_counter() - start,
+            )
+
+    def _wakeup_at(self) -> datetime:
+        now = datetime.now(tz=timezone.utc)
+        wakeup = self._bar_close(self.data)
+        if self._tick > 0:
+            wakeup = min(wakeup, self._wait_timeframe.ceil(now))
+        return max(wakeup, now)
+
+    def _needed_datas(self) -> list[LiveDataFeed]:
+        if self._tick > 0:
+            return self.datas
+
+        # Only DataFeeds have new closed bar
+        now = datetime.now(tz=timezone.utc)
+        return [
+            data
+            for data in self.datas
+            if data is self.data or now >= self._bar_close(data)
+        ]
+
+    def _bar_close(self, data: LiveDataFeed) -> datetime:
+        # `data.now` is last closed bar, building bar closes after 2 timeframes
+        return data.now + 2 * data.timeframe.delta
@@ -0,0 +1,294 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any
+
+from .api import LiveAPI
+
+logger = logging.getLogger(__name__)
+
+
+class LiveDataHub:
+    """Market data hub, share one `LiveAPI` connection with many bot processes.
+
+    Bars requests of all bots go through a local socket to the hub. Requests of
+    the same symbol/timeframe are coalesced, and answered from cache while it is
+    fresher than `ttl`, so broker load stays flat as bots are added.
+    """
+
+    _api: LiveAPI
+    _listener: Listener | None
+
+    def __init__(
+        self,
+        api: LiveAPI,
+        address: tuple[str, int] | str = ("127.0.0.1", 0),
+        authkey: bytes | None = None,
+        ttl: float = 1.0,
+    ) -> None:
+        """_summary_
+
+        Args:
+            api (LiveAPI): API owns exchange connection
+            address (tuple[str, int] | str, optional): Listen address, port 0 to pick
+                a free port. Defaults to ("127.0.0.1", 0).
+            authkey (bytes | None, optional): Authentication key of clients.
+                Defaults to None, generate random key.
+            ttl (float, optional): Seconds cached bars are reused. Defaults to 1.0.
+        """
+        self._api = api
+        self._address = address
+        self._authkey = authkey or os.urandom(16)
+        self._ttl = ttl
+
+        self._listener = None
+        self._cache: dict[tuple[str, str], tuple[float, int, list]] = dict()
+        self._locks: dict[tuple[str, str], threading.Lock] = dict()
+        self._locks_lock = threading.Lock()
+
+        self.fetched = 0
+        """Number of requests sent to broker"""
+        self.requested = 0
+        """Number of requests received from clients"""
+
+    @property
+    def address(self) -> tuple[str, int] | str:
+        if self._listener is not None:
+            return self._listener.address
+        return self._address
+
+    @property
+    def config(self) -> dict:
+        """Config to connect `LiveDataHubClient`"""
+        return dict(address=self.address, authkey=self._authkey)
+
+    def start(self):
+        """Listen and serve clients in background threads"""
+        self._listener = Listener(self._address, authkey=self._authkey)
+        threading.Thread(
+            target=self._accept,
+            name="LiveDataHub",
+            daemon=True,
+        ).start()
+
+        logger.info("LiveDataHub listening on %s", self.address)
+
+    def stop(self):
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    # Server
+    def _accept(self):
+        while self._listener is not None:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError) as e:
+                if self._listener is not None:
+                    logger.warning("LiveDataHub accept error: %s", e)
+                return
+
+            threading.Thread(
+                target=self._serve,
+                args=(conn,),
+                name="LiveDataHubConnection",
+                daemon=True,
+            ).start()
+
+    def _serve(self, conn: Connection):
+        with conn:
+            while True:
+                try:
+                    method, kwargs = conn.recv()
+                except (EOFError, OSError):
+                    return
+
+                try:
+                    match method:
+                        case "bars":
+                            result = self.bars(**kwargs)
+                        case "heartbeat":
+                            result = self._api.heartbeat()
+                        case _:
+                            raise RuntimeError(f"Method {method} is not supported")
+                    conn.send((True, result))
+                except Exception as e:
+                    logger.exception("LiveDataHub %s(%s) error", method, kwargs)
+                    conn.send((False, e))
+
+    def bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: int | datetime | None = 0,
+        to: int | datetime | None = 1_000,
+    ) -> list[list]:
+        """Get bars from cache or `LiveAPI`, one broker request at a time per symbol/timeframe
+
+        Args:
+            symbol (str): _description_
+            timeframe (str): _description_
+            since (int | datetime | None, optional): _description_. Defaults to 0.
+            to (int | datetime | None, optional): _description_. Defaults to 1_000.
+
+        Returns:
+            list[list]: _description_
+        """
+        self.requested += 1
+
+        # Only latest bars requests are cacheable
+        if since != 0 or not isinstance(to, int):
+            self.fetched += 1
+            return self._api.bars(
+                symbol=symbol, timeframe=timeframe, since=since, to=to
+            )
+
+        key = (symbol, timeframe)
+        with self._lock(key):
+            cached = self._cache.get(key)
+            if cached is not None:
+                fetched_at, size, bars = cached
+                if size >= to and time.monotonic() - fetched_at < self._ttl:
+                    return bars[-to:]
+
+            bars = self._api.bars(symbol=symbol, timeframe=timeframe, since=0, to=to)
+            self.fetched += 1
+            if bars is not None:
+                self._cache[key] = (time.monotonic(), to, list(bars))
+            return bars
+
+    def _lock(self, key: tuple[str, str]) -> threading.Lock:
+        with self._locks_lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    # Process
+    @classmethod
+    def process(
+        cls,
+        api: type[LiveAPI],
+        api_kwargs: dict | None = None,
+        **kwargs,
+    ) -> tuple[multiprocessing.Process, dict]:
+        """Start hub in a new process
+
+        Args:
+            api (type[LiveAPI]): API class, initialized inside hub process
+            api_kwargs (dict | None, optional): Parameters of API. Defaults to None.
+            **kwargs (dict): Parameters of `LiveDataHub`
+
+        Returns:
+            tuple[multiprocessing.Process, dict]: Hub process and config of `LiveDataHubClient`
+        """
+        kwargs.setdefault("authkey", os.urandom(16))
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_hub_run,
+            args=(writer, api, api_kwargs or {}),
+            kwargs=kwargs,
+            name="LiveDataHub",
+            daemon=True,
+        )
+        process.start()
+        writer.close()
+
+        config = reader.recv()
+        if isinstance(config, Exception):
+            raise RuntimeError("LiveDataHub start failed") from config
+        return process, config
+
+
+def _hub_run(writer: Connection, api: type[LiveAPI], api_kwargs: dict, **kwargs):
+    try:
+        api = api(**api_kwargs)
+        api.init()
+
+        hub = LiveDataHub(api=api, **kwargs)
+        hub.start()
+    except Exception as e:
+        writer.send(e)
+        raise
+
+    writer.send(hub.config)
+    writer.close()
+
+    try:
+        while True:
+            time.sleep(60)
+    finally:
+        hub.stop()
+        api.stop()
+
+
+class LiveDataHubClient:
+    """Client of `LiveDataHub`, serve `bars()` for `LiveDataFeed`.
+
+    Pickle-able, each process and thread connect to hub by its own connection.
+    """
+
+    def __init__(self, address: tuple[str, int] | str, authkey: bytes) -> None:
+        """_summary_
+
+        Args:
+            address (tuple[str, int] | str): Address of hub
+            authkey (bytes): Authentication key of hub
+        """
+        self._address = address
+        self._authkey = authkey
+        self._local = threading.local()
+
+    def __getstate__(self):
+        return dict(address=self._address, authkey=self._authkey)
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def _conn(self) -> Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = Client(self._address, authkey=self._authkey)
+        return conn
+
+    def _request(self, method: str, **kwargs) -> Any:
+        conn = self._conn
+        try:
+            conn.send((method, kwargs))
+            ok, result = conn.recv()
+        except (EOFError, OSError):
+            self._local.conn = None
+            raise
+
+        if not ok:
+            raise result
+        return result
+
+    def heartbeat(self) -> bool:
+        return self._request("heartbeat")
+
+    def bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: int | datetime | None = 0,
+        to: int | datetime | None = 1_000,
+    ) -> list[list]:
+        return self._request(
+            "bars",
+            symbol=symbol,
+            timeframe=timeframe,
+            since=since,
+            to=to,
+        )
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
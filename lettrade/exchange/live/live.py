@@ -1,8 +1,13 @@
+import multiprocessing
+
 from lettrade import BotStatistic, Commander, LetTrade, LetTradeBot, Plotter
+from lettrade.indicator.plot import indicator_plot_enable, indicator_plot_enabled
 from lettrade.strategy.strategy import Strategy
+from lettrade.utils.latency import latency_probes
 
 from .api import LiveAPI
 from .data import LiveDataFeed
+from .hub import LiveDataHub
 
 
 class LetTradeLiveBot(LetTradeBot):
@@ -11,6 +16,7 @@ class LetTradeLiveBot(LetTradeBot):
     datas: list[LiveDataFeed]
 
     _api: LiveAPI = None
+    _plot_enabled: bool = True
 
     def __init__(self, api: LiveAPI | None = LiveAPI, **kwargs) -> None:
         """_summary_
@@ -33,27 +39,93 @@ class LetTradeLiveBot(LetTradeBot):
             data._api = self._api
 
     def init(self):
+        # Headless bot, skip indicator plotters on every tick until stopped
+        self._plot_enabled = indicator_plot_enabled()
+        if not self._plotter_cls:
+            indicator_plot_enable(False)
+
         self._api.init()
         super().init()
 
+        # Export latency of pipeline stages by log line or metrics endpoint
+        probes_kwargs = self._kwargs.get("probes_kwargs")
+        if probes_kwargs:
+            latency_probes.start(**probes_kwargs)
+
+    def run(self):
+        try:
+            return super().run()
+        finally:
+            latency_probes.stop()
+            indicator_plot_enable(self._plot_enabled)
+
+    def stop(self):
+        super().stop()
+        latency_probes.stop()
+        indicator_plot_enable(self._plot_enabled)
+
 
 class LetTradeLive(LetTrade):
     """Help to maintain live bots"""
 
     _data_cls: type[LiveDataFeed] = LiveDataFeed
 
+    _hub: bool | dict
+    _hub_process: multiprocessing.Process | None = None
+
+    def __init__(self, *args, hub: bool | dict = False, **kwargs) -> None:
+        """_summary_
+
+        Args:
+            hub (bool | dict, optional): When running multiple bots, start a `LiveDataHub`
+                process to fetch bars once for all bots. Pass dict as `LiveDataHub`
+                parameters. Defaults to False.
+        """
+        super().__init__(*args, **kwargs)
+        self._hub = hub
+
+    def run(self, *args, **kwargs):
+        try:
+            return super().run(*args, **kwargs)
+        finally:
+            self._hub_stop()
+
     def _multiprocess(self, **kwargs):
         # Impletement api dependencies and save to api_kwargs
         api: type[LiveAPI] = self._kwargs.get("api")
         api_kwargs = self._kwargs.setdefault("api_kwargs", {})
 
         api_cls = api if issubclass(api, LiveAPI) else api.__class__
+
+        # Hub owns its own connection, start before sharing api across processes
+        if self._hub:
+            self._hub_start(api_cls, dict(api_kwargs))
+
         api_cls.multiprocess(kwargs=api_kwargs)
 
         super()._multiprocess(**kwargs)
 
+    def _hub_start(self, api_cls: type[LiveAPI], api_kwargs: dict):
+        hub_kwargs = self._hub if isinstance(self._hub, dict) else {}
+        self._hub_process, config = LiveDataHub.process(
+            api=api_cls,
+            api_kwargs=api_kwargs,
+            **hub_kwargs,
+        )
+        self._kwargs.setdefault("feeder_kwargs", dict()).update(hub=config)
+
+    def _hub_stop(self):
+        if self._hub_process is None:
+            return
+
+        self._hub_process.terminate()
+        self._hub_process.join()
+        self._hub_process = None
+        self._kwargs.get("feeder_kwargs", {}).pop("hub", None)
+
+    @classmethod
     def _datafeed(
-        self,
+        cls,
         data: LiveDataFeed | list | set | tuple,
         **kwargs,
     ) -> LiveDataFeed:
@@ -63,18 +135,18 @@ class LetTradeLive(LetTrade):
             symbol, timeframe = data[0], data[1]
             name = data[2] if len(data) > 2 else None
 
-            data = self._data_cls(
+            data = cls._data_cls(
                 name=name,
                 symbol=symbol,
                 timeframe=timeframe,
             )
         elif isinstance(data, dict):
-            data = self._data_cls(
+            data = cls._data_cls(
                 symbol=data.get("symbol"),
                 timeframe=data.get("timeframe"),
                 name=data.get("name", None),
             )
-        elif isinstance(data, self._data_cls):
+        elif isinstance(data, cls._data_cls):
             pass
         else:
             return RuntimeError(f"Data {data} is not support yet")
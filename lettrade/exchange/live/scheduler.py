@@ -0,0 +1,277 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future
+from enum import Enum
+from multiprocessing.managers import BaseManager
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(int, Enum):
+    """Priority of API request"""
+
+    High = 0
+    """Order placement, modification and close"""
+    Normal = 1
+    """Account and position requests"""
+    Low = 2
+    """Market data requests, bar fetches"""
+
+
+def backoff_jitter(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with jitter, so retrying processes do not wake up together
+
+    Args:
+        attempt (int): Number of failed attempts, start from 0
+        base (float, optional): Seconds of first backoff. Defaults to 0.5.
+        cap (float, optional): Maximum seconds of backoff. Defaults to 30.0.
+
+    Returns:
+        float: Seconds to sleep
+    """
+    delay = min(cap, base * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class TokenBucket:
+    """Token bucket rate limiter.
+
+    Share across processes by `RequestScheduler.multiprocess()`, every call
+    is short and never blocks, caller sleeps for returned wait time.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        capacity: float | None = None,
+        reserve: float = 1.0,
+    ) -> None:
+        """_summary_
+
+        Args:
+            rate (float, optional): Tokens refilled per second. Defaults to 10.0.
+            capacity (float | None, optional): Maximum burst tokens. Defaults to None, equal `rate`.
+            reserve (float, optional): Tokens only `RequestPriority.High` requests can take.
+                Defaults to 1.0.
+        """
+        self._rate = rate
+        self._capacity = capacity or rate
+        self._reserve = min(reserve, self._capacity - 1)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(
+        self, tokens: float = 1.0, priority: int = RequestPriority.Normal
+    ) -> float:
+        """Take tokens from bucket
+
+        Args:
+            tokens (float, optional): _description_. Defaults to 1.0.
+            priority (int, optional): _description_. Defaults to RequestPriority.Normal.
+
+        Returns:
+            float: 0 if tokens are taken, else seconds to wait before retry
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated_at) * self._rate,
+            )
+            self._updated_at = now
+
+            # Lower priority requests leave reserved tokens for orders
+            floor = 0.0 if priority <= RequestPriority.High else self._reserve
+            available = self._tokens - floor
+            if available >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - available) / self._rate
+
+    def tokens(self) -> float:
+        with self._lock:
+            return self._tokens
+
+
+class RequestScheduler:
+    """Schedule live API requests.
+
+    - Rate limit by a `TokenBucket`, shared across processes when run by
+        `RequestScheduler.multiprocess()`
+    - Higher priority requests take reserved tokens and skip the wait queue
+    - Duplicate in-flight requests of the same key share one result
+    - Retry with exponential backoff and jitter
+    """
+
+    _bucket: TokenBucket
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        capacity: float | None = None,
+        reserve: float = 1.0,
+        retry: int = 3,
+        backoff: float = 0.5,
+        backoff_max: float = 30.0,
+        bucket: TokenBucket | None = None,
+    ) -> None:
+        """_summary_
+
+        Args:
+            rate (float, optional): Requests per second. Defaults to 10.0.
+            capacity (float | None, optional): Maximum burst requests. Defaults to None.
+            reserve (float, optional): Tokens reserved for `RequestPriority.High`. Defaults to 1.0.
+            retry (int, optional): Number of attempts of a request. Defaults to 3.
+            backoff (float, optional): Seconds of first backoff. Defaults to 0.5.
+            backoff_max (float, optional): Maximum seconds of backoff. Defaults to 30.0.
+            bucket (TokenBucket | None, optional): Shared bucket, or proxy of it.
+                Defaults to None, new bucket of this process.
+        """
+        self._parameters = dict(
+            rate=rate,
+            capacity=capacity,
+            reserve=reserve,
+            retry=retry,
+            backoff=backoff,
+            backoff_max=backoff_max,
+        )
+        # Proxy of shared bucket is picklable, keep it to share with other processes
+        if bucket is not None and not isinstance(bucket, TokenBucket):
+            self._parameters["bucket"] = bucket
+
+        if bucket is None:
+            bucket = TokenBucket(rate=rate, capacity=capacity, reserve=reserve)
+
+        self._bucket = bucket
+        self._retry = retry
+        self._backoff = backoff
+        self._backoff_max = backoff_max
+
+        self._inflight: dict[Hashable, Future] = dict()
+        self._lock = threading.Lock()
+        # Number of waiting requests by priority
+        self._waiting = [0] * len(RequestPriority)
+
+    def parameters(self) -> dict:
+        """Constructor parameters to create the same scheduler in other processes
+
+        Returns:
+            dict: _description_
+        """
+        return dict(self._parameters)
+
+    @classmethod
+    def multiprocess(cls, kwargs: dict, **other_kwargs):
+        """Share one `TokenBucket` with all processes, save proxy to `kwargs["bucket"]`"""
+        if "bucket" in kwargs:
+            return
+
+        BaseManager.register("TokenBucket", TokenBucket)
+        manager = BaseManager()
+        manager.start()
+        kwargs["bucket"] = manager.TokenBucket(
+            rate=kwargs.get("rate", 10.0),
+            capacity=kwargs.get("capacity", None),
+            reserve=kwargs.get("reserve", 1.0),
+        )
+
+    def call(
+        self,
+        function: Callable,
+        *args,
+        priority: RequestPriority = RequestPriority.Normal,
+        key: Hashable | None = None,
+        retry_on: tuple[type[Exception], ...] = (),
+        **kwargs,
+    ) -> Any:
+        """Call function when rate limit allows
+
+        Args:
+            function (Callable): API request function
+            priority (RequestPriority, optional): _description_. Defaults to RequestPriority.Normal.
+            key (Hashable | None, optional): Coalesce in-flight requests of the same key.
+                Defaults to None.
+            retry_on (tuple[type[Exception], ...], optional): Exceptions to retry.
+                Defaults to ().
+
+        Returns:
+            Any: Result of function
+        """
+        if key is None:
+            return self._call(function, args, kwargs, priority, retry_on)
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._call(function, args, kwargs, priority, retry_on)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _call(self, function, args, kwargs, priority, retry_on):
+        attempt = 0
+        while True:
+            self.acquire(priority=priority)
+            try:
+                return function(*args, **kwargs)
+            except retry_on as e:
+                attempt += 1
+                if attempt >= self._retry:
+                    raise
+
+                delay = self.backoff(attempt - 1)
+                logger.warning("Retry %s in %.2fs after error: %s", function, delay, e)
+                time.sleep(delay)
+
+    def acquire(
+        self, tokens: float = 1.0, priority: RequestPriority = RequestPriority.Normal
+    ):
+        """Block until tokens are taken, higher priority waiting requests go first
+
+        Args:
+            tokens (float, optional): _description_. Defaults to 1.0.
+            priority (RequestPriority, optional): _description_. Defaults to RequestPriority.Normal.
+        """
+        with self._lock:
+            self._waiting[priority] += 1
+        try:
+            while True:
+                # Yield to higher priority requests of this process
+                if any(self._waiting[:priority]):
+                    time.sleep(0.001)
+                    continue
+
+                wait = self._bucket.take(tokens, priority)
+                if wait <= 0:
+                    return
+                time.sleep(wait)
+        finally:
+            with self._lock:
+                self._waiting[priority] -= 1
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry
+
+        Args:
+            attempt (int): Number of failed attempts, start from 0
+
+        Returns:
+            float: _description_
+        """
+        return backoff_jitter(attempt, base=self._backoff, cap=self._backoff_max)
@@ -66,14 +66,28 @@ class LiveExecution(_LiveTrade, Execution, metaclass=ABCMeta):
             at=at,
             order_id=order_id,
             order=order,
-            position_id=position_id,
-            position=position,
             api=api,
             raw=raw,
             **kwargs,
         )
         # self.tag: str | None = tag
 
+        # Broker reports position of execution, order may be unknown
+        self._position: "Position | None" = position
+        self._position_id: str | None = position_id
+
+    @property
+    def position(self) -> "Position | None":
+        if self._position is not None:
+            return self._position
+        return super().position
+
+    @property
+    def position_id(self) -> str | None:
+        if self._position_id is not None:
+            return self._position_id
+        return super().position_id
+
     @classmethod
     @abstractmethod
     def from_raw(cls, raw, exchange: "LiveExchange") -> "LiveExecution":
@@ -10,6 +10,9 @@ from mt5linux import MetaTrader5 as MT5
 
 from lettrade.exchange import OrderType
 from lettrade.exchange.live import LetLiveOrderInvalidException, LiveAPI
+from lettrade.exchange.live.scheduler import backoff_jitter
+
+from .reconcile import MetaTraderReconciler
 
 if TYPE_CHECKING:
     from .metatrader import MetaTraderExchange
@@ -50,7 +53,7 @@ class _RetryException(Exception):
 def mt5_connection(api_function):
     @functools.wraps(api_function)
     def wrapper(self: "MetaTraderAPI", *args, api_retry: int = 3, **kwargs):
-        while api_retry > 0:
+        for attempt in range(api_retry):
             try:
                 return api_function(self, *args, **kwargs)
             except _RetryException:
@@ -63,8 +66,7 @@ def mt5_connection(api_function):
                 logger.error("Cannot reconnect MetaTrader 5 RPC")
                 return None
 
-            time.sleep(1)
-            api_retry -= 1
+            time.sleep(backoff_jitter(attempt))
 
     return wrapper
 
@@ -78,7 +80,7 @@ class MetaTraderAPI(LiveAPI):
     _config: dict
 
     _load_history_since: datetime
-    _deal_time_checked: datetime
+    _reconciler: MetaTraderReconciler
     _orders_stored: dict[int, object]
     _executions_stored: dict[int, object]
     _positions_stored: dict[int, object]
@@ -147,10 +149,13 @@ class MetaTraderAPI(LiveAPI):
         self._magic = magic
 
         self._load_history_since = datetime.now() - timedelta(days=7)
-        self._deal_time_checked = datetime.now() - timedelta(days=1)
-        self._orders_stored = dict()
-        self._executions_stored = dict()
-        self._positions_stored = dict()
+        self._reconciler = MetaTraderReconciler(
+            deal_since=datetime.now() - timedelta(days=1),
+            position_parser=self._position_parse_response,
+        )
+        self._orders_stored = self._reconciler.orders
+        self._executions_stored = self._reconciler.executions
+        self._positions_stored = self._reconciler.positions
 
         # Update config
         self._config.update(
@@ -226,7 +231,7 @@ class MetaTraderAPI(LiveAPI):
 
             # Preload trading data
             now = datetime.now()
-            self._mt5.history_deals_get(self._deal_time_checked, now)
+            self._mt5.history_deals_get(self._reconciler.deal_since, now)
             self._mt5.history_orders_get(self._load_history_since, now)
             self._mt5.orders_get()
             self._mt5.positions_get()
@@ -1001,145 +1006,36 @@ class MetaTraderAPI(LiveAPI):
 
     # Deal
     @mt5_connection
-    def _check_deals(self, **kwargs) -> list | bool | None:
-        to = datetime.now()  # + timedelta(days=1)
-
-        deal_total = self._mt5.history_deals_total(self._deal_time_checked, to)
-
-        # Retry
-        if deal_total is None:
-            raise _RetryException()
-
-        # No thing new in deal
-        if deal_total <= 0:
-            return False
-
-        raws = self._mt5.history_deals_get(self._deal_time_checked, to)
+    def _check_deals(self, **kwargs) -> list | None:
+        raws = self._reconciler.check_deals(self._mt5)
 
         # Retry
         if raws is None:
             raise _RetryException()
 
-        if len(raws) > 0:
-            # Update last check time +1 second
-            self._deal_time_checked = datetime.fromtimestamp(raws[-1].time + 1)
-
-            # Store
-            for raw in raws:
-                self._executions_stored[raw.ticket] = raw
-
         return raws
 
     # Order
     @mt5_connection
     def _check_orders(self, **kwargs) -> tuple | None:
-        order_total = self._mt5.orders_total()
+        result = self._reconciler.check_orders(self._mt5)
 
         # Retry
-        if order_total is None:
+        if result is None:
             raise _RetryException()
 
-        # No thing new in order
-        if order_total <= 0 and len(self._orders_stored) == 0:
-            return None, None
-
-        raws = self._mt5.orders_get()
-
-        # Retry
-        if raws is None:
-            raise _RetryException()
-
-        # Remove orders
-        tickets = [raw.ticket for raw in raws]
-        removed_tickets = [
-            raw.ticket
-            for raw in self._orders_stored.values()
-            if raw.ticket not in tickets
-        ]
-        removed_orders = []
-        for ticket in removed_tickets:
-            histories = self._mt5.history_orders_get(ticket=ticket)
-            removed_orders.append(histories[0])
-
-        # Added orders
-        added_orders = []
-        for raw in raws:
-            if raw.ticket in self._orders_stored:
-                stored = self._orders_stored[raw.ticket]
-                if (
-                    raw.sl == stored.sl
-                    and raw.tp == stored.tp
-                    and raw.volume_current == stored.volume_current
-                    and raw.price_open == stored.price_open
-                    and raw.price_stoplimit == stored.price_stoplimit
-                ):
-                    continue
-            added_orders.append(raw)
-
-        # Store
-        self._orders_stored = {raw.ticket: raw for raw in raws}
-        return added_orders, removed_orders
+        return result
 
     # Trade
     @mt5_connection
     def _check_positions(self, **kwargs) -> tuple | None:
-        positions_total = self._mt5.positions_total()
-
-        # Retry
-        if positions_total is None:
-            raise _RetryException()
-
-        # No thing new in trade
-        if positions_total <= 0 and not bool(self._positions_stored):
-            return None, None
-
-        raws = self._mt5.positions_get()
+        result = self._reconciler.check_positions(self._mt5)
 
         # Retry
-        if raws is None:
-            raise _RetryException()
-
-        # May be wrong account when position exist but no execution
-        if not raws and bool(self._positions_stored):
-            position_exit = list(self._positions_stored.values())[-1]
-            executions = [
-                e
-                for e in self._executions_stored.values()
-                if e.position_id == position_exit.ticket
-            ]
-
-            # Execution is not close of position
-            if not executions or executions[-1].type == position_exit.type:
-                logger.warning(
-                    "Positions retry check connection when position=%s exited but no execution",
-                    position_exit.ticket,
-                )
+        if result is None:
             raise _RetryException()
 
-        tickets = [raw.ticket for raw in raws]
-        raws = {raw.ticket: self._position_parse_response(raw) for raw in raws}
-
-        removed_positions = [
-            raw for raw in self._positions_stored.values() if raw.ticket not in tickets
-        ]
-
-        added_positions = []
-        for raw in raws.values():
-            if raw.ticket in self._positions_stored:
-                stored = self._positions_stored[raw.ticket]
-                if (
-                    raw.time_update == stored.time_update
-                    and raw.sl == stored.sl
-                    and raw.tp == stored.tp
-                    and raw.volume == stored.volume
-                    # and raw.price_open == stored.price_open
-                ):
-                    continue
-
-            added_positions.append(raw)
-
-        self._positions_stored = raws
-        return added_positions, removed_positions
+        return result
 
     # Bypass pickle
     def __copy__(self):
@@ -60,6 +60,9 @@ class MetaTraderDataFeeder(LiveDataFeeder):
 class MetaTraderAccount(LiveAccount):
     """Account for MetaTrader"""
 
+    # Forex lot of `LiveAccount.pl()`
+    _pl_estimate: bool = True
+
 
 class MetaTraderExchange(LiveExchange):
     """MetaTrade 5 exchange module for `lettrade`"""
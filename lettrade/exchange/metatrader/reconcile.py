@@ -0,0 +1,214 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+ORDER_FINGERPRINT_FIELDS = (
+    "sl",
+    "tp",
+    "volume_current",
+    "price_open",
+    "price_stoplimit",
+)
+POSITION_FINGERPRINT_FIELDS = (
+    "time_update",
+    "sl",
+    "tp",
+    "volume",
+)
+
+
+class MetaTraderReconciler:
+    """Reconcile MetaTrader 5 deals, orders and positions.
+
+    Each check fetches a whole collection in one bulk RPC and diffs it against
+    the fingerprint snapshot of the previous check in O(n). Removed orders are
+    resolved by one `history_orders_get` over the time window of their setup.
+
+    Every check return `None` when a RPC response is `None`, caller should retry.
+    """
+
+    deal_since: datetime
+    """Next deals check since this time"""
+    orders: dict[int, Any]
+    """Snapshot of opening orders by ticket"""
+    positions: dict[int, Any]
+    """Snapshot of opening positions by ticket"""
+    executions: dict[int, Any]
+    """Stored deals by ticket"""
+
+    def __init__(
+        self,
+        deal_since: datetime,
+        position_parser: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """_summary_
+
+        Args:
+            deal_since (datetime): Deals check since this time
+            position_parser (Callable[[Any], Any] | None, optional): Parse raw position
+                before emitting. Defaults to None.
+        """
+        self.deal_since = deal_since
+        self.orders = dict()
+        self.positions = dict()
+        self.executions = dict()
+
+        self._position_parser = position_parser
+        self._order_fingerprints: dict[int, tuple] = dict()
+        self._position_fingerprints: dict[int, tuple] = dict()
+
+    # Deal
+    def check_deals(self, mt5, to: datetime | None = None) -> list | None:
+        """Get new deals since last check by 1 RPC
+
+        Args:
+            mt5 (MetaTrader5): MetaTrader 5 connection
+            to (datetime | None, optional): _description_. Defaults to None.
+
+        Returns:
+            list | None: New deals
+        """
+        if to is None:
+            to = datetime.now()
+
+        raws = mt5.history_deals_get(self.deal_since, to)
+        if raws is None:
+            return None
+
+        if len(raws) > 0:
+            # Update last check time +1 second
+            self.deal_since = datetime.fromtimestamp(raws[-1].time + 1)
+
+            # Store
+            for raw in raws:
+                self.executions[raw.ticket] = raw
+
+        return list(raws)
+
+    # Order
+    def check_orders(self, mt5, to: datetime | None = None) -> tuple | None:
+        """Diff opening orders with snapshot by 1 RPC, plus 1 RPC when orders removed
+
+        Args:
+            mt5 (MetaTrader5): MetaTrader 5 connection
+            to (datetime | None, optional): _description_. Defaults to None.
+
+        Returns:
+            tuple | None: (added_orders, removed_orders)
+        """
+        raws = mt5.orders_get()
+        if raws is None:
+            return None
+
+        added, fingerprints, snapshot = _diff(
+            raws,
+            self._order_fingerprints,
+            ORDER_FINGERPRINT_FIELDS,
+        )
+
+        removed_tickets = {t for t in self._order_fingerprints if t not in fingerprints}
+        removed = []
+        if removed_tickets:
+            removed = self._orders_history(mt5, removed_tickets, to=to)
+            if removed is None:
+                return None
+
+        self._order_fingerprints = fingerprints
+        self.orders.clear()
+        self.orders.update(snapshot)
+        return added, removed
+
+    def _orders_history(self, mt5, tickets: set[int], to: datetime | None = None):
+        # One window covers setup time of all removed orders
+        since = min(self.orders[t].time_setup for t in tickets)
+        since = datetime.fromtimestamp(since) - timedelta(seconds=1)
+        if to is None:
+            to = datetime.now()
+        to = to + timedelta(days=1)
+
+        raws = mt5.history_orders_get(since, to)
+        if raws is None:
+            return None
+
+        histories = {raw.ticket: raw for raw in raws if raw.ticket in tickets}
+
+        # Fallback, order not found in window
+        for ticket in [t for t in tickets if t not in histories]:
+            logger.warning("Order %s not found in history window", ticket)
+            raws = mt5.history_orders_get(ticket=ticket)
+            if raws:
+                histories[ticket] = raws[0]
+
+        return list(histories.values())
+
+    # Position
+    def check_positions(self, mt5) -> tuple | None:
+        """Diff opening positions with snapshot by 1 RPC
+
+        Args:
+            mt5 (MetaTrader5): MetaTrader 5 connection
+
+        Returns:
+            tuple | None: (added_positions, removed_positions)
+        """
+        raws = mt5.positions_get()
+        if raws is None:
+            return None
+
+        # May be wrong account when position exist but no execution
+        if not raws and self.positions:
+            position_exit = list(self.positions.values())[-1]
+            executions = [
+                e
+                for e in self.executions.values()
+                if e.position_id == position_exit.ticket
+            ]
+
+            # Execution is not close of position
+            if not executions or executions[-1].type == position_exit.type:
+                logger.warning(
+                    "Positions retry check connection when position=%s exited but no execution",
+                    position_exit.ticket,
+                )
+            return None
+
+        added, fingerprints, snapshot = _diff(
+            raws,
+            self._position_fingerprints,
+            POSITION_FINGERPRINT_FIELDS,
+            parser=self._position_parser,
+        )
+        removed = [
+            raw for ticket, raw in self.positions.items() if ticket not in fingerprints
+        ]
+
+        self._position_fingerprints = fingerprints
+        self.positions.clear()
+        self.positions.update(snapshot)
+        return added, removed
+
+
+def _diff(
+    raws,
+    stored_fingerprints: dict[int, tuple],
+    fields: tuple[str, ...],
+    parser: Callable[[Any], Any] | None = None,
+) -> tuple[list, dict[int, tuple], dict[int, Any]]:
+    added = []
+    fingerprints = dict()
+    snapshot = dict()
+    for raw in raws:
+        ticket = raw.ticket
+        # Compare exact values, hash collision would drop an update silently
+        fingerprint = tuple(getattr(raw, f) for f in fields)
+        fingerprints[ticket] = fingerprint
+
+        if parser is not None:
+            raw = parser(raw)
+        snapshot[ticket] = raw
+
+        if stored_fingerprints.get(ticket) != fingerprint:
+            added.append(raw)
+    return added, fingerprints, snapshot
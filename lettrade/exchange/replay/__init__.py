@@ -0,0 +1,3 @@
+from .api import ReplayAPI, ReplayClock
+from .replay import *
+from .trade import ReplayExecution, ReplayOrder, ReplayPosition
@@ -0,0 +1,745 @@
+"""Replay broker serving recorded bars.
+
+Limitation: recorded files only hold OHLCV bars, there are no ticks. Ticks and
+market fills are synthesised from the open price of the building bar, and
+limit/stop/sl/tp only trigger on closed bars. Intrabar price path, spread
+widening and slippage are not replayed, so fills are more optimistic than a
+real broker.
+"""
+
+import itertools
+import logging
+import random
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from box import Box
+
+from lettrade.data import TimeFrame
+from lettrade.exchange import OrderState, OrderType
+from lettrade.exchange.live import LetLiveOrderInvalidException, LiveAPI
+
+if TYPE_CHECKING:
+    from lettrade.exchange.live import LiveExchange, LiveOrder, LivePosition
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayClock:
+    """Virtual clock of replay.
+
+    `speed > 0` runs virtual time `speed` times faster than wall clock.
+    `speed == 0` runs as fast as possible, time only moves when `wait()` is called.
+    """
+
+    def __init__(self, speed: float = 0.0) -> None:
+        """_summary_
+
+        Args:
+            speed (float, optional): Multiple of wall clock, 0 is as fast as possible.
+                Defaults to 0.0.
+        """
+        self.speed = speed
+        self._at: pd.Timestamp | None = None
+        self._started_at: float = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._at is not None
+
+    def set(self, at: pd.Timestamp):
+        """Jump virtual time to `at`"""
+        self._at = at
+        self._started_at = time.monotonic()
+
+    def now(self) -> pd.Timestamp | None:
+        """Current virtual time"""
+        if self._at is None or self.speed <= 0:
+            return self._at
+        elapsed = (time.monotonic() - self._started_at) * self.speed
+        return self._at + pd.Timedelta(seconds=elapsed)
+
+    def wait(self, at: pd.Timestamp):
+        """Sleep until virtual time reach `at`, or jump to `at` when as fast as possible"""
+        if self.speed <= 0:
+            if self._at is None or at > self._at:
+                self._at = at
+            return
+
+        seconds = (at - self.now()).total_seconds() / self.speed
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class ReplayAPI(LiveAPI):
+    """Replay `LiveAPI`, serve recorded bars from local files and simulate a broker.
+
+    Bars are loaded by symbol and timeframe, from csv files or `pd.DataFrame`.
+    Market orders fill at open of building bar plus spread, limit/stop orders and
+    position sl/tp trigger when a closed bar crosses their price. Every request
+    sleeps for injected latency, so the whole live stack can be load tested
+    without a broker.
+    """
+
+    _clock: ReplayClock
+    _exchange: "LiveExchange | None"
+
+    def __init__(
+        self,
+        datas: str | dict[tuple[str, str], str | pd.DataFrame],
+        start: int | str | pd.Timestamp = 500,
+        speed: float = 0.0,
+        latency: float | tuple[float, float] = 0.0,
+        spread: float = 0.0,
+        balance: float = 10_000,
+        leverage: float = 1.0,
+        contract_size: float = 100_000,
+        csv: dict | None = None,
+        **kwargs,
+    ):
+        """_summary_
+
+        Args:
+            datas (str | dict[tuple[str, str], str | pd.DataFrame]): Path template of csv
+                files like `"data/{symbol}_{timeframe}.csv"`, or dict of `(symbol, timeframe)`
+                to csv path or `pd.DataFrame`
+            start (int | str | pd.Timestamp, optional): Start time of replay, int is bar
+                position of first requested bars. Defaults to 500.
+            speed (float, optional): Multiple of wall clock, 0 is as fast as possible.
+                Defaults to 0.0.
+            latency (float | tuple[float, float], optional): Seconds every request sleeps,
+                or `(min, max)` range of random latency. Defaults to 0.0.
+            spread (float, optional): Ask price minus bid price. Defaults to 0.0.
+            balance (float, optional): _description_. Defaults to 10_000.
+            leverage (float, optional): _description_. Defaults to 1.0.
+            contract_size (float, optional): Units of 1 size. Defaults to 100_000.
+            csv (dict | None, optional): Reflect of `pandas.read_csv()` parameters.
+                Defaults to None.
+        """
+        self._datas = datas
+        self._start = start
+        self._clock = ReplayClock(speed=speed)
+        self._latency = latency
+        self._spread = spread
+        self._balance = balance
+        self._leverage = leverage
+        self._contract_size = contract_size
+        self._csv = csv
+
+        self._series: dict[tuple[str, str], pd.DataFrame] = dict()
+        self._quotes: dict[str, pd.DataFrame] = dict()
+        self._cursors: dict[str, int] = dict()
+        self._end: pd.Timestamp | None = None
+
+        self._exchange = None
+        self._lock = threading.RLock()
+        self._tickets = itertools.count(1)
+        self._orders: dict[str, Box] = dict()
+        self._orders_history: dict[str, Box] = dict()
+        self._positions: dict[str, Box] = dict()
+        self._positions_history: dict[str, Box] = dict()
+        self._executions: dict[str, Box] = dict()
+        self._events: dict[str, list[Box]] = self._events_new()
+
+    @property
+    def clock(self) -> ReplayClock:
+        return self._clock
+
+    def start(self, exchange: "LiveExchange"):
+        self._exchange = exchange
+
+    def next(self):
+        """Match orders and positions with closed bars, then send events to exchange"""
+        with self._lock:
+            self._match()
+            events, self._events = self._events, self._events_new()
+
+        if self._exchange is None:
+            return
+
+        if events["orders"]:
+            self._exchange.on_orders_event(old=events["orders"])
+        if events["executions"]:
+            self._exchange.on_executions_event(events["executions"])
+        if events["positions_new"] or events["positions_old"]:
+            self._exchange.on_positions_event(
+                new=events["positions_new"],
+                old=events["positions_old"],
+            )
+
+    def heartbeat(self) -> bool:
+        now = self._clock.now()
+        return now is None or self._end is None or now <= self._end
+
+    # Data
+    def _load(self, symbol: str, timeframe: str) -> pd.DataFrame:
+        key = (symbol, timeframe)
+        df = self._series.get(key)
+        if df is not None:
+            return df
+
+        if isinstance(self._datas, str):
+            source = self._datas.format(
+                symbol=symbol.replace("/", ""),
+                timeframe=timeframe,
+            )
+        else:
+            source = self._datas.get(key)
+            if source is None:
+                raise RuntimeError(f"Replay data {symbol} {timeframe} is not found")
+
+        if isinstance(source, pd.DataFrame):
+            df = source.copy()
+        else:
+            csv_params = dict(index_col=0, parse_dates=["datetime"], header=0)
+            if self._csv is not None:
+                csv_params.update(**self._csv)
+            df = pd.read_csv(source, **csv_params)
+
+        if df.index.tz is None:
+            df.index = df.index.tz_localize("UTC")
+        df = df[["open", "high", "low", "close", "volume"]].sort_index()
+
+        self._series[key] = df
+
+        # Quote of symbol is smallest timeframe
+        delta = TimeFrame(timeframe).delta
+        quote = self._quotes.get(symbol)
+        if quote is None or delta < quote.attrs["delta"]:
+            df.attrs["delta"] = delta
+            self._quotes[symbol] = df
+
+        end = df.index[-1]
+        if self._end is None or end < self._end:
+            self._end = end
+
+        if not self._clock.started:
+            if isinstance(self._start, int):
+                self._clock.set(df.index[min(self._start, len(df) - 1)])
+            else:
+                self._clock.set(pd.Timestamp(self._start, tz="UTC"))
+
+        return df
+
+    def bar_close(
+        self,
+        symbol: str,
+        timeframe: str,
+        at: pd.Timestamp,
+    ) -> pd.Timestamp | None:
+        """Close time of the bar after `at`, that is open time of the next recorded bar,
+        so market gaps are skipped
+
+        Args:
+            symbol (str): _description_
+            timeframe (str): _description_
+            at (pd.Timestamp): Last closed bar
+
+        Returns:
+            pd.Timestamp | None: None when there is no more recorded bar
+        """
+        with self._lock:
+            df = self._load(symbol, timeframe)
+            i = int(df.index.searchsorted(at, side="right")) + 1
+            if i >= len(df):
+                return None
+            return df.index[i]
+
+    def _building(self, df: pd.DataFrame) -> int:
+        """Position of building bar at current virtual time"""
+        return int(df.index.searchsorted(self._clock.now(), side="right")) - 1
+
+    def _quote(self, symbol: str) -> tuple[pd.DataFrame, int]:
+        df = self._quotes.get(symbol)
+        if df is None:
+            raise RuntimeError(f"Replay symbol {symbol} has no bars loaded")
+        return df, self._building(df)
+
+    def _price(self, symbol: str, side: int) -> float:
+        df, i = self._quote(symbol)
+        price = float(df.open.iat[max(i, 0)])
+        return price + self._spread if side > 0 else price
+
+    def _now_ms(self) -> int:
+        return int(self._clock.now().value // 1_000_000)
+
+    def _sleep(self):
+        latency = self._latency
+        if isinstance(latency, (tuple, list)):
+            latency = random.uniform(*latency)
+        if latency > 0:
+            time.sleep(latency)
+
+    # Market
+    def market(self, symbol: str) -> dict:
+        self._sleep()
+        return Box(
+            symbol=symbol,
+            spread=self._spread,
+            contract_size=self._contract_size,
+        )
+
+    def markets(self, symbols: list[str] | None = None, search=None) -> dict:
+        self._sleep()
+        if symbols is None:
+            symbols = list(self._quotes.keys())
+        return {symbol: self.market(symbol) for symbol in symbols}
+
+    def bars(
+        self,
+        symbol,
+        timeframe,
+        since: int | datetime | None = 0,
+        to: int | datetime | None = 1_000,
+    ) -> list[list]:
+        """Bars up to current virtual time, building bar only knows its open price
+
+        Args:
+            symbol (_type_): _description_
+            timeframe (_type_): _description_
+            since (int | datetime | None, optional): _description_. Defaults to 0.
+            to (int | datetime | None, optional): _description_. Defaults to 1_000.
+
+        Returns:
+            list[list]: list of `[time_ms, open, high, low, close, volume]`
+        """
+        self._sleep()
+
+        with self._lock:
+            df = self._load(symbol, timeframe)
+            end = self._building(df) + 1
+
+            if isinstance(since, int) and isinstance(to, int):
+                start, stop = max(end - since - to, 0), end - since
+            else:
+                start = 0 if since is None else df.index.searchsorted(since)
+                stop = end if to is None else df.index.searchsorted(to, side="right")
+                stop = min(stop, end)
+
+            bars = df.iloc[start:stop]
+            times = bars.index.asi8 // 1_000_000
+            values = bars.to_numpy(dtype=np.float64, copy=True)
+
+        # Future prices of building bar are unknown
+        if stop == end and len(values):
+            values[-1, 1:4] = values[-1, 0]
+            values[-1, 4] = 0
+
+        return [[int(t), *row] for t, row in zip(times, values.tolist())]
+
+    def tick_get(self, symbol: str) -> dict:
+        self._sleep()
+        with self._lock:
+            bid = self._price(symbol, -1)
+            return Box(
+                time=self._now_ms(),
+                bid=bid,
+                ask=bid + self._spread,
+                last=bid,
+            )
+
+    # Account
+    def account(self) -> dict:
+        self._sleep()
+        with self._lock:
+            pl = 0.0
+            margin = 0.0
+            for raw in self._positions.values():
+                price = self._price(raw.symbol, -raw.size)
+                pl += self._pl(raw.size, raw.price_open, price)
+                margin += abs(raw.size) * raw.price_open * self._contract_size
+
+            return Box(
+                balance=self._balance,
+                equity=self._balance + pl,
+                margin=margin / self._leverage,
+                leverage=self._leverage,
+                profit=pl,
+            )
+
+    def _pl(self, size: float, entry: float, exit: float) -> float:
+        return size * (exit - entry) * self._contract_size
+
+    # Order
+    def orders_total(
+        self,
+        since: datetime | None = None,
+        to: datetime | None = None,
+        **kwargs,
+    ) -> int:
+        self._sleep()
+        return len(self._orders)
+
+    def orders_get(
+        self,
+        id: str | None = None,
+        symbol: str | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        self._sleep()
+        with self._lock:
+            return [
+                raw
+                for raw in self._orders.values()
+                if (id is None or raw.ticket == id)
+                and (symbol is None or raw.symbol == symbol)
+            ]
+
+    def orders_history_get(
+        self,
+        id: str | None = None,
+        since: datetime | None = None,
+        to: datetime | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        self._sleep()
+        with self._lock:
+            return [
+                raw
+                for raw in self._orders_history.values()
+                if id is None or raw.ticket == id
+            ]
+
+    def order_open(self, order: "LiveOrder", **kwargs) -> dict:
+        """Open order, market order fills immediately
+
+        Args:
+            order (LiveOrder): _description_
+
+        Raises:
+            LetLiveOrderInvalidException: _description_
+
+        Returns:
+            dict: Result with `code`, `order` ticket and `state`
+        """
+        self._sleep()
+        with self._lock:
+            if order.size == 0:
+                raise LetLiveOrderInvalidException(f"Order {order} size is 0")
+            if order.type == OrderType.StopLimit:
+                raise LetLiveOrderInvalidException(
+                    f"Order type {order.type} is not supported"
+                )
+
+            raw = Box(
+                ticket=str(next(self._tickets)),
+                symbol=order.data.symbol,
+                type=order.type.value,
+                size=order.size,
+                limit_price=order.limit_price or None,
+                stop_price=order.stop_price or None,
+                sl=order.sl_price or None,
+                tp=order.tp_price or None,
+                tag=order.tag,
+                state=OrderState.Placed.value,
+                time=self._now_ms(),
+                time_done=None,
+                price_done=None,
+            )
+
+            if order.type == OrderType.Market:
+                self._order_fill(raw, self._price(raw.symbol, raw.size), event=False)
+            else:
+                self._orders[raw.ticket] = raw
+                self._cursor(raw.symbol)
+
+            return Box(
+                code=0,
+                order=raw.ticket,
+                state=raw.state,
+                price=raw.price_done,
+                time=raw.time_done or raw.time,
+            )
+
+    def order_update(
+        self,
+        order: "LiveOrder",
+        limit_price: float | None = None,
+        stop_price: float | None = None,
+        sl: float | None = None,
+        tp: float | None = None,
+        **kwargs,
+    ) -> dict:
+        self._sleep()
+        with self._lock:
+            raw = self._orders.get(order.id)
+            if raw is None:
+                raise LetLiveOrderInvalidException(f"Order {order.id} is not placed")
+
+            if limit_price is not None:
+                raw.limit_price = limit_price
+            if stop_price is not None:
+                raw.stop_price = stop_price
+            if sl is not None:
+                raw.sl = sl
+            if tp is not None:
+                raw.tp = tp
+
+            return Box(
+                code=0,
+                limit_price=raw.limit_price,
+                stop_price=raw.stop_price,
+                sl=raw.sl,
+                tp=raw.tp,
+            )
+
+    def order_close(self, order: "LiveOrder", **kwargs) -> dict:
+        self._sleep()
+        with self._lock:
+            raw = self._orders.pop(order.id, None)
+            if raw is None:
+                raise LetLiveOrderInvalidException(f"Order {order.id} is not placed")
+
+            raw.state = OrderState.Canceled.value
+            raw.time_done = self._now_ms()
+            self._orders_history[raw.ticket] = raw
+            return Box(code=0, order=raw.ticket)
+
+    # Execution
+    def executions_total(
+        self,
+        since: datetime | None = None,
+        to: datetime | None = None,
+        **kwargs,
+    ) -> int:
+        self._sleep()
+        return len(self._executions)
+
+    def executions_get(
+        self,
+        position_id: str | None = None,
+        search: str | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        self._sleep()
+        with self._lock:
+            return [
+                raw
+                for raw in self._executions.values()
+                if position_id is None or raw.position_id == position_id
+            ]
+
+    def execution_get(self, id: str, **kwargs) -> dict:
+        self._sleep()
+        return self._executions.get(id)
+
+    # Position
+    def positions_total(
+        self,
+        since: datetime | None = None,
+        to: datetime | None = None,
+        **kwargs,
+    ) -> int:
+        self._sleep()
+        return len(self._positions)
+
+    def positions_get(self, id: str = None, symbol: str = None, **kwargs) -> list[dict]:
+        self._sleep()
+        with self._lock:
+            return [
+                raw
+                for raw in self._positions.values()
+                if (id is None or raw.ticket == id)
+                and (symbol is None or raw.symbol == symbol)
+            ]
+
+    def position_update(
+        self,
+        position: "LivePosition",
+        sl: float | None = None,
+        tp: float | None = None,
+        **kwargs,
+    ) -> dict:
+        self._sleep()
+        with self._lock:
+            raw = self._positions.get(position.id)
+            if raw is None:
+                return Box(code=-1, error=f"Position {position.id} is not open")
+
+            if sl is not None:
+                raw.sl = sl
+            if tp is not None:
+                raw.tp = tp
+            return Box(code=0, sl=raw.sl, tp=raw.tp)
+
+    def position_close(self, position: "LivePosition", **kwargs) -> dict:
+        self._sleep()
+        with self._lock:
+            raw = self._positions.get(position.id)
+            if raw is None:
+                return Box(code=-1, error=f"Position {position.id} is not open")
+
+            execution = self._position_close(
+                raw,
+                self._price(raw.symbol, -raw.size),
+                event=False,
+            )
+            return Box(
+                code=0,
+                price=execution.price,
+                execution_id=execution.ticket,
+            )
+
+    # Broker
+    def _events_new(self) -> dict[str, list[Box]]:
+        return dict(orders=[], executions=[], positions_new=[], positions_old=[])
+
+    def _cursor(self, symbol: str):
+        # Closed bars after cursor are not matched yet
+        if symbol not in self._cursors:
+            self._cursors[symbol] = max(self._quote(symbol)[1], 0)
+
+    def _execution(
+        self,
+        raw: Box,
+        size: float,
+        price: float,
+        order: str | None,
+        profit: float = 0.0,
+        time_ms: int | None = None,
+    ) -> Box:
+        execution = Box(
+            ticket=str(next(self._tickets)),
+            order=order,
+            position_id=raw.ticket,
+            symbol=raw.symbol,
+            size=size,
+            price=price,
+            profit=profit,
+            fee=0.0,
+            time=time_ms or self._now_ms(),
+            tag=raw.tag,
+        )
+        self._executions[execution.ticket] = execution
+        self._events["executions"].append(execution)
+        return execution
+
+    def _order_fill(
+        self,
+        raw: Box,
+        price: float,
+        time_ms: int | None = None,
+        event: bool = True,
+    ):
+        raw.state = OrderState.Filled.value
+        raw.price_done = price
+        raw.time_done = time_ms or self._now_ms()
+        self._orders.pop(raw.ticket, None)
+        self._orders_history[raw.ticket] = raw
+        if event:
+            self._events["orders"].append(raw)
+
+        position = Box(
+            ticket=raw.ticket,
+            symbol=raw.symbol,
+            size=raw.size,
+            price_open=price,
+            time=raw.time_done,
+            sl=raw.sl,
+            tp=raw.tp,
+            tag=raw.tag,
+            profit=0.0,
+            fee=0.0,
+            price_close=None,
+            time_close=None,
+        )
+        self._positions[position.ticket] = position
+        self._cursor(position.symbol)
+        self._events["positions_new"].append(position)
+        self._execution(position, raw.size, price, order=raw.ticket, time_ms=time_ms)
+
+    def _position_close(
+        self,
+        raw: Box,
+        price: float,
+        time_ms: int | None = None,
+        event: bool = True,
+    ) -> Box:
+        profit = self._pl(raw.size, raw.price_open, price)
+        self._balance += profit
+
+        raw.profit = profit
+        raw.price_close = price
+        raw.time_close = time_ms or self._now_ms()
+        self._positions.pop(raw.ticket, None)
+        self._positions_history[raw.ticket] = raw
+        if event:
+            self._events["positions_old"].append(raw)
+
+        return self._execution(
+            raw,
+            -raw.size,
+            price,
+            order=None,
+            profit=profit,
+            time_ms=raw.time_close,
+        )
+
+    def _match(self):
+        for symbol, cursor in list(self._cursors.items()):
+            df, building = self._quote(symbol)
+            if building <= cursor:
+                continue
+
+            bars = df.iloc[cursor:building]
+            for at, open, high, low in zip(
+                bars.index.asi8 // 1_000_000,
+                bars.open.values,
+                bars.high.values,
+                bars.low.values,
+            ):
+                self._match_bar(symbol, int(at), open, high, low)
+
+            self._cursors[symbol] = building
+
+    def _match_bar(self, symbol: str, at: int, open: float, high: float, low: float):
+        for raw in list(self._orders.values()):
+            if raw.symbol != symbol:
+                continue
+
+            price = _trigger(raw.size, raw.type, raw.limit_price, raw.stop_price, open)
+            if price is None:
+                # Buy limit and sell stop trigger at low, others at high
+                is_limit = raw.type == OrderType.Limit
+                trigger = raw.limit_price if is_limit else raw.stop_price
+                hit_low = (raw.size > 0) == is_limit
+                if (hit_low and low <= trigger) or (not hit_low and high >= trigger):
+                    price = trigger
+
+            if price is not None:
+                self._order_fill(raw, float(price), time_ms=at)
+
+        for raw in list(self._positions.values()):
+            if raw.symbol != symbol:
+                continue
+
+            # Stop loss first when both are hit in same bar
+            price = None
+            if raw.sl:
+                if raw.size > 0 and low <= raw.sl:
+                    price = min(open, raw.sl)
+                elif raw.size < 0 and high >= raw.sl:
+                    price = max(open, raw.sl)
+            if price is None and raw.tp:
+                if raw.size > 0 and high >= raw.tp:
+                    price = max(open, raw.tp)
+                elif raw.size < 0 and low <= raw.tp:
+                    price = min(open, raw.tp)
+
+            if price is not None:
+                self._position_close(raw, float(price), time_ms=at)
+
+
+def _trigger(size, type, limit_price, stop_price, open) -> float | None:
+    """Fill price when bar opens through order price"""
+    if type == OrderType.Limit:
+        if (size > 0 and open <= limit_price) or (size < 0 and open >= limit_price):
+            return open
+    elif type == OrderType.Stop:
+        if (size > 0 and open >= stop_price) or (size < 0 and open <= stop_price):
+            return open
+    return None
@@ -0,0 +1,172 @@
+import logging
+
+import pandas as pd
+
+from lettrade import BotStatistic, Commander, Plotter, Strategy
+from lettrade.exchange.live import (
+    LetTradeLive,
+    LetTradeLiveBot,
+    LiveAccount,
+    LiveDataFeed,
+    LiveDataFeeder,
+    LiveExchange,
+    let_live,
+)
+from lettrade.utils.latency import latency_probes
+
+from .api import ReplayAPI
+from .trade import ReplayExecution, ReplayOrder, ReplayPosition
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayDataFeed(LiveDataFeed):
+    """DataFeed for Replay"""
+
+    _api_cls: type[ReplayAPI] = ReplayAPI
+
+
+class ReplayDataFeeder(LiveDataFeeder):
+    """DataFeeder for Replay
+
+    Wake up on bar close of main DataFeed by virtual clock of `ReplayAPI`,
+    sleep by replay speed or jump immediately when as fast as possible.
+    """
+
+    _api_cls: type[ReplayAPI] = ReplayAPI
+    _data_cls: type[ReplayDataFeed] = ReplayDataFeed
+
+    _api: ReplayAPI
+
+    def next(self):
+        data = self.data
+        wakeup = self._api.bar_close(data.symbol, data.timeframe.string, data.now)
+        if wakeup is None:
+            # Last recorded bar closes after 2 timeframes
+            wakeup = data.now + 2 * data.timeframe.delta
+        self._api.clock.wait(wakeup)
+
+        latency_probes.tick()
+
+        for data in self.datas:
+            data.next()
+
+
+class ReplayAccount(LiveAccount):
+    """Account for Replay"""
+
+
+class ReplayExchange(LiveExchange):
+    """Replay exchange module for `lettrade`"""
+
+    _execution_cls: type[ReplayExecution] = ReplayExecution
+    _order_cls: type[ReplayOrder] = ReplayOrder
+    _position_cls: type[ReplayPosition] = ReplayPosition
+
+
+class LetTradeReplayBot(LetTradeLiveBot):
+    """LetTradeBot for Replay"""
+
+
+class LetTradeReplay(LetTradeLive):
+    """Help to maintain Replay bots"""
+
+    _data_cls: type[ReplayDataFeed] = ReplayDataFeed
+
+    def __init__(
+        self,
+        feeder: type[ReplayDataFeeder] = ReplayDataFeeder,
+        exchange: type[ReplayExchange] = ReplayExchange,
+        account: type[ReplayAccount] = ReplayAccount,
+        **kwargs,
+    ) -> None:
+        """_summary_
+
+        Args:
+            feeder (Type[ReplayDataFeeder], optional): _description_. Defaults to ReplayDataFeeder.
+            exchange (Type[ReplayExchange], optional): _description_. Defaults to ReplayExchange.
+            account (Type[ReplayAccount], optional): _description_. Defaults to ReplayAccount.
+        """
+        super().__init__(
+            feeder=feeder,
+            exchange=exchange,
+            account=account,
+            **kwargs,
+        )
+
+
+def let_replay(
+    datas: set[set[str]],
+    strategy: type[Strategy],
+    *,
+    replay_datas: str | dict[tuple[str, str], str | pd.DataFrame],
+    replay_start: int | str | pd.Timestamp = 500,
+    replay_speed: float = 0.0,
+    replay_latency: float | tuple[float, float] = 0.0,
+    replay_spread: float = 0.0,
+    replay_balance: float = 10_000,
+    feeder: type[ReplayDataFeeder] = ReplayDataFeeder,
+    exchange: type[ReplayExchange] = ReplayExchange,
+    account: type[ReplayAccount] = ReplayAccount,
+    commander: type[Commander] | None = None,
+    stats: type[BotStatistic] | None = BotStatistic,
+    plotter: type[Plotter] | None = None,
+    bot: type[LetTradeReplayBot] | None = LetTradeReplayBot,
+    lettrade: type[LetTradeReplay] | None = LetTradeReplay,
+    api: type[ReplayAPI] | None = ReplayAPI,
+    **kwargs,
+) -> LetTradeReplay:
+    """Help to build `LetTradeReplay`, run live stack on recorded bars
+
+    Args:
+        datas (set[set[str]]): _description_
+        strategy (Type[Strategy]): _description_
+        replay_datas (str | dict[tuple[str, str], str | pd.DataFrame]): Path template of
+            csv files like `"data/{symbol}_{timeframe}.csv"`, or dict of `(symbol, timeframe)`
+            to csv path or `pd.DataFrame`
+        replay_start (int | str | pd.Timestamp, optional): Start time of replay, int is bar
+            position. Defaults to 500.
+        replay_speed (float, optional): Multiple of wall clock, 0 is as fast as possible.
+            Defaults to 0.0.
+        replay_latency (float | tuple[float, float], optional): Seconds of injected latency
+            of every API request, or `(min, max)` range. Defaults to 0.0.
+        replay_spread (float, optional): _description_. Defaults to 0.0.
+        replay_balance (float, optional): _description_. Defaults to 10_000.
+        feeder (Type[ReplayDataFeeder], optional): _description_. Defaults to ReplayDataFeeder.
+        exchange (Type[ReplayExchange], optional): _description_. Defaults to ReplayExchange.
+        account (Type[ReplayAccount], optional): _description_. Defaults to ReplayAccount.
+        commander (Type[Commander] | None, optional): _description_. Defaults to None.
+        stats (Type[BotStatistic] | None, optional): _description_. Defaults to BotStatistic.
+        plotter (Type[Plotter] | None, optional): _description_. Defaults to None.
+        bot (Type[LetTradeReplayBot] | None, optional): _description_. Defaults to LetTradeReplayBot.
+        lettrade (Type[LetTradeReplay] | None, optional): _description_. Defaults to LetTradeReplay.
+        api (Type[ReplayAPI] | None, optional): _description_. Defaults to ReplayAPI.
+        **kwargs (dict): All remaining properties are passed to the constructor of `LetTradeLive`
+
+    Returns:
+        LetTradeReplay: _description_
+    """
+    api_kwargs: dict = kwargs.setdefault("api_kwargs", {})
+    api_kwargs.update(
+        datas=replay_datas,
+        start=replay_start,
+        speed=replay_speed,
+        latency=replay_latency,
+        spread=replay_spread,
+        balance=replay_balance,
+    )
+
+    return let_live(
+        strategy=strategy,
+        datas=datas,
+        feeder=feeder,
+        exchange=exchange,
+        account=account,
+        commander=commander,
+        plotter=plotter,
+        stats=stats,
+        bot=bot,
+        lettrade=lettrade,
+        api=api,
+        **kwargs,
+    )
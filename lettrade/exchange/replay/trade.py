@@ -0,0 +1,466 @@
+import logging
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from lettrade import (
+    OrderResult,
+    OrderResultError,
+    OrderState,
+    OrderType,
+    PositionResultError,
+    PositionState,
+)
+from lettrade.exchange import PositionResult
+from lettrade.exchange.live import (
+    LetLiveOrderInvalidException,
+    LiveExecution,
+    LiveOrder,
+    LivePosition,
+)
+
+from .api import ReplayAPI
+
+if TYPE_CHECKING:
+    from .replay import ReplayDataFeed, ReplayExchange
+
+
+logger = logging.getLogger(__name__)
+
+
+def _data_of(exchange: "ReplayExchange", raw) -> "ReplayDataFeed | None":
+    for data in exchange.datas:
+        if data.symbol == raw.symbol:
+            return data
+    return None
+
+
+class ReplayExecution(LiveExecution):
+    """Execution for Replay"""
+
+    def __init__(
+        self,
+        pl: float | None = None,
+        fee: float | None = None,
+        tag: str | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.pl: float = pl
+        self.fee: float = fee
+        self.tag: str | None = tag
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw,
+        exchange: "ReplayExchange",
+        data: "ReplayDataFeed | None" = None,
+        api: ReplayAPI | None = None,
+    ) -> "ReplayExecution | None":
+        """Building new ReplayExecution from replay api raw object
+
+        Args:
+            raw (_type_): _description_
+            exchange (ReplayExchange): _description_
+
+        Returns:
+            ReplayExecution: _description_
+        """
+        if data is None:
+            data = _data_of(exchange, raw)
+            if data is None:
+                logger.warning("Raw execution %s is not handling %s", raw.symbol, raw)
+                return
+
+        return cls(
+            exchange=exchange,
+            id=raw.ticket,
+            data=data,
+            order_id=raw.order,
+            position_id=raw.position_id,
+            size=raw.size,
+            price=raw.price,
+            pl=raw.profit,
+            fee=raw.fee,
+            at=pd.to_datetime(raw.time, unit="ms", utc=True),
+            tag=raw.tag,
+            api=api,
+            raw=raw,
+        )
+
+
+class ReplayOrder(LiveOrder):
+    """Order for Replay"""
+
+    exchange: "ReplayExchange"
+
+    def __init__(self, is_real: bool = True, **kwargs):
+        super().__init__(**kwargs)
+
+        self.is_real: bool = is_real
+        """Flag to check `Order` is real, cannot duplicate id, cannot recall from history"""
+
+    def place(self) -> OrderResult:
+        """_summary_
+
+        Raises:
+            RuntimeError: _description_
+
+        Returns:
+            OrderResult: _description_
+        """
+        if self.state != OrderState.Pending:
+            raise RuntimeError(f"Order {self.id} state {self.state} is not Pending")
+
+        try:
+            result = self._api.order_open(self)
+
+            self.raw = result
+            self.id = result.order
+
+            at = pd.to_datetime(result.time, unit="ms", utc=True)
+            ok = super(LiveOrder, self).place(at=at, raw=result)
+
+            # Market order is filled on request
+            if result.state == OrderState.Filled:
+                return self.fill(price=result.price, at=at, raw=result)
+            return ok
+        except LetLiveOrderInvalidException as e:
+            error = OrderResultError(
+                error=e.message,
+                order=self,
+                raw=e.raw,
+            )
+            logger.error("Place order %s", str(error))
+            self.exchange.on_notify(error=error)
+            return error
+
+    def update(
+        self,
+        limit_price: float | None = None,
+        stop_price: float | None = None,
+        sl: float | None = None,
+        tp: float | None = None,
+        caller: float | None = None,
+        **kwargs,
+    ) -> OrderResult:
+        """_summary_
+
+        Args:
+            limit_price (float | None, optional): _description_. Defaults to None.
+            stop_price (float | None, optional): _description_. Defaults to None.
+            sl (float | None, optional): _description_. Defaults to None.
+            tp (float | None, optional): _description_. Defaults to None.
+            caller (float | None, optional): _description_. Defaults to None.
+
+        Raises:
+            RuntimeError: _description_
+
+        Returns:
+            OrderResult: _description_
+        """
+        if caller is self:
+            raise RuntimeError(f"Order recusive update {self}")
+
+        if self.parent is None:
+            result = self._api.order_update(
+                order=self,
+                limit_price=limit_price,
+                stop_price=stop_price,
+                sl=sl,
+                tp=tp,
+                **kwargs,
+            )
+            return super(LiveOrder, self).update(
+                limit_price=result.limit_price,
+                stop_price=result.stop_price,
+                sl=result.sl,
+                tp=result.tp,
+            )
+        else:
+            # SL/TP Order just a virtual order
+            if caller is not self.parent:
+                if self.is_sl_order:
+                    self.parent.update(sl=stop_price, caller=self)
+                elif self.is_tp_order:
+                    self.parent.update(tp=limit_price, caller=self)
+                else:
+                    raise RuntimeError(f"Abandon order {self}")
+
+            return super(LiveOrder, self).update(
+                limit_price=limit_price,
+                stop_price=stop_price,
+            )
+
+    def cancel(self, **kwargs) -> OrderResult:
+        """Cancel order
+
+        Returns:
+            OrderResult: _description_
+        """
+        if self.parent is None:
+            # Abandon order
+            result = self._api.order_close(order=self, **kwargs)
+        else:
+            # Virtual SL/TP order of trade
+            result = None
+
+        return super(LiveOrder, self).cancel(raw=result)
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw: Any,
+        exchange: "ReplayExchange",
+        data: "ReplayDataFeed | None" = None,
+        api: ReplayAPI | None = None,
+    ) -> "ReplayOrder | None":
+        """_summary_
+
+        Args:
+            raw (Any): _description_
+            exchange (ReplayExchange): _description_
+            data (ReplayDataFeed | None, optional): _description_. Defaults to None.
+            api (ReplayAPI | None, optional): _description_. Defaults to None.
+
+        Returns:
+            ReplayOrder | None: _description_
+        """
+        if data is None:
+            data = _data_of(exchange, raw)
+            if data is None:
+                logger.warning("Raw order %s is not handling %s", raw.symbol, raw)
+                return
+
+        order = cls(
+            exchange=exchange,
+            id=raw.ticket,
+            state=OrderState(raw.state),
+            data=data,
+            size=raw.size,
+            type=OrderType(raw.type),
+            limit_price=raw.limit_price,
+            stop_price=raw.stop_price,
+            sl_price=raw.sl,
+            tp_price=raw.tp,
+            tag=raw.tag,
+            placed_at=pd.to_datetime(raw.time, unit="ms", utc=True),
+            api=api,
+            raw=raw,
+        )
+
+        if raw.time_done is not None:
+            order.filled_price = raw.price_done
+            order.filled_at = pd.to_datetime(raw.time_done, unit="ms", utc=True)
+
+        return order
+
+    @classmethod
+    def from_position(
+        cls,
+        position: "ReplayPosition",
+        sl: float | None = None,
+        tp: float | None = None,
+    ) -> "ReplayOrder":
+        """_summary_
+
+        Args:
+            position (ReplayPosition): _description_
+            sl (float | None, optional): _description_. Defaults to None.
+            tp (float | None, optional): _description_. Defaults to None.
+
+        Raises:
+            RuntimeError: _description_
+
+        Returns:
+            ReplayOrder: _description_
+        """
+        if not sl and not tp:
+            raise RuntimeError("not sl and not tp")
+        return cls(
+            id=f"{position.id}-{'sl' if sl else 'tp'}",
+            exchange=position.exchange,
+            data=position.data,
+            state=OrderState.Placed,
+            type=OrderType.Stop if sl else OrderType.Limit,
+            size=-position.size,
+            limit_price=tp,
+            stop_price=sl,
+            parent=position,
+            placed_at=position.entry_at,
+            is_real=False,
+        )
+
+
+class ReplayPosition(LivePosition):
+    """Position for Replay"""
+
+    exchange: "ReplayExchange"
+
+    def update(
+        self,
+        sl: float | None = None,
+        tp: float | None = None,
+        caller: float | None = None,
+        **kwargs,
+    ) -> PositionResult:
+        """_summary_
+
+        Args:
+            sl (float | None, optional): _description_. Defaults to None.
+            tp (float | None, optional): _description_. Defaults to None.
+            caller (float | None, optional): _description_. Defaults to None.
+
+        Raises:
+            RuntimeError: _description_
+
+        Returns:
+            PositionResult: _description_
+        """
+        if not sl and not tp:
+            raise RuntimeError("Update sl=None and tp=None")
+        if caller is self:
+            raise RuntimeError(f"Position recusive update {self}")
+
+        result = self._api.position_update(position=self, sl=sl, tp=tp)
+        if result.code != 0:
+            logger.error("Update position %s", str(result))
+            error = PositionResultError(
+                error=result.error,
+                position=self,
+                raw=result,
+            )
+            self.exchange.on_notify(error=error)
+            return error
+
+        if sl is not None:
+            if self.sl_order:
+                if caller is not self.sl_order:
+                    self.sl_order.update(stop_price=sl, caller=self)
+            else:
+                self.sl_order = self.exchange._order_cls.from_position(
+                    position=self, sl=sl
+                )
+
+        if tp is not None:
+            if self.tp_order:
+                if caller is not self.tp_order:
+                    self.tp_order.update(limit_price=tp, caller=self)
+            else:
+                self.tp_order = self.exchange._order_cls.from_position(
+                    position=self, tp=tp
+                )
+
+        return super(LivePosition, self).update(raw=result)
+
+    def exit(self) -> PositionResult:
+        """_summary_
+
+        Returns:
+            PositionResult: _description_
+        """
+        result = self._api.position_close(position=self)
+        if result.code != 0:
+            logger.error("Exit position %s", str(result))
+            error = PositionResultError(
+                error=result.error,
+                position=self,
+                raw=result,
+            )
+            self.exchange.on_notify(error=error)
+            return error
+
+        execution_raw = self._api.execution_get(id=result.execution_id)
+        result.execution_raw = execution_raw
+
+        ok = super(LivePosition, self).exit(
+            price=result.price,
+            at=pd.to_datetime(execution_raw.time, unit="ms", utc=True),
+            pl=execution_raw.profit,
+            fee=execution_raw.fee,
+            raw=result,
+        )
+        self._orders_cancel()
+        return ok
+
+    def _orders_cancel(self):
+        """Cancel virtual SL/TP orders of exited position"""
+        for order in (self.sl_order, self.tp_order):
+            if order is not None and order.state == OrderState.Placed:
+                order.cancel()
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw,
+        exchange: "ReplayExchange",
+        state: PositionState = PositionState.Open,
+        data: "ReplayDataFeed | None" = None,
+        api: ReplayAPI = None,
+    ) -> "ReplayPosition":
+        """_summary_
+
+        Args:
+            raw (_type_): _description_
+            exchange (ReplayExchange): _description_
+            state (PositionState, optional): _description_. Defaults to PositionState.Open.
+            data (ReplayDataFeed, optional): _description_. Defaults to None.
+            api (ReplayAPI, optional): _description_. Defaults to None.
+
+        Returns:
+            ReplayPosition: _description_
+        """
+        if data is None:
+            data = _data_of(exchange, raw)
+            if data is None:
+                logger.warning("Raw position %s is not handling %s", raw.symbol, raw)
+                return
+
+        if api is None:
+            api = exchange._api
+
+        position = cls(
+            exchange=exchange,
+            id=raw.ticket,
+            data=data,
+            state=state,
+            size=raw.size,
+            entry_price=raw.price_open,
+            entry_fee=raw.fee,
+            entry_at=pd.to_datetime(raw.time, unit="ms", utc=True),
+            parent=None,
+            tag=raw.tag,
+            api=api,
+            raw=raw,
+        )
+
+        if position.state == PositionState.Exit:
+            position.exit_at = pd.to_datetime(raw.time_close, unit="ms", utc=True)
+            position.exit_price = raw.price_close
+            position.exit_pl = raw.profit
+            position.exit_fee = raw.fee
+
+            # Virtual SL/TP orders of position opened in the same event are
+            # registered, but position itself is not
+            for side in ("sl", "tp"):
+                order = exchange.orders.get(f"{position.id}-{side}")
+                if order is not None and order.state == OrderState.Placed:
+                    order.cancel()
+            return position
+
+        # SL
+        if raw.sl:
+            position.sl_order = exchange._order_cls.from_position(
+                position=position, sl=raw.sl
+            )
+            exchange.on_order(position.sl_order)
+
+        # TP
+        if raw.tp:
+            position.tp_order = exchange._order_cls.from_position(
+                position=position, tp=raw.tp
+            )
+            exchange.on_order(position.tp_order)
+
+        return position
@@ -1,7 +1,16 @@
 from .candlestick import *
 from .dataframe import *
+from .extremes import RollingExtremes, rolling_extremes, rolling_extremes_kernel
 from .momentum import *
-from .plot import DATAFRAME_PLOTTERS_NAME, IndicatorPlotter, indicator_load_plotters
+from .pipeline import IndicatorNode, IndicatorPipeline
+from .plot import (
+    DATAFRAME_PLOTTERS_NAME,
+    IndicatorPlotter,
+    indicator_load_plotters,
+    indicator_plot_disabled,
+    indicator_plot_enable,
+    indicator_plot_enabled,
+)
 from .series import *
 from .trend import *
 from .volatility import *
@@ -0,0 +1,110 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+import talib.abstract as ta
+
+from .utils import talib_ma
+
+
+def is_batch(value) -> bool:
+    """Check parameter is a batch of values, like `range(5, 50)` or `[1.5, 2.0]`"""
+    return isinstance(value, list | tuple | range | np.ndarray)
+
+
+def talib_batch(fn, values: np.ndarray, windows: list[int], **kwargs) -> np.ndarray:
+    """Run `talib` function of every window into one matrix
+
+    Args:
+        fn (Callable): `talib` function with `timeperiod` parameter
+        values (np.ndarray): Input values
+        windows (list[int]): Windows
+
+    Returns:
+        np.ndarray: 2D array of bars x windows, column-major so every window is contiguous
+    """
+    matrix = np.empty((len(values), len(windows)), order="F")
+    for j, window in enumerate(windows):
+        matrix[:, j] = fn(values, timeperiod=window, **kwargs)
+    return matrix
+
+
+def ma_batch(
+    series: pd.Series,
+    windows: list[int],
+    mode: Literal["sma", "ema", "wma", "dema", "tema", "trima", "kama", "t3"],
+    **kwargs,
+) -> pd.DataFrame:
+    """Moving averages of multiple windows
+
+    Args:
+        series (pd.Series): _description_
+        windows (list[int]): _description_
+        mode (Literal["sma", "ema", "wma", "dema", "tema", "trima", "kama", "t3"]): _description_
+
+    Returns:
+        pd.DataFrame: Columns are windows
+    """
+    windows = list(windows)
+    values = series.to_numpy(dtype=np.float64)
+
+    matrix = talib_batch(talib_ma(mode), values, windows, **kwargs)
+    return pd.DataFrame(matrix, index=series.index, columns=windows)
+
+
+def rsi_batch(series: pd.Series, windows: list[int], **kwargs) -> pd.DataFrame:
+    """RSI of multiple windows
+
+    Args:
+        series (pd.Series): _description_
+        windows (list[int]): _description_
+
+    Returns:
+        pd.DataFrame: Columns are windows
+    """
+    windows = list(windows)
+    values = series.to_numpy(dtype=np.float64)
+    matrix = talib_batch(ta.RSI, values, windows, **kwargs)
+    return pd.DataFrame(matrix, index=series.index, columns=windows)
+
+
+def bollinger_bands_batch(
+    series: pd.Series,
+    windows: list[int],
+    stds: list[float],
+    ma_mode: Literal["ema", "sma"] = "sma",
+    **kwargs,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Bollinger bands of multiple windows and standard deviation multiples
+
+    Basis and standard deviation are computed once per window and shared by all `stds`.
+
+    Args:
+        series (pd.Series): _description_
+        windows (list[int]): _description_
+        stds (list[float]): _description_
+        ma_mode (Literal["ema", "sma"], optional): _description_. Defaults to "sma".
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: upper, basis, lower. Columns of
+            basis are windows, columns of upper and lower are `(window, std)`
+    """
+    windows = list(windows)
+    stds = list(stds)
+
+    basis = ma_batch(series, windows, mode=ma_mode, **kwargs)
+    deviation = talib_batch(ta.STDDEV, series.to_numpy(dtype=np.float64), windows)
+
+    middle = basis.to_numpy()
+    upper = np.empty((len(series), len(windows) * len(stds)), order="F")
+    lower = np.empty_like(upper)
+    for j in range(len(windows)):
+        for k, std in enumerate(stds):
+            band = std * deviation[:, j]
+            np.add(middle[:, j], band, out=upper[:, j * len(stds) + k])
+            np.subtract(middle[:, j], band, out=lower[:, j * len(stds) + k])
+
+    columns = pd.MultiIndex.from_product([windows, stds], names=["window", "std"])
+    upper = pd.DataFrame(upper, index=series.index, columns=columns, copy=False)
+    lower = pd.DataFrame(lower, index=series.index, columns=columns, copy=False)
+    return upper, basis, lower
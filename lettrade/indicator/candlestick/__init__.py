@@ -8,6 +8,8 @@ from .talib import (
     cdl_eveningstar,
     cdl_morningstar,
     cdl_pattern,
+    cdl_patterns,
+    cdl_patterns_all,
 )
 
 
@@ -20,6 +22,7 @@ def pandas_inject(obj: object | None = None):
     obj.cdl_direction = cdl_direction
 
     obj.cdl_pattern = cdl_pattern
+    obj.cdl_patterns_all = cdl_patterns_all
     obj.cdl_3blackcrows = cdl_3blackcrows
     obj.cdl_3whitesoldiers = cdl_3whitesoldiers
     obj.cdl_morningstar = cdl_morningstar
@@ -1,16 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
+import numpy as np
 import pandas as pd
+import talib
 import talib.abstract as ta
 
+from ..plot import indicator_plot_enabled
+
 
 def _plot_pattern(
     dataframe: pd.DataFrame,
-    indicator: pd.Series,
     name: str | None = None,
     plot_type: Literal["candlestick", "mark"] = "candlestick",
     plot_kwargs: dict | None = None,
 ):
+    if not indicator_plot_enabled():
+        return
+
     if plot_kwargs is None:
         plot_kwargs = dict()
 
@@ -22,7 +29,8 @@ def _plot_pattern(
     filter = lambda df: df[name] > 0
 
     if plot_type == "mark":
-        plot_kwargs.update(series=indicator)
+        # Reference column, not copy of indicator
+        plot_kwargs.update(series=name)
         IndicatorPlotter(
             dataframe=dataframe,
             plotter=plot_mark,
@@ -83,7 +91,6 @@ def cdl_pattern(
         if plot:
             _plot_pattern(
                 dataframe=dataframe,
-                indicator=i,
                 name=name,
                 plot_type=plot_type,
                 plot_kwargs=plot_kwargs,
@@ -330,3 +337,109 @@ def cdl_engulfing(
         plot_kwargs=plot_kwargs,
         **kwargs,
     )
+
+
+def cdl_patterns(group: str = "Pattern Recognition") -> list[str]:
+    """Names of all TA-Lib candle patterns. Ex: `3whitesoldiers`, `doji`"""
+    return [fn[3:].lower() for fn in talib.get_function_groups()[group]]
+
+
+def cdl_patterns_all(
+    dataframe: pd.DataFrame,
+    patterns: list[str] | None = None,
+    prefix: str = "cdl_",
+    workers: int | None = None,
+    inplace: bool = False,
+    plot: bool | list[str] = False,
+    plot_type: Literal["candlestick", "mark"] = "candlestick",
+    plot_kwargs: dict | None = None,
+) -> pd.DataFrame:
+    """Batch of TA-Lib candle patterns on a thread pool
+
+    TA-Lib releases GIL while computing, so patterns are computed concurrently.
+    Values are TA-Lib output divided by 100 as `int8`: `1`/`-1` is bullish/bearish
+    pattern, `2`/`-2` is confirmed pattern (Ex: `hikkake`).
+
+    Args:
+        dataframe (pd.DataFrame): pandas.DataFrame with ohlcv
+        patterns (list[str] | None, optional): TA-Lib candle pattern names.
+            Defaults to None, all patterns.
+        prefix (str, optional): _description_. Defaults to "cdl_".
+        workers (int | None, optional): Thread pool size, 1 to compute in caller thread.
+            Defaults to None, `ThreadPoolExecutor` default.
+        inplace (bool, optional): _description_. Defaults to False.
+        plot (bool | list[str], optional): Plot all patterns or list of patterns.
+            Defaults to False.
+
+    Example:
+        ```python
+        patterns = df.i.cdl_patterns_all(["doji", "engulfing", "3whitesoldiers"])
+        signal = patterns.sum(axis=1)
+        ```
+
+    Raises:
+        RuntimeError: _description_
+
+    Returns:
+        pd.DataFrame: Matrix of bars x patterns, columns are `{prefix}{pattern}`
+    """
+    if __debug__:
+        if not isinstance(dataframe, pd.DataFrame):
+            raise RuntimeError(
+                f"dataframe type '{type(dataframe)}' "
+                "is not instance of pandas.DataFrame"
+            )
+        if plot and not inplace:
+            raise RuntimeError("Cannot plot when inplace=False")
+
+    if patterns is None:
+        patterns = cdl_patterns()
+    patterns = [pattern.lower() for pattern in patterns]
+    fns = [getattr(talib, f"CDL{pattern.upper()}") for pattern in patterns]
+
+    inputs = [
+        dataframe[column].to_numpy(dtype=np.float64)
+        for column in ("open", "high", "low", "close")
+    ]
+    matrix = np.empty((len(dataframe), len(patterns)), dtype=np.int8, order="F")
+
+    def compute(j: int):
+        np.floor_divide(fns[j](*inputs), 100, out=matrix[:, j], casting="unsafe")
+
+    if workers == 1:
+        for j in range(len(patterns)):
+            compute(j)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="CandlestickPatterns",
+        ) as executor:
+            # Raise first error
+            for _ in executor.map(compute, range(len(patterns))):
+                pass
+
+    columns = [f"{prefix}{pattern}" for pattern in patterns]
+    i = pd.DataFrame(matrix, index=dataframe.index, columns=columns, copy=False)
+
+    if inplace:
+        dataframe[columns] = i
+
+        # Plot
+        if plot and indicator_plot_enabled():
+            if isinstance(plot, list):
+                plot = [pattern.lower() for pattern in plot]
+
+            for pattern, name in zip(patterns, columns):
+                if isinstance(plot, list) and pattern not in plot:
+                    continue
+
+                _plot_pattern(
+                    dataframe=dataframe,
+                    name=name,
+                    plot_type=plot_type,
+                    plot_kwargs=None if plot_kwargs is None else dict(plot_kwargs),
+                )
+
+        return dataframe
+
+    return i
@@ -4,6 +4,9 @@ import numpy as np
 import pandas as pd
 from lettrade.plot import PlotColor
 
+from .extremes import rolling_extremes_kernel
+from .plot import indicator_plot_enabled
+
 
 def pandas_inject(obj: object | None = None):
     if obj is None:
@@ -101,7 +104,9 @@ def signal_condiction(
 
     Args:
         dataframe (pd.DataFrame): _description_
-        condictions (list[list[pd.Series | Any]]): Pairs of condiction [`<pandas.Series condiction>`, `<value>`]
+        condictions (list[list[pd.Series | Any]]): Pairs of condiction [`<pandas.Series condiction>`, `<value>`].
+            Condiction is boolean Series/array or row labels. Series value is aligned
+            by index, NaN value never overrides earlier matched condiction.
         name (str): Name of signal, column name when add to DataFrame with inplace=True.
         value (int, optional): Default value when condiction is not matched. Defaults to 0.
         inplace (bool, optional): _description_. Defaults to False.
@@ -132,44 +137,59 @@ def signal_condiction(
                 "is not instance of pandas.DataFrame"
             )
 
-    # Series
-    indicators = []
+    plot = plot and indicator_plot_enabled()
+
+    # Masks
+    masks = []
+    values = []
     plots = {}
     for condiction in condictions:
-        series_value = pd.to_numeric(condiction["value"], errors="coerce")
-        series_index = dataframe.loc[condiction["series"]].index
-        series = pd.Series(
-            series_value,
-            index=series_index,
-            name=condiction["name"],
-            **kwargs,
-        )
-        # Drop duplicate indices
-        series = series[~series.index.duplicated(keep="first")]
-        indicators.append(series)
+        condiction_value = _condiction_value(dataframe, condiction["value"])
+        mask = _condiction_mask(dataframe, condiction["series"])
 
         if plot and "plot_kwargs" in condiction:
-            plots[condiction["name"]] = condiction["plot_kwargs"]
+            plots[condiction["name"]] = (
+                condiction["plot_kwargs"],
+                (
+                    condiction_value[mask]
+                    if np.ndim(condiction_value) > 0
+                    else condiction_value
+                ),
+                mask,
+            )
+
+        # NaN value never overrides
+        if np.ndim(condiction_value) > 0:
+            mask = mask & ~pd.isna(condiction_value)
+        elif pd.isna(condiction_value):
+            continue
+
+        masks.append(mask)
+        values.append(condiction_value)
 
     # Plot
     if plot:
         from lettrade.indicator.plot import IndicatorPlotter
         from lettrade.plot.plotly import plot_line, plot_mark
 
-        for series in indicators:
-            if series.name not in plots:
-                continue
-
-            plot_kwargs = plots[series.name]
-            plot_kwargs.update(series=series, name=series.name)
+        for plot_name, (plot_kwargs, plot_value, mask) in plots.items():
+            series = pd.Series(
+                plot_value,
+                index=dataframe.index[mask],
+                name=plot_name,
+                **kwargs,
+            )
+            plot_kwargs.update(series=series, name=plot_name)
 
             plotter = plot_mark if plot_type == "mark" else plot_line
             IndicatorPlotter(dataframe=dataframe, plotter=plotter, **plot_kwargs)
 
-    # Merge
-    series = pd.Series(value, index=dataframe.index, name=name, **kwargs)
-    for s in indicators:
-        series.update(s)
+    # Merge, last matched condiction wins
+    if masks:
+        i = np.select(masks[::-1], values[::-1], default=value)
+    else:
+        i = np.full(len(dataframe.index), value)
+    series = pd.Series(i, index=dataframe.index, name=name, **kwargs)
 
     if inplace:
         dataframe[name] = series
@@ -178,6 +198,40 @@ def signal_condiction(
     return series
 
 
+def _condiction_mask(dataframe: pd.DataFrame, series) -> np.ndarray:
+    """Boolean mask of condiction aligned to DataFrame rows, condiction is boolean
+    Series/array or row labels accepted by `DataFrame.loc`"""
+    if isinstance(series, pd.Series) and _is_bool(series):
+        if not series.index.equals(dataframe.index):
+            series = series.reindex(dataframe.index, fill_value=False)
+        return series.to_numpy(dtype=bool, na_value=False)
+
+    if not isinstance(series, (pd.Series, pd.Index, slice)):
+        array = np.asarray(series)
+        if array.dtype == bool:
+            return array
+
+    # Row labels
+    return dataframe.index.isin(dataframe.loc[series].index)
+
+
+def _is_bool(series: pd.Series) -> bool:
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return True
+    # Boolean with missing values, ex: result of shift()
+    return series.dtype == object and pd.api.types.infer_dtype(series) == "boolean"
+
+
+def _condiction_value(dataframe: pd.DataFrame, value):
+    """Numeric value of condiction, array-like value is aligned to DataFrame rows"""
+    value = pd.to_numeric(value, errors="coerce")
+    if isinstance(value, pd.Series):
+        if not value.index.equals(dataframe.index):
+            value = value.reindex(dataframe.index)
+        return value.to_numpy(dtype=np.float64, na_value=np.nan)
+    return value
+
+
 def signal_exist(
     dataframe: pd.DataFrame,
     series: pd.Series,
@@ -214,9 +268,13 @@ def signal_exist(
     """
     if isinstance(series, str):
         series = dataframe[series]
-    
-    up_rolling_max = series.rolling(window=window).max()
-    down_rolling_min = series.rolling(window=window).min()
+
+    down_rolling_min, up_rolling_max, _, _ = rolling_extremes_kernel(
+        series.to_numpy(dtype=np.float64),
+        series.to_numpy(dtype=np.float64),
+        window=window,
+        index=False,
+    )
 
     signal = signal_direction(
         dataframe=dataframe,
@@ -271,8 +329,12 @@ def signal_repeat(
     if isinstance(series, str):
         series = dataframe[series]
 
-    up_rolling_min = series.rolling(window=window).min()
-    down_rolling_max = series.rolling(window=window).max()
+    up_rolling_min, down_rolling_max, _, _ = rolling_extremes_kernel(
+        series.to_numpy(dtype=np.float64),
+        series.to_numpy(dtype=np.float64),
+        window=window,
+        index=False,
+    )
 
     signal = signal_direction(
         up=(up_rolling_min >= value_repeat_up),
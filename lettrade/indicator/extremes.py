@@ -0,0 +1,334 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .utils import JIT_ENABLED, jit
+
+
+def rolling_extremes_kernel(
+    high: np.ndarray | None,
+    low: np.ndarray | None,
+    window: int,
+    index: bool = True,
+) -> tuple[np.ndarray | None, np.ndarray | None, np.ndarray | None, np.ndarray | None]:
+    """Rolling min, max, argmin and argmax in O(n) regardless of window size
+
+    Compiled monotonic deque kernel when `numba` is installed, otherwise block
+    prefix/suffix extremes (van Herk/Gil-Werman) by vectorized NumPy.
+    Window contains NaN is NaN, like `pandas` rolling with default `min_periods`.
+
+    Args:
+        high (np.ndarray | None): Values of max and argmax, None to skip
+        low (np.ndarray | None): Values of min and argmin, None to skip
+        window (int): Window size
+        index (bool, optional): Compute argmin and argmax. Defaults to True.
+
+    Returns:
+        tuple[np.ndarray | None, np.ndarray | None, np.ndarray | None, np.ndarray | None]:
+            min, max, argmin, argmax. Arg is position of earliest extreme in window,
+            -1 when not ready
+    """
+    if __debug__:
+        if window is None or window <= 0:
+            raise RuntimeError(f"Window {window} is invalid")
+
+    i_min = i_max = i_argmin = i_argmax = None
+
+    if low is not None:
+        i_min, i_argmin = _rolling_max(
+            -np.asarray(low, dtype=np.float64), window, index
+        )
+        np.negative(i_min, out=i_min)
+
+    if high is not None:
+        i_max, i_argmax = _rolling_max(
+            np.asarray(high, dtype=np.float64), window, index
+        )
+
+    if not index:
+        return i_min, i_max, None, None
+    return i_min, i_max, i_argmin, i_argmax
+
+
+def _rolling_max(
+    values: np.ndarray,
+    window: int,
+    index: bool,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    if JIT_ENABLED:
+        return _rolling_max_deque(values, window)
+    return _rolling_max_blocks(values, window, index=index)
+
+
+@jit
+def _rolling_max_deque(
+    values: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray]:
+    n = values.shape[0]
+    i_max = np.full(n, np.nan)
+    i_argmax = np.full(n, -1, dtype=np.int64)
+
+    # Monotonic decreasing deque of positions, never wrap so sized n
+    queue = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -1
+
+    for i in range(n):
+        value = values[i]
+        if value != value:
+            last_nan = i
+            head = tail = 0
+            continue
+
+        # Keep earlier equal value in front
+        while tail > head and values[queue[tail - 1]] < value:
+            tail -= 1
+        queue[tail] = i
+        tail += 1
+
+        start = i - window + 1
+        if queue[head] < start:
+            head += 1
+
+        if start >= 0 and last_nan < start:
+            i_max[i] = values[queue[head]]
+            i_argmax[i] = queue[head]
+
+    return i_max, i_argmax
+
+
+def _rolling_max_blocks(
+    values: np.ndarray,
+    window: int,
+    index: bool = True,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    n = len(values)
+    i_max = np.full(n, np.nan)
+    i_argmax = np.full(n, -1, dtype=np.int64) if index else None
+    if n < window:
+        return i_max, i_argmax
+
+    # Split to blocks of window size, pad by -inf
+    blocks_count = -(-n // window)
+    size = blocks_count * window
+    padded = np.full(size, -np.inf)
+    padded[:n] = values
+
+    nan = np.isnan(padded)
+    has_nan = nan.any()
+    if has_nan:
+        padded[nan] = -np.inf
+
+    blocks = padded.reshape(blocks_count, window)
+    prefix = np.maximum.accumulate(blocks, axis=1)
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1]
+
+    # Window [i - window + 1, i] is suffix of a block and prefix of next block
+    starts = suffix.ravel()[: n - window + 1]
+    ends = prefix.ravel()[window - 1 : n]
+    np.maximum(starts, ends, out=i_max[window - 1 :])
+
+    if index:
+        positions = np.arange(size).reshape(blocks_count, window)
+
+        # Earliest position of prefix max is where a new max is reached
+        reached = np.empty((blocks_count, window), dtype=bool)
+        reached[:, 0] = True
+        np.greater(blocks[:, 1:], prefix[:, :-1], out=reached[:, 1:])
+        prefix_arg = np.maximum.accumulate(np.where(reached, positions, -1), axis=1)
+
+        # Earliest position of suffix max is the first one equal to its suffix max
+        suffix_arg = np.where(blocks == suffix, positions, size)[:, ::-1]
+        suffix_arg = np.minimum.accumulate(suffix_arg, axis=1)[:, ::-1]
+
+        i_argmax[window - 1 :] = np.where(
+            starts >= ends,
+            suffix_arg.ravel()[: n - window + 1],
+            prefix_arg.ravel()[window - 1 : n],
+        )
+
+    if has_nan:
+        count = np.cumsum(np.isnan(values), dtype=np.int64)
+        count[window:] = count[window:] - count[:-window]
+        invalid = count > 0
+        i_max[invalid] = np.nan
+        if index:
+            i_argmax[invalid] = -1
+
+    return i_max, i_argmax
+
+
+def rolling_extremes(
+    high: pd.Series | str = "high",
+    low: pd.Series | str | None = None,
+    window: int = 14,
+    dataframe: pd.DataFrame = None,
+    prefix: str = "",
+    inplace: bool = False,
+) -> dict[str, pd.Series] | pd.DataFrame:
+    """Rolling min, max, argmin and argmax in one pass
+
+    Args:
+        high (pd.Series | str, optional): Series of max and argmax. Defaults to "high".
+        low (pd.Series | str | None, optional): Series of min and argmin, None to use `high`.
+            Defaults to None.
+        window (int, optional): _description_. Defaults to 14.
+        dataframe (pd.DataFrame, optional): _description_. Defaults to None.
+        prefix (str, optional): _description_. Defaults to "".
+        inplace (bool, optional): _description_. Defaults to False.
+
+    Example:
+        ```python
+        # Donchian channel
+        df.i.rolling_extremes("high", "low", window=20, prefix="dc_", inplace=True)
+        ```
+
+    Returns:
+        dict[str, pd.Series] | pd.DataFrame: {min, max, argmin, argmax}, arg is position
+            of earliest extreme in window, -1 when not ready
+    """
+    if isinstance(high, str):
+        high = dataframe[high]
+    if isinstance(low, str):
+        low = dataframe[low]
+
+    if low is None:
+        low = high
+
+    i_min, i_max, i_argmin, i_argmax = rolling_extremes_kernel(
+        high.to_numpy(dtype=np.float64),
+        low.to_numpy(dtype=np.float64),
+        window=window,
+    )
+
+    # Result is inplace or new dict
+    result = dataframe if inplace else {}
+    result[f"{prefix}min"] = pd.Series(i_min, index=high.index)
+    result[f"{prefix}max"] = pd.Series(i_max, index=high.index)
+    result[f"{prefix}argmin"] = pd.Series(i_argmin, index=high.index)
+    result[f"{prefix}argmax"] = pd.Series(i_argmax, index=high.index)
+    return result
+
+
+class RollingExtremes:
+    """Streaming rolling min, max, argmin and argmax by monotonic deques.
+
+    Update per new bar is O(1) amortized, live feeds push closed bars only.
+
+    Example:
+        ```python
+        extremes = RollingExtremes(window=20)
+        for high, low in bars:
+            extremes.update(high, low)
+        print(extremes.max, extremes.argmax)
+        ```
+    """
+
+    def __init__(self, window: int) -> None:
+        """_summary_
+
+        Args:
+            window (int): Window size
+
+        Raises:
+            RuntimeError: Invalid window
+        """
+        if window is None or window <= 0:
+            raise RuntimeError(f"Window {window} is invalid")
+
+        self.window: int = window
+        self.position: int = -1
+        self._last_nan: int = -1
+        self._maxs: deque[tuple[int, float]] = deque()
+        self._mins: deque[tuple[int, float]] = deque()
+
+    def __repr__(self) -> str:
+        return (
+            f"<RollingExtremes window={self.window} "
+            f"min={self.min} max={self.max} argmin={self.argmin} argmax={self.argmax}>"
+        )
+
+    def update(
+        self,
+        high: float,
+        low: float | None = None,
+    ) -> tuple[float, float, int, int]:
+        """Push value of new bar
+
+        Args:
+            high (float): Value of max
+            low (float | None, optional): Value of min, None to use `high`. Defaults to None.
+
+        Returns:
+            tuple[float, float, int, int]: min, max, argmin, argmax
+        """
+        if low is None:
+            low = high
+
+        self.position = position = self.position + 1
+        start = position - self.window + 1
+
+        maxs = self._maxs
+        mins = self._mins
+        if high != high or low != low:
+            self._last_nan = position
+            maxs.clear()
+            mins.clear()
+        else:
+            while maxs and maxs[-1][1] < high:
+                maxs.pop()
+            maxs.append((position, high))
+
+            while mins and mins[-1][1] > low:
+                mins.pop()
+            mins.append((position, low))
+
+            if maxs[0][0] < start:
+                maxs.popleft()
+            if mins[0][0] < start:
+                mins.popleft()
+
+        return self.min, self.max, self.argmin, self.argmax
+
+    def extend(self, highs, lows=None) -> tuple[float, float, int, int]:
+        """Push values of new bars
+
+        Args:
+            highs (Iterable[float]): Values of max
+            lows (Iterable[float] | None, optional): Values of min. Defaults to None.
+
+        Returns:
+            tuple[float, float, int, int]: min, max, argmin, argmax of last bar
+        """
+        if lows is None:
+            for high in highs:
+                self.update(high)
+        else:
+            for high, low in zip(highs, lows):
+                self.update(high, low)
+        return self.min, self.max, self.argmin, self.argmax
+
+    @property
+    def is_ready(self) -> bool:
+        """Window is full of valid values"""
+        return self.position - self.window + 1 > self._last_nan and (
+            self.position >= self.window - 1
+        )
+
+    @property
+    def min(self) -> float:
+        return self._mins[0][1] if self.is_ready else np.nan
+
+    @property
+    def max(self) -> float:
+        return self._maxs[0][1] if self.is_ready else np.nan
+
+    @property
+    def argmin(self) -> int:
+        return self._mins[0][0] if self.is_ready else -1
+
+    @property
+    def argmax(self) -> int:
+        return self._maxs[0][0] if self.is_ready else -1
@@ -1,12 +1,14 @@
 import pandas as pd
 import talib.abstract as ta
 
+from ..batch import is_batch, rsi_batch
+from ..plot import indicator_plot_enabled
 from ..series import series_init
 
 
 def rsi(
     series: pd.Series | str = "close",
-    window: int = None,
+    window: int | list[int] = None,
     dataframe: pd.DataFrame | None = None,
     name: str | None = None,
     prefix: str = "",
@@ -19,7 +21,8 @@ def rsi(
 
     Args:
         series (pd.Series | str, optional): _description_. Defaults to "close".
-        window (int, optional): _description_. Defaults to None.
+        window (int | list[int], optional): Window, or batch of windows like `range(5, 50)`
+            to compute all of them into a DataFrame with windows as columns. Defaults to None.
         dataframe (pd.DataFrame, optional): _description_. Defaults to None.
         name (str | None, optional): _description_. Defaults to None.
         prefix (str, optional): _description_. Defaults to "".
@@ -33,12 +36,29 @@ def rsi(
     Returns:
         pd.Series | pd.DataFrame: {rsi}
     """
+    batch = is_batch(window)
+
     # Validation & init
     if __debug__:
-        if window is None or window <= 0:
+        windows = window if batch else [window]
+        if len(windows) == 0 or any(w is None or w <= 0 for w in windows):
             raise RuntimeError(f"Window {window} is invalid")
+        if plot and batch:
+            raise RuntimeError("Cannot plot batch of windows")
     series = series_init(series=series, dataframe=dataframe, inplace=inplace)
 
+    if batch:
+        i = rsi_batch(series, windows=window, **kwargs)
+
+        if inplace:
+            name = name or f"{prefix}rsi"
+            for w in i.columns:
+                dataframe[f"{name}_{w}"] = i[w]
+
+            return dataframe
+
+        return i
+
     # Indicator
     i = ta.RSI(series, timeperiod=window, **kwargs)
 
@@ -47,7 +67,7 @@ def rsi(
         dataframe[name] = i
 
         # Plot
-        if plot:
+        if plot and indicator_plot_enabled():
             if plot_kwargs is None:
                 plot_kwargs = dict()
 
@@ -3,6 +3,7 @@ import talib.abstract as ta
 
 from lettrade.plot import PlotColor
 
+from ..plot import indicator_plot_enabled
 from ..series import series_init
 from ..utils import talib_ma_mode
 
@@ -65,7 +66,7 @@ def stochastic(
     result[f"{prefix}slowd"] = slowd
 
     # Plot
-    if plot:
+    if plot and indicator_plot_enabled():
         from lettrade.indicator.plot import IndicatorPlotter
         from lettrade.plot.plotly import plot_lines
 
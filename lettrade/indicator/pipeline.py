@@ -0,0 +1,321 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from lettrade.utils.latency import LatencyProbes
+
+logger = logging.getLogger(__name__)
+
+
+class _DataFrameInput:
+    """Placeholder of input DataFrame of `IndicatorPipeline.run()`"""
+
+    def __repr__(self) -> str:
+        return "dataframe"
+
+
+class IndicatorNode:
+    """Node of `IndicatorPipeline`, an indicator function with its inputs and parameters"""
+
+    def __init__(
+        self,
+        pipeline: "IndicatorPipeline",
+        fn: Callable,
+        args: tuple,
+        kwargs: dict,
+        key: tuple,
+        name: str,
+    ) -> None:
+        """_summary_
+
+        Args:
+            pipeline (IndicatorPipeline): Owner pipeline
+            fn (Callable): Indicator function
+            args (tuple): Positional inputs, column name, `IndicatorNode` or constant
+            kwargs (dict): Keyword inputs, `IndicatorNode` or constant
+            key (tuple): Unique key of function and parameters
+            name (str): Node name in timing report
+        """
+        self.pipeline = pipeline
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<IndicatorNode {self.name}>"
+
+    def __getitem__(self, item: str) -> "IndicatorNode":
+        """Node select item of this node result, like band of `bollinger_bands`"""
+        return self.pipeline.node(
+            _select,
+            self,
+            item=item,
+            name=f"{self.name}[{item}]",
+        )
+
+    @property
+    def dependencies(self) -> list["IndicatorNode"]:
+        """Nodes are inputs of this node"""
+        dependencies = dict()
+        for v in (*self.args, *self.kwargs.values()):
+            if isinstance(v, IndicatorNode):
+                dependencies[v] = None
+        return list(dependencies)
+
+
+class IndicatorPipeline:
+    """Declarative indicators as a DAG of `IndicatorNode`.
+
+    Identical nodes (same function and parameters) are deduplicated when added,
+    independent branches are evaluated concurrently on a thread pool, and time
+    spent by every node is recorded to `probes`.
+
+    Example:
+        ```python
+        from lettrade.indicator import IndicatorPipeline, bollinger_bands, crossover, ema
+
+        p = IndicatorPipeline()
+        ema21 = p.node(ema, "close", window=21)
+        bb = p.node(bollinger_bands, "close", window=21, std=2.0)
+
+        p.output("ema21", ema21)
+        p.output("bb_upper", bb["bb_upper"])
+        # Same node as `ema21`, computed once
+        p.output("crossover", p.node(crossover, "close", p.node(ema, "close", window=21)))
+
+        p.run(df)
+        print(p.report())
+        ```
+    """
+
+    DATAFRAME = _DataFrameInput()
+    """Input placeholder of whole DataFrame, for indicators like `keltner_channel`"""
+
+    def __init__(self, workers: int | None = None) -> None:
+        """_summary_
+
+        Args:
+            workers (int | None, optional): Thread pool size, 1 to evaluate in caller
+                thread. Defaults to None, `ThreadPoolExecutor` default.
+        """
+        self.workers: int | None = workers
+        self.nodes: dict[tuple, IndicatorNode] = dict()
+        self.outputs: dict[str, IndicatorNode] = dict()
+        self.probes: LatencyProbes = LatencyProbes()
+
+    def __repr__(self) -> str:
+        return (
+            f"<IndicatorPipeline nodes={len(self.nodes)} outputs={list(self.outputs)}>"
+        )
+
+    def node(
+        self, fn: Callable, *args, name: str | None = None, **kwargs
+    ) -> IndicatorNode:
+        """Add a node, or get existed node of same function and parameters
+
+        Args:
+            fn (Callable): Indicator function, first positional arguments are inputs
+            *args: Column name of DataFrame, `IndicatorNode`, `IndicatorPipeline.DATAFRAME`
+                or constant
+            name (str | None, optional): Node name in timing report. Defaults to None.
+            **kwargs: Parameters of `fn`, could be `IndicatorNode` or `IndicatorPipeline.DATAFRAME`
+
+        Returns:
+            IndicatorNode: _description_
+        """
+        key = (
+            fn,
+            tuple(_key(v) for v in args),
+            tuple(sorted((k, _key(v)) for k, v in kwargs.items())),
+        )
+
+        node = self.nodes.get(key)
+        if node is not None:
+            return node
+
+        if __debug__:
+            for v in (*args, *kwargs.values()):
+                if isinstance(v, IndicatorNode) and v.pipeline is not self:
+                    raise RuntimeError(f"Node {v} is not belong to this pipeline")
+
+        if name is None:
+            name = _name(fn, args, kwargs)
+
+        node = IndicatorNode(self, fn, args, kwargs, key=key, name=name)
+        self.nodes[key] = node
+        return node
+
+    def output(self, name: str, node: IndicatorNode) -> IndicatorNode:
+        """Set node result as column `name` of DataFrame
+
+        Args:
+            name (str): Column name
+            node (IndicatorNode): _description_
+
+        Returns:
+            IndicatorNode: `node`
+        """
+        if __debug__:
+            if node.pipeline is not self:
+                raise RuntimeError(f"Node {node} is not belong to this pipeline")
+
+        self.outputs[name] = node
+        return node
+
+    def run(
+        self,
+        dataframe: pd.DataFrame,
+        inplace: bool = True,
+    ) -> dict[str, pd.Series]:
+        """Evaluate nodes required by outputs
+
+        Args:
+            dataframe (pd.DataFrame): Input DataFrame/DataFeed
+            inplace (bool, optional): Set outputs as columns of `dataframe`. Defaults to True.
+
+        Returns:
+            dict[str, pd.Series]: Outputs by name
+        """
+        graph = self._graph()
+        results: dict[IndicatorNode, Any] = dict()
+
+        if self.workers == 1:
+            for node in graph:
+                results[node] = self._evaluate(node, dataframe, results)
+        else:
+            self._run_concurrent(graph, dataframe, results)
+
+        outputs = dict()
+        for name, node in self.outputs.items():
+            value = results[node]
+            if __debug__:
+                if isinstance(value, dict):
+                    raise RuntimeError(
+                        f"Output {name} of {node} is dict, select item by node[<key>]"
+                    )
+            outputs[name] = value
+            if inplace:
+                dataframe[name] = value
+
+        return outputs
+
+    def report(self) -> str:
+        """Time spent by every node"""
+        return self.probes.report()
+
+    def _graph(self) -> dict[IndicatorNode, list[IndicatorNode]]:
+        """Nodes required by outputs in topological order with their dependencies"""
+        graph: dict[IndicatorNode, list[IndicatorNode]] = dict()
+
+        def visit(node: IndicatorNode):
+            if node in graph:
+                return
+            dependencies = node.dependencies
+            for dependency in dependencies:
+                visit(dependency)
+            graph[node] = dependencies
+
+        for node in self.outputs.values():
+            visit(node)
+        return graph
+
+    def _run_concurrent(
+        self,
+        graph: dict[IndicatorNode, list[IndicatorNode]],
+        dataframe: pd.DataFrame,
+        results: dict[IndicatorNode, Any],
+    ):
+        waiting = {node: set(dependencies) for node, dependencies in graph.items()}
+        dependents: dict[IndicatorNode, list[IndicatorNode]] = {n: [] for n in graph}
+        for node, dependencies in graph.items():
+            for dependency in dependencies:
+                dependents[dependency].append(node)
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="IndicatorPipeline",
+        ) as executor:
+            futures: dict[Future, IndicatorNode] = dict()
+
+            def submit(node: IndicatorNode):
+                del waiting[node]
+                future = executor.submit(self._evaluate, node, dataframe, results)
+                futures[future] = node
+
+            for node in [n for n, deps in waiting.items() if not deps]:
+                submit(node)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = futures.pop(future)
+                    results[node] = future.result()
+
+                    for dependent in dependents[node]:
+                        dependencies = waiting[dependent]
+                        dependencies.discard(node)
+                        if not dependencies:
+                            submit(dependent)
+
+    def _evaluate(
+        self,
+        node: IndicatorNode,
+        dataframe: pd.DataFrame,
+        results: dict[IndicatorNode, Any],
+    ) -> Any:
+        # Positional string is column name, keyword string is parameter
+        args = [
+            dataframe[v] if isinstance(v, str) else _resolve(v, dataframe, results)
+            for v in node.args
+        ]
+        kwargs = {k: _resolve(v, dataframe, results) for k, v in node.kwargs.items()}
+
+        with self.probes.measure(node.name):
+            value = node.fn(*args, **kwargs)
+
+        # Keep index of DataFrame for series helpers
+        if isinstance(value, np.ndarray) and value.shape == (len(dataframe),):
+            value = pd.Series(value, index=dataframe.index, copy=False)
+
+        if __debug__:
+            logger.debug("Indicator node %s evaluated", node.name)
+
+        return value
+
+
+def _select(value: Any, item: str) -> Any:
+    return value[item]
+
+
+def _resolve(value: Any, dataframe: pd.DataFrame, results: dict) -> Any:
+    if isinstance(value, IndicatorNode):
+        return results[value]
+    if value is IndicatorPipeline.DATAFRAME:
+        return dataframe
+    return value
+
+
+def _key(value: Any) -> Any:
+    if isinstance(value, IndicatorNode):
+        return value.key
+    if isinstance(value, list | tuple | range | np.ndarray):
+        return ("seq", tuple(_key(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return ("repr", repr(value))
+    return value
+
+
+def _name(fn: Callable, args: tuple, kwargs: dict) -> str:
+    params = [v.name if isinstance(v, IndicatorNode) else repr(v) for v in args]
+    params.extend(
+        f"{k}={v.name if isinstance(v, IndicatorNode) else repr(v)}"
+        for k, v in kwargs.items()
+    )
+    return f"{getattr(fn, '__name__', repr(fn))}({', '.join(params)})"
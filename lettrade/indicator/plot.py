@@ -1,9 +1,47 @@
+from contextlib import contextmanager
 from typing import Callable
 
 import pandas as pd
 
 DATAFRAME_PLOTTERS_NAME = "_lt_plotters"
 
+_plot_enabled: bool = True
+
+
+def indicator_plot_enabled() -> bool:
+    """Indicator plotters are registered, False in optimize and headless live bots"""
+    return _plot_enabled
+
+
+def indicator_plot_enable(enabled: bool = True):
+    """Enable/disable indicator plotters of current process
+
+    When disabled, `plot=True` of indicators is skipped and `IndicatorPlotter` is no-op.
+
+    Args:
+        enabled (bool, optional): _description_. Defaults to True.
+    """
+    global _plot_enabled
+    _plot_enabled = enabled
+
+
+@contextmanager
+def indicator_plot_disabled():
+    """Context to disable indicator plotters
+
+    Example:
+        ```python
+        with indicator_plot_disabled():
+            df.i.ema(window=21, plot=True, inplace=True)
+        ```
+    """
+    enabled = _plot_enabled
+    indicator_plot_enable(False)
+    try:
+        yield
+    finally:
+        indicator_plot_enable(enabled)
+
 
 class IndicatorPlotter:
     """Add indicator plotter to DataFrame"""
@@ -21,7 +59,7 @@ class IndicatorPlotter:
         self.filter: Callable | pd.Series | None = filter
         self.kwargs = kwargs
 
-        if push:
+        if push and _plot_enabled:
             indicator_push_plotter(dataframe=dataframe, ip=self)
 
     def config(self, dataframe: pd.DataFrame):
@@ -65,4 +103,4 @@ def indicator_load_plotters(dataframe: pd.DataFrame) -> dict:
 def indicator_clear_plotters(dataframe: pd.DataFrame) -> dict:
     if not hasattr(dataframe, DATAFRAME_PLOTTERS_NAME):
         return
-    object.__delattr__(dataframe, DATAFRAME_PLOTTERS_NAME)
\ No newline at end of file
+    object.__delattr__(dataframe, DATAFRAME_PLOTTERS_NAME)
@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
 
+from .extremes import rolling_extremes, rolling_extremes_kernel
+from .plot import indicator_plot_enabled
+
 
 def series_init(
     series: pd.Series | list[str] | str = "close",
@@ -64,6 +68,7 @@ def pandas_inject(obj: object | None = None):
     obj.rolling_min = series_indicator_inject(rolling_min)
     obj.rolling_max = series_indicator_inject(rolling_max)
     obj.rolling_mean = series_indicator_inject(rolling_mean)
+    obj.rolling_extremes = series_indicator_inject(rolling_extremes)
     obj.crossover = series_indicator_inject(crossover)
     obj.crossunder = series_indicator_inject(crossunder)
 
@@ -118,16 +123,37 @@ def diff(
     return i
 
 
+def _s_diff(series1: pd.Series, series2: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    diff = series1 - series2
+    return diff, diff.to_numpy(dtype=np.float64)
+
+
+def _s_signal(diff: pd.Series, values: np.ndarray) -> pd.Series:
+    return pd.Series(values, index=diff.index, name=diff.name, copy=False)
+
+
+def _s_rolling_all(mask: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Mask of rows where all values of rolling `window` are True"""
+    count = np.cumsum(mask, dtype=np.int64)
+    count[window:] = count[window:] - count[:-window]
+    periods = np.minimum(np.arange(1, len(mask) + 1), window)
+    return (count == periods) & (periods >= min_periods)
+
+
 def s_above(series1: pd.Series, series2: pd.Series) -> pd.Series:
-    return (series1 - series2).apply(lambda v: 100 if v > 0 else 0)
+    diff, values = _s_diff(series1, series2)
+    return _s_signal(diff, np.where(values > 0, np.int8(100), np.int8(0)))
 
 
 def s_below(series1: pd.Series, series2: pd.Series) -> pd.Series:
-    return (series1 - series2).apply(lambda v: -100 if v < 0 else 0)
+    diff, values = _s_diff(series1, series2)
+    return _s_signal(diff, np.where(values < 0, np.int8(-100), np.int8(0)))
 
 
 def s_direction(series1: pd.Series, series2: pd.Series) -> pd.Series:
-    return (series1 - series2).apply(lambda v: -100 if v < 0 else 100 if v > 0 else 0)
+    diff, values = _s_diff(series1, series2)
+    sign = np.sign(np.nan_to_num(values)).astype(np.int8)
+    return _s_signal(diff, sign * np.int8(100))
 
 
 def above(
@@ -286,9 +312,9 @@ def rolling_above(
 
     min_periods = window if min_periods is None else min_periods
 
-    i = s_above(series1, series2)
-    i = i.rolling(window=window, min_periods=min_periods).min()
-    i = i.apply(lambda v: 100 if v >= 100 else 0).astype(int)
+    diff, values = _s_diff(series1, series2)
+    mask = _s_rolling_all(values > 0, window=window, min_periods=min_periods)
+    i = _s_signal(diff, np.where(mask, np.int8(100), np.int8(0)))
 
     if inplace:
         name = name or f"{prefix}rolling_above"
@@ -333,9 +359,9 @@ def rolling_below(
 
     min_periods = window if min_periods is None else min_periods
 
-    i = s_below(series1, series2)
-    i = i.rolling(window=window, min_periods=min_periods).max()
-    i = i.apply(lambda v: -100 if v <= -100 else 0).astype(int)
+    diff, values = _s_diff(series1, series2)
+    mask = _s_rolling_all(values < 0, window=window, min_periods=min_periods)
+    i = _s_signal(diff, np.where(mask, np.int8(-100), np.int8(0)))
 
     if inplace:
         name = name or f"{prefix}rolling_below"
@@ -382,9 +408,13 @@ def rolling_direction(
 
     min_periods = window if min_periods is None else min_periods
 
-    i = s_direction(series1, series2)
-    i = i.rolling(window=window, min_periods=min_periods).mean()
-    i = i.apply(lambda v: -100 if v <= -100 else 100 if v >= 100 else 0).astype(int)
+    diff, values = _s_diff(series1, series2)
+    up = _s_rolling_all(values > 0, window=window, min_periods=min_periods)
+    down = _s_rolling_all(values < 0, window=window, min_periods=min_periods)
+    i = _s_signal(
+        diff,
+        np.where(up, np.int8(100), np.where(down, np.int8(-100), np.int8(0))),
+    )
 
     if inplace:
         name = name or f"{prefix}rolling_direction"
@@ -409,7 +439,13 @@ def rolling_min(
         series = dataframe[series]
 
     min_periods = window if min_periods is None else min_periods
-    i = series.rolling(window=window, min_periods=min_periods).min()
+    if min_periods == window:
+        i, _, _, _ = rolling_extremes_kernel(
+            None, series.to_numpy(dtype=np.float64), window=window, index=False
+        )
+        i = pd.Series(i, index=series.index, name=series.name)
+    else:
+        i = series.rolling(window=window, min_periods=min_periods).min()
 
     if inplace:
         name = name or f"{prefix}rolling_min"
@@ -431,7 +467,13 @@ def rolling_max(
         series = dataframe[series]
 
     min_periods = window if min_periods is None else min_periods
-    i = series.rolling(window=window, min_periods=min_periods).max()
+    if min_periods == window:
+        _, i, _, _ = rolling_extremes_kernel(
+            series.to_numpy(dtype=np.float64), None, window=window, index=False
+        )
+        i = pd.Series(i, index=series.index, name=series.name)
+    else:
+        i = series.rolling(window=window, min_periods=min_periods).max()
 
     if inplace:
         name = name or f"{prefix}rolling_max"
@@ -491,9 +533,11 @@ def crossover(
     if isinstance(series2, str):
         series2 = dataframe[series2]
 
-    below1 = s_below(series1, series2).shift(1)
-    above0 = s_above(series1, series2)
-    i = (-below1 + above0).apply(lambda v: 100 if v >= 200 else 0)
+    diff, values = _s_diff(series1, series2)
+    cross = values > 0
+    cross[1:] &= values[:-1] < 0
+    cross[:1] = False
+    i = _s_signal(diff, np.where(cross, np.int8(100), np.int8(0)))
 
     if inplace:
         name = name or f"{prefix}crossover"
@@ -534,9 +578,11 @@ def crossunder(
     if isinstance(series2, str):
         series2 = dataframe[series2]
 
-    above1 = s_above(series1, series2).shift(1)
-    below0 = s_below(series1, series2)
-    i = (below0 - above1).apply(lambda v: -100 if v <= -200 else 0)
+    diff, values = _s_diff(series1, series2)
+    cross = values < 0
+    cross[1:] &= values[:-1] > 0
+    cross[:1] = False
+    i = _s_signal(diff, np.where(cross, np.int8(-100), np.int8(0)))
 
     if inplace:
         name = name or f"{prefix}crossunder"
@@ -553,6 +599,9 @@ def _plot_mark(
     name: str | None = None,
     plot_kwargs: dict | None = None,
 ):
+    if not indicator_plot_enabled():
+        return
+
     if plot_kwargs is None:
         plot_kwargs = dict()
 
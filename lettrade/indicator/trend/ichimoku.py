@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
 
+from ..extremes import rolling_extremes_kernel
+from ..plot import indicator_plot_enabled
+
 
 def ichimoku(
     dataframe: pd.DataFrame,
@@ -44,22 +48,19 @@ def ichimoku(
         if plot and not inplace:
             raise RuntimeError("Cannot plot when inplace=False")
 
-    tenkan_sen = (
-        dataframe["high"].rolling(window=conversion_line_window).max()
-        + dataframe["low"].rolling(window=conversion_line_window).min()
-    ) / 2
+    high = dataframe["high"].to_numpy(dtype=np.float64)
+    low = dataframe["low"].to_numpy(dtype=np.float64)
+
+    def _middle(window: int) -> pd.Series:
+        i_min, i_max, _, _ = rolling_extremes_kernel(high, low, window, index=False)
+        return pd.Series((i_max + i_min) / 2, index=dataframe.index)
 
-    kijun_sen = (
-        dataframe["high"].rolling(window=base_line_windows).max()
-        + dataframe["low"].rolling(window=base_line_windows).min()
-    ) / 2
+    tenkan_sen = _middle(conversion_line_window)
+    kijun_sen = _middle(base_line_windows)
 
     leading_senkou_span_a = (tenkan_sen + kijun_sen) / 2
 
-    leading_senkou_span_b = (
-        dataframe["high"].rolling(window=laggin_span).max()
-        + dataframe["low"].rolling(window=laggin_span).min()
-    ) / 2
+    leading_senkou_span_b = _middle(laggin_span)
 
     senkou_span_a = leading_senkou_span_a.shift(displacement - 1)
 
@@ -84,7 +85,7 @@ def ichimoku(
         result[f"{prefix}cloud_white"] = cloud_white
         result[f"{prefix}cloud_black"] = cloud_black
 
-    if plot:
+    if plot and indicator_plot_enabled():
         if plot_kwargs is None:
             plot_kwargs = dict()
 
@@ -3,13 +3,15 @@ from typing import Literal
 import pandas as pd
 from lettrade.plot import random_color
 
+from ..batch import is_batch, ma_batch
+from ..plot import indicator_plot_enabled
 from ..series import series_init
 from ..utils import talib_ma
 
 
 def sma(
     series: pd.Series | str = "close",
-    window: int = None,
+    window: int | list[int] = None,
     dataframe: pd.DataFrame = None,
     name: str | None = None,
     prefix: str = "",
@@ -22,7 +24,7 @@ def sma(
 
     Args:
         series (pd.Series | str, optional): _description_. Defaults to "close".
-        window (int, optional): _description_. Defaults to None.
+        window (int | list[int], optional): Window or batch of windows. Defaults to None.
         dataframe (pd.DataFrame, optional): _description_. Defaults to None.
         name (str | None, optional): _description_. Defaults to None.
         prefix (str, optional): _description_. Defaults to "".
@@ -54,7 +56,7 @@ def sma(
 
 def ema(
     series: pd.Series | str = "close",
-    window: int = None,
+    window: int | list[int] = None,
     dataframe: pd.DataFrame = None,
     name: str | None = None,
     prefix: str = "",
@@ -67,7 +69,7 @@ def ema(
 
     Args:
         series (pd.Series | str, optional): _description_. Defaults to "close".
-        window (int, optional): _description_. Defaults to None.
+        window (int | list[int], optional): Window or batch of windows. Defaults to None.
         dataframe (pd.DataFrame, optional): _description_. Defaults to None.
         name (str | None, optional): _description_. Defaults to None.
         prefix (str, optional): _description_. Defaults to "".
@@ -99,7 +101,7 @@ def ema(
 
 def ma(
     series: pd.Series | str = "close",
-    window: int = None,
+    window: int | list[int] = None,
     mode: Literal[
         "sma", "ema", "wma", "dema", "tema", "trima", "kama", "mama", "t3"
     ] = None,
@@ -115,7 +117,8 @@ def ma(
 
     Args:
         series (pd.Series | str, optional): _description_. Defaults to "close".
-        window (int, optional): _description_. Defaults to None.
+        window (int | list[int], optional): Window, or batch of windows like `range(5, 50)`
+            to compute all of them into a DataFrame with windows as columns. Defaults to None.
         mode (Literal[ "sma", "ema", "wma", "dema", "tema", "trima", "kama", "mama", "t3" ], optional): _description_. Defaults to None.
         dataframe (pd.DataFrame, optional): _description_. Defaults to None.
         name (str | None, optional): _description_. Defaults to None.
@@ -127,6 +130,10 @@ def ma(
     Example:
         ```python
         df.i.ma(window=21, name="sma", mode="sma", inplace=True, plot=True)
+
+        # Batch of windows
+        smas = df.i.ma(window=range(5, 50), mode="sma")
+        df["sma"] = smas[21]
         ```
 
     Raises:
@@ -135,42 +142,60 @@ def ma(
     Returns:
         pd.Series | pd.DataFrame: _description_
     """
+    batch = is_batch(window)
+
     # Validation & init
     if __debug__:
-        if window is None or window <= 0:
+        windows = window if batch else [window]
+        if len(windows) == 0 or any(w is None or w <= 0 for w in windows):
             raise RuntimeError(f"Window {window} is invalid")
         if mode is None:
             raise RuntimeError(f"Mode {window} is invalid")
         if plot and not inplace:
             raise RuntimeError("Cannot plot when inplace=False")
+        if plot and batch:
+            raise RuntimeError("Cannot plot batch of windows")
 
     series = series_init(series=series, dataframe=dataframe, inplace=inplace)
 
-    # Indicator
-    ma_fn = talib_ma(mode)
-    i = ma_fn(series, timeperiod=window, **kwargs)
+    if batch:
+        i = ma_batch(series, windows=window, mode=mode, **kwargs)
 
-    # Plot
-    if plot:
-        if plot_kwargs is None:
-            plot_kwargs = dict()
+        if inplace:
+            name = name or f"{prefix}{mode}"
+            for w in i.columns:
+                dataframe[f"{name}_{w}"] = i[w]
 
-        plot_kwargs.update(series=pd.Series(i, index=dataframe.index), name=name)
-        plot_kwargs.setdefault("color", random_color())
+            return dataframe
 
-        from lettrade.indicator.plot import IndicatorPlotter
-        from lettrade.plot.plotly import plot_line
+        return i
 
-        IndicatorPlotter(
-            dataframe=dataframe,
-            plotter=plot_line,
-            **plot_kwargs,
-        )
+    # Indicator
+    ma_fn = talib_ma(mode)
+    i = ma_fn(series, timeperiod=window, **kwargs)
 
     if inplace:
         name = name or f"{prefix}{mode}"
         dataframe[name] = i
 
+        # Plot
+        if plot and indicator_plot_enabled():
+            if plot_kwargs is None:
+                plot_kwargs = dict()
+
+            # Reference column, not copy of indicator
+            plot_kwargs.update(series=name, name=name)
+            plot_kwargs.setdefault("color", random_color())
+
+            from lettrade.indicator.plot import IndicatorPlotter
+            from lettrade.plot.plotly import plot_line
+
+            IndicatorPlotter(
+                dataframe=dataframe,
+                plotter=plot_line,
+                **plot_kwargs,
+            )
+
         return dataframe
 
     return i
@@ -3,12 +3,81 @@ from sys import float_info as sflt
 import numpy as np
 import pandas as pd
 
+from ..plot import indicator_plot_enabled
+from ..utils import jit
+
 
 def zero(x: tuple[int, float]) -> tuple[int, float]:
     """If the value is close to zero, then return zero. Otherwise return itself."""
     return 0 if abs(x) < sflt.epsilon else x
 
 
+@jit
+def _parabolic_sar(
+    high: np.ndarray,
+    low: np.ndarray,
+    falling: bool,
+    sar: float,
+    ep: float,
+    af0: float,
+    af: float,
+    max_af: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Parabolic SAR kernel over raw arrays
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: long, short, af, reversal
+    """
+    m = high.shape[0]
+    i_long = np.full(m, np.nan)
+    i_short = np.full(m, np.nan)
+    i_af = np.full(m, np.nan)
+    i_reversal = np.zeros(m, dtype=np.int64)
+    i_af[0:2] = af0
+
+    for row in range(1, m):
+        high_ = high[row]
+        low_ = low[row]
+
+        if falling:
+            _sar = sar + af * (ep - sar)
+            reverse = high_ > _sar
+
+            if low_ < ep:
+                ep = low_
+                af = min(af + af0, max_af)
+
+            _sar = max(high[row - 1], high[row - 2], _sar)
+        else:
+            _sar = sar + af * (ep - sar)
+            reverse = low_ < _sar
+
+            if high_ > ep:
+                ep = high_
+                af = min(af + af0, max_af)
+
+            _sar = min(low[row - 1], low[row - 2], _sar)
+
+        if reverse:
+            _sar = ep
+            af = af0
+            falling = not falling  # Must come before next line
+            ep = low_ if falling else high_
+
+        sar = _sar  # Update SAR
+
+        # Seperate long/short sar based on falling
+        if falling:
+            i_short[row] = sar
+        else:
+            i_long[row] = sar
+
+        i_af[row] = af
+        i_reversal[row] = int(reverse)
+
+    return i_long, i_short, i_af, i_reversal
+
+
 def parabolic_sar(
     dataframe: pd.DataFrame,
     af0: float = 0.02,
@@ -66,53 +135,22 @@ def parabolic_sar(
 
     sar = dataframe.close.iloc[0]
 
-    i_long = pd.Series(np.nan, index=dataframe.index)
-    i_short = i_long.copy()
-    i_reversal = pd.Series(0, index=dataframe.index)
-    i_af = i_long.copy()
-    i_af.iloc[0:2] = af0
-
     # Calculate Result
-    m = dataframe.high.shape[0]
-    for row in range(1, m):
-        high_ = dataframe.high.iloc[row]
-        low_ = dataframe.low.iloc[row]
-
-        if falling:
-            _sar = sar + af * (ep - sar)
-            reverse = high_ > _sar
-
-            if low_ < ep:
-                ep = low_
-                af = min(af + af0, max_af)
-
-            _sar = max(dataframe.high.iloc[row - 1], dataframe.high.iloc[row - 2], _sar)
-        else:
-            _sar = sar + af * (ep - sar)
-            reverse = low_ < _sar
-
-            if high_ > ep:
-                ep = high_
-                af = min(af + af0, max_af)
-
-            _sar = min(dataframe.low.iloc[row - 1], dataframe.low.iloc[row - 2], _sar)
-
-        if reverse:
-            _sar = ep
-            af = af0
-            falling = not falling  # Must come before next line
-            ep = low_ if falling else high_
-
-        sar = _sar  # Update SAR
-
-        # Seperate long/short sar based on falling
-        if falling:
-            i_short.iloc[row] = sar
-        else:
-            i_long.iloc[row] = sar
-
-        i_af.iloc[row] = af
-        i_reversal.iloc[row] = int(reverse)
+    long, short, af_, reversal = _parabolic_sar(
+        dataframe.high.to_numpy(dtype=np.float64),
+        dataframe.low.to_numpy(dtype=np.float64),
+        falling,
+        float(sar),
+        float(ep),
+        float(af0),
+        float(af),
+        float(max_af),
+    )
+
+    i_long = pd.Series(long, index=dataframe.index)
+    i_short = pd.Series(short, index=dataframe.index)
+    i_af = pd.Series(af_, index=dataframe.index)
+    i_reversal = pd.Series(reversal, index=dataframe.index)
 
     # Result is inplace or new dict
     result = dataframe if inplace else {}
@@ -123,10 +161,15 @@ def parabolic_sar(
     result[f"{prefix}reversal"] = i_reversal
 
     # Plot
-    if plot:
+    if plot and indicator_plot_enabled():
         if plot_kwargs is None:
             plot_kwargs = dict()
 
+        # Reference columns when inplace, not copies of indicator
+        if inplace:
+            i_long = f"{prefix}long"
+            i_short = f"{prefix}short"
+
         if isinstance(plot, list):
             if f"{prefix}long" in plot:
                 plot_kwargs.update(long=i_long)
@@ -1,8 +1,25 @@
+from importlib.util import find_spec
 from typing import Callable, Literal
 
 import talib as ta
 import talib.abstract as taa
 
+JIT_ENABLED = find_spec("numba") is not None
+"""`numba` is installed, kernels decorated by `jit` are compiled"""
+
+if JIT_ENABLED:
+    from numba import njit
+
+    def jit(fn: Callable) -> Callable:
+        """Compile array kernel by `numba` when it is installed"""
+        return njit(cache=True, nogil=True)(fn)
+
+else:
+
+    def jit(fn: Callable) -> Callable:
+        """Run array kernel as plain Python when `numba` is not installed"""
+        return fn
+
 
 def talib_ma_mode(
     name: Literal["sma", "ema", "wma", "dema", "tema", "trima", "kama", "mama", "t3"],
@@ -1,6 +1,8 @@
 import pandas as pd
 import talib.abstract as ta
 
+from ..plot import indicator_plot_enabled
+
 
 def atr(
     dataframe: pd.DataFrame,
@@ -44,7 +46,7 @@ def atr(
         dataframe[name] = i
 
         # Plot
-        if plot:
+        if plot and indicator_plot_enabled():
             if plot_kwargs is None:
                 plot_kwargs = dict()
 
@@ -3,14 +3,16 @@ from typing import Literal
 import pandas as pd
 import talib.abstract as ta
 
+from ..batch import bollinger_bands_batch, is_batch
+from ..plot import indicator_plot_enabled
 from ..series import series_init
 from ..utils import talib_ma_mode
 
 
 def bollinger_bands(
     series: pd.Series | str = "close",
-    window: int = 0,
-    std: int | float = 0,
+    window: int | list[int] = 0,
+    std: int | float | list[int | float] = 0,
     ma_mode: Literal["ema", "sma"] = "sma",
     dataframe: pd.DataFrame = None,
     prefix: str = "bb_",
@@ -23,8 +25,9 @@ def bollinger_bands(
 
     Args:
         series (pd.Series | str, optional): _description_. Defaults to "close".
-        window (int, optional): _description_. Defaults to 0.
-        std (int | float, optional): _description_. Defaults to 0.
+        window (int | list[int], optional): Window or batch of windows. Defaults to 0.
+        std (int | float | list[int | float], optional): Standard deviation multiple or
+            batch of them. Defaults to 0.
         ma_mode (Literal[&quot;ema&quot;, &quot;sma&quot;], optional): _description_. Defaults to "sma".
         dataframe (pd.DataFrame, optional): _description_. Defaults to None.
         prefix (str, optional): _description_. Defaults to "bb_".
@@ -35,6 +38,10 @@ def bollinger_bands(
     Example:
         ```python
         df.i.bollinger_bands(window=20, std=2.0, inplace=True, plot=True)
+
+        # Batch of windows and stds, upper/lower columns are (window, std)
+        bbs = df.i.bollinger_bands(window=range(10, 30), std=[1.5, 2.0, 2.5])
+        df["bb_upper"] = bbs["bb_upper"][(20, 2.0)]
         ```
 
     Raises:
@@ -43,16 +50,46 @@ def bollinger_bands(
     Returns:
         dict[str, pd.Series] | pd.DataFrame: _description_
     """
+    batch = is_batch(window) or is_batch(std)
+
     if __debug__:
-        if window <= 0:
+        windows = window if is_batch(window) else [window]
+        stds = std if is_batch(std) else [std]
+        if len(windows) == 0 or any(w <= 0 for w in windows):
             raise RuntimeError(f"Window {window} is invalid")
-        if std <= 0:
+        if len(stds) == 0 or any(s <= 0 for s in stds):
             raise RuntimeError(f"Std {std} is invalid")
         if plot and not inplace:
             raise RuntimeError("Cannot plot when inplace=False")
+        if plot and batch:
+            raise RuntimeError("Cannot plot batch of windows")
 
     series = series_init(series=series, dataframe=dataframe, inplace=inplace)
 
+    if batch:
+        i_upper, i_basis, i_lower = bollinger_bands_batch(
+            series,
+            windows=window if is_batch(window) else [window],
+            stds=std if is_batch(std) else [std],
+            ma_mode=ma_mode,
+            **kwargs,
+        )
+
+        if not inplace:
+            return {
+                f"{prefix}upper": i_upper,
+                f"{prefix}basis": i_basis,
+                f"{prefix}lower": i_lower,
+            }
+
+        for w in i_basis.columns:
+            dataframe[f"{prefix}basis_{w}"] = i_basis[w]
+        for w, s in i_upper.columns:
+            dataframe[f"{prefix}upper_{w}_{s}"] = i_upper[(w, s)]
+            dataframe[f"{prefix}lower_{w}_{s}"] = i_lower[(w, s)]
+
+        return dataframe
+
     i_upper, i_basis, i_lower = ta.BBANDS(
         series,
         timeperiod=window,
@@ -69,7 +106,7 @@ def bollinger_bands(
     result[f"{prefix}lower"] = i_lower
 
     # Plot
-    if plot:
+    if plot and indicator_plot_enabled():
         if plot_kwargs is None:
             plot_kwargs = dict()
 
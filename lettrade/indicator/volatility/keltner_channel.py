@@ -4,6 +4,7 @@ import pandas as pd
 import talib.abstract as ta
 from lettrade.plot import PlotColor
 
+from ..plot import indicator_plot_enabled
 from ..utils import talib_ma
 
 
@@ -79,7 +80,7 @@ def keltner_channel(
     result[f"{prefix}lower"] = i_lower
 
     # Plot
-    if plot:
+    if plot and indicator_plot_enabled():
         from lettrade.indicator.plot import IndicatorPlotter
         from lettrade.plot.plotly import plot_lines
 
@@ -1,6 +1,9 @@
+import functools
 import logging
-from concurrent.futures import ProcessPoolExecutor
-from typing import TYPE_CHECKING
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from lettrade.account import Account
 from lettrade.bot import LetTradeBot
@@ -27,6 +30,10 @@ class LetTrade:
 
     _kwargs: dict
 
+    _datas_workers: int | None
+    _datas_executor: Literal["thread", "process"]
+    _datas_lazy: bool
+
     def __init__(
         self,
         datas: DataFeed | list[DataFeed] | str | list[str],
@@ -39,6 +46,9 @@ class LetTrade:
         plotter: type[Plotter] | None = None,
         name: str | None = None,
         bot: type[LetTradeBot] = LetTradeBot,
+        datas_workers: int | None = None,
+        datas_executor: Literal["thread", "process"] = "thread",
+        datas_lazy: bool = False,
         **kwargs,
     ) -> None:
         """_summary_
@@ -54,7 +64,19 @@ class LetTrade:
             plotter (type[Plotter] | None, optional): _description_. Defaults to None.
             name (str | None, optional): _description_. Defaults to None.
             bot (type[LetTradeBot], optional): _description_. Defaults to LetTradeBot.
+            datas_workers (int | None, optional): Number of workers to load DataFeeds concurrently.
+                Defaults to None, one worker per source up to number of CPUs.
+            datas_executor (Literal["thread", "process"], optional): Pool to load DataFeeds.
+                `process` requires picklable sources. Defaults to "thread".
+            datas_lazy (bool, optional): When `datas` are groups of DataFeed, each `run()` worker
+                load its own group instead of receiving it pickled from parent. Defaults to False.
         """
+        self._datas_workers = datas_workers
+        self._datas_executor = datas_executor
+        self._datas_lazy = (
+            datas_lazy and isinstance(datas, list) and isinstance(datas[0], list)
+        )
+
         self._kwargs = kwargs
         self._kwargs["strategy_cls"] = strategy
         self._kwargs["feeder_cls"] = feeder
@@ -66,9 +88,14 @@ class LetTrade:
         self._kwargs["bot_cls"] = bot
         self._kwargs["name"] = name
 
-        self._kwargs["datas"] = self._init_datafeeds(datas)
+        if self._datas_lazy:
+            # Load lazily in `run()` workers
+            self._kwargs["datas"] = datas
+        else:
+            self._kwargs["datas"] = self._init_datafeeds(datas)
 
-    def _datafeed(self, data: DataFeed, **kwargs) -> DataFeed:
+    @classmethod
+    def _datafeed(cls, data: DataFeed, **kwargs) -> DataFeed:
         """Init and validate DataFeed
 
         Args:
@@ -86,23 +113,82 @@ class LetTrade:
             case _:
                 raise RuntimeError(f"data {data} is invalid")
 
-    def _init_datafeeds(self, datas) -> list[DataFeed] | list[list[DataFeed]]:
+    def _init_datafeeds(
+        self,
+        datas,
+        workers: int | None = None,
+    ) -> list[DataFeed] | list[list[DataFeed]]:
+        if workers is None:
+            workers = self._datas_workers
+
+        return self.__class__._load_datafeeds(
+            datas,
+            workers=workers,
+            executor=self._datas_executor,
+        )
+
+    @classmethod
+    def _load_datafeeds(
+        cls,
+        datas,
+        workers: int | None = None,
+        executor: Literal["thread", "process"] = "thread",
+    ) -> list[DataFeed] | list[list[DataFeed]]:
         # Support single and multiple data
         if not isinstance(datas, list):
             datas = [datas]
 
+        # Flatten sources, index is position in its group. Every group runs the
+        # same strategy, so names match between groups and lazy loaded group
+        is_groups = isinstance(datas[0], list)
+        if is_groups:
+            sources = [d for data in datas for d in data]
+            indices = [i for data in datas for i in range(len(data))]
+        else:
+            sources = list(datas)
+            indices = list(range(len(sources)))
+
+        # Load sources concurrently
+        if workers is None:
+            workers = min(len(sources), os.cpu_count() or 1)
+
+        start = time.perf_counter()
+        if workers > 1 and len(sources) > 1:
+            # Classmethod is pickled as reference, not whole LetTrade object
+            with _datas_pool(executor, workers) as pool:
+                results = list(
+                    pool.map(
+                        _datafeed_timed,
+                        [cls._datafeed] * len(sources),
+                        sources,
+                        indices,
+                    )
+                )
+        else:
+            results = [
+                _datafeed_timed(cls._datafeed, data, index)
+                for data, index in zip(sources, indices)
+            ]
+
+        for df, elapsed in results:
+            logger.info("DataFeed %s loaded in %.3fs", df.name, elapsed)
+        if len(results) > 1:
+            logger.info(
+                "Loaded %d DataFeeds in %.3fs with %d workers",
+                len(results),
+                time.perf_counter() - start,
+                workers,
+            )
+
         # Check data
         feeds: list[list[DataFeed]] | list[DataFeed]
-        if isinstance(datas[0], list):
+        if is_groups:
             feeds = []
-            for i, data in enumerate(datas):
-                data_feeds: list[DataFeed] = []
-                for j, d in enumerate(data):
-                    df = self._datafeed(data=d, index=i * j)
-                    data_feeds.append(df)
-                feeds.append(data_feeds)
+            it = iter(results)
+            for data in datas:
+                feeds.append([next(it)[0] for _ in data])
         else:
-            feeds = [self._datafeed(data=data, index=i) for i, data in enumerate(datas)]
+            feeds = [df for df, _ in results]
         return feeds
 
     def start(self, force: bool = False):
@@ -132,10 +218,15 @@ class LetTrade:
             self._multiprocess()
 
             datas_source = self._kwargs.pop("datas")
+            if self._datas_lazy:
+                run_bot = functools.partial(_run_bot_lazy, self.__class__)
+            else:
+                run_bot = self._bot_cls.run_bot
+
             with ProcessPoolExecutor(max_workers=worker) as executor:
                 futures = [
                     executor.submit(
-                        self._bot_cls.run_bot,
+                        run_bot,
                         datas=datas,
                         id=i,
                         result="str",
@@ -288,3 +379,36 @@ class LetTrade:
     @_plotter_cls.setter
     def _plotter_cls(self, value):
         self._kwargs["plotter_cls"] = value
+
+
+def _datafeed_timed(
+    datafeed: Callable[..., DataFeed],
+    data: Any,
+    index: int,
+) -> tuple[DataFeed, float]:
+    start = time.perf_counter()
+    df = datafeed(data=data, index=index)
+    return df, time.perf_counter() - start
+
+
+def _datas_pool(
+    executor: Literal["thread", "process"],
+    workers: int,
+) -> Executor:
+    match executor:
+        case "thread":
+            return ThreadPoolExecutor(max_workers=workers)
+        case "process":
+            return ProcessPoolExecutor(max_workers=workers)
+    raise RuntimeError(f"DataFeed executor {executor} is invalid")
+
+
+def _run_bot_lazy(
+    lettrade_cls: type[LetTrade],
+    datas: list,
+    bot_cls: type[LetTradeBot],
+    **kwargs,
+):
+    """Load DataFeeds group inside worker then run bot"""
+    datas = lettrade_cls._load_datafeeds(datas, workers=1)
+    return bot_cls.run_bot(datas=datas, bot_cls=bot_cls, **kwargs)
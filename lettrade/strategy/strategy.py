@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, final
 import pandas as pd
 from lettrade.account import Account
 from lettrade.commander import Commander
-from lettrade.data import DataFeed, DataFeeder
+from lettrade.data import DataFeed, DataFeeder, PanelDataFeed
 from lettrade.exchange import (
     Exchange,
     Execution,
@@ -16,9 +16,11 @@ from lettrade.exchange import (
     TradeSide,
 )
 from lettrade.indicator.plot import indicator_clear_plotters
+from lettrade.utils.latency import latency_probes
 
 if TYPE_CHECKING:
     from lettrade.exchange.backtest import BackTestOrder, BackTestPosition
+    from lettrade.indicator import IndicatorPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -100,8 +102,33 @@ class Strategy:
             df (DataFeed): DataFeed need to load indicators value
         """
 
+    def pipeline(self) -> "IndicatorPipeline | None":
+        """Declarative indicators, build once and evaluated on every `DataFeed`
+        before `indicators()`, so `indicators()` can use its output columns.
+
+        Usage:
+            ```python
+            from lettrade.indicator import IndicatorPipeline, bollinger_bands, ema
+
+            def pipeline(self):
+                p = IndicatorPipeline()
+                p.output("ema", p.node(ema, "close", window=21))
+                p.output("bb_upper", p.node(bollinger_bands, "close", window=21, std=2)["bb_upper"])
+                return p
+
+            def indicators(self, df: DataFeed):
+                df["signal_ema_crossover"] = df.i.crossover(df.close, df.ema)
+            ```
+
+        Returns:
+            IndicatorPipeline | None: Pipeline, None to disable
+        """
+        return None
+
     @final
     def _indicators_loader_inject(self):
+        self.__pipeline = self.pipeline()
+
         for data in self.datas:
             fn_name = f"indicators_{data.name.lower()}"
             if hasattr(self, fn_name):
@@ -113,7 +140,11 @@ class Strategy:
     @final
     def _indicators_load(self):
         for data in self.datas:
+            if self.__pipeline is not None:
+                self.__pipeline.run(data)
             data.lt_indicators_load(data)
+            if data.meta.get("compact", False):
+                data.compact()
 
     @final
     def _indicators_clear(self):
@@ -139,8 +170,12 @@ class Strategy:
     @final
     def _next(self) -> None:
         if self.is_live:
-            self._indicators_clear()
-            self._indicators_load()
+            with latency_probes.measure("indicators"):
+                self._indicators_clear()
+                self._indicators_load()
+            with latency_probes.measure("strategy_next"):
+                self.next(*self.datas)
+            return
         self.next(*self.datas)
 
     def next(self, df: DataFeed, *others: list[DataFeed]) -> None:
@@ -439,6 +474,27 @@ class Strategy:
         """
         return self.__datas
 
+    @final
+    @property
+    def panel(self) -> PanelDataFeed | None:
+        """Getter of first PanelDataFeed
+
+        Returns:
+            PanelDataFeed | None: `None` when there is no panel
+        """
+        panels = self.__feeder.panels
+        return panels[0] if panels else None
+
+    @final
+    @property
+    def panels(self) -> list[PanelDataFeed]:
+        """Getter of all PanelDataFeed
+
+        Returns:
+            list[PanelDataFeed]: _description_
+        """
+        return self.__feeder.panels
+
     @final
     @property
     def orders(self) -> "dict[str, Order | BackTestOrder]":
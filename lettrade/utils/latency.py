@@ -0,0 +1,281 @@
+import json
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Log-scale latency histogram.
+
+    Record is O(1) and thread-safe. Buckets are spaced `precision` per decade
+    from `low` to `high` seconds, so percentiles are accurate to about
+    `10 ** (1 / precision)` relative error.
+    """
+
+    def __init__(
+        self,
+        name: str = "latency",
+        low: float = 1e-6,
+        high: float = 100.0,
+        precision: int = 20,
+    ) -> None:
+        """_summary_
+
+        Args:
+            name (str, optional): _description_. Defaults to "latency".
+            low (float, optional): Lowest bucket in seconds. Defaults to 1e-6.
+            high (float, optional): Highest bucket in seconds. Defaults to 100.0.
+            precision (int, optional): Buckets per decade. Defaults to 20.
+        """
+        self.name = name
+        self._low = low
+        self._precision = precision
+        self._log_low = math.log10(low)
+        self._size = int(math.ceil((math.log10(high) - self._log_low) * precision)) + 1
+        self._counts = np.zeros(self._size, dtype=np.int64)
+        self._lock = threading.Lock()
+
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = 0.0
+
+    def record(self, seconds: float):
+        """Record a latency
+
+        Args:
+            seconds (float): _description_
+        """
+        if seconds <= self._low:
+            bucket = 0
+        else:
+            bucket = int((math.log10(seconds) - self._log_low) * self._precision)
+            bucket = min(bucket, self._size - 1)
+
+        with self._lock:
+            self._counts[bucket] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Latency at percentile
+
+        Args:
+            q (float): Percentile in range [0, 100]
+
+        Returns:
+            float: Upper edge of bucket in seconds, `nan` if empty
+        """
+        with self._lock:
+            if self.count == 0:
+                return math.nan
+            rank = max(1, math.ceil(q / 100 * self.count))
+            bucket = int(np.searchsorted(np.cumsum(self._counts), rank))
+            return min(self._edge(bucket + 1), self.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(99)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Merge other histogram of the same buckets into this one"""
+        with self._lock:
+            self._counts += other._counts
+            self.count += other.count
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+
+    def reset(self):
+        with self._lock:
+            self._counts[:] = 0
+            self.count = 0
+            self.total = 0.0
+            self.min = math.inf
+            self.max = 0.0
+
+    def buckets(self) -> list[tuple[float, float, int]]:
+        """Not empty buckets
+
+        Returns:
+            list[tuple[float, float, int]]: list of `(low, high, count)` in seconds
+        """
+        with self._lock:
+            return [
+                (self._edge(i), self._edge(i + 1), int(c))
+                for i, c in enumerate(self._counts)
+                if c
+            ]
+
+    def to_dict(self) -> dict:
+        return dict(
+            name=self.name,
+            count=self.count,
+            mean=self.mean,
+            min=self.min if self.count else math.nan,
+            p50=self.p50,
+            p99=self.p99,
+            max=self.max if self.count else math.nan,
+        )
+
+    def _edge(self, bucket: int) -> float:
+        return 10 ** (self._log_low + bucket / self._precision)
+
+    def __repr__(self) -> str:
+        if not self.count:
+            return f"<{self.__class__.__name__} {self.name} count=0>"
+        return (
+            f"<{self.__class__.__name__} {self.name} count={self.count} "
+            f"p50={self.p50 * 1000:.3f}ms p99={self.p99 * 1000:.3f}ms "
+            f"max={self.max * 1000:.3f}ms>"
+        )
+
+
+class LatencyProbes:
+    """Latency histograms by stage of live pipeline.
+
+    `tick()` marks the moment `LiveDataFeeder` wakes up for new bar, stages
+    named `tick_to_*` measure from that mark. Recording is always on, periodic
+    log line and local metrics endpoint are started by `start()`.
+    """
+
+    def __init__(self) -> None:
+        self._stages: dict[str, LatencyHistogram] = dict()
+        self._lock = threading.Lock()
+        self._tick_at: float | None = None
+
+        self._log_interval = 0.0
+        self._logged_at = 0.0
+        self._server: ThreadingHTTPServer | None = None
+
+    def histogram(self, stage: str) -> LatencyHistogram:
+        """Get or create histogram of stage"""
+        histogram = self._stages.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._stages.setdefault(stage, LatencyHistogram(stage))
+        return histogram
+
+    def record(self, stage: str, seconds: float):
+        self.histogram(stage).record(seconds)
+
+    @contextmanager
+    def measure(self, stage: str):
+        """Record duration of `with` block to stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(stage).record(time.perf_counter() - start)
+
+    def tick(self):
+        """Mark start of a pipeline cycle, log report when interval is passed"""
+        self._tick_at = now = time.perf_counter()
+
+        if self._log_interval > 0 and now - self._logged_at >= self._log_interval:
+            self._logged_at = now
+            logger.info("Latency: %s", self.report())
+
+    def since_tick(self, stage: str):
+        """Record time from last `tick()` to stage"""
+        if self._tick_at is not None:
+            self.histogram(stage).record(time.perf_counter() - self._tick_at)
+
+    def report(self) -> str:
+        """One line p50/p99 of all stages in milliseconds"""
+        return ", ".join(
+            f"{h.name} p50={h.p50 * 1000:.2f}ms p99={h.p99 * 1000:.2f}ms n={h.count}"
+            for h in list(self._stages.values())
+            if h.count
+        )
+
+    def to_dict(self) -> dict[str, dict]:
+        return {h.name: h.to_dict() for h in list(self._stages.values())}
+
+    def reset(self):
+        for histogram in list(self._stages.values()):
+            histogram.reset()
+        self._tick_at = None
+
+    # Export
+    @property
+    def address(self) -> tuple[str, int] | None:
+        """Address of metrics endpoint"""
+        if self._server is None:
+            return None
+        return self._server.server_address
+
+    def start(
+        self,
+        log_interval: float = 0.0,
+        address: tuple[str, int] | None = None,
+    ):
+        """Start exporting latency
+
+        Args:
+            log_interval (float, optional): Seconds between report log lines, 0 to disable.
+                Defaults to 0.0.
+            address (tuple[str, int] | None, optional): Serve JSON of all stages over HTTP,
+                port 0 to pick a free port. Defaults to None.
+        """
+        self._log_interval = log_interval
+        self._logged_at = time.perf_counter()
+
+        if address is None or self._server is not None:
+            return
+
+        probes = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(probes.to_dict()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(address, Handler)
+        threading.Thread(
+            target=self._server.serve_forever,
+            name="LatencyProbes",
+            daemon=True,
+        ).start()
+
+        logger.info("Latency metrics on http://%s:%s", *self.address)
+
+    def stop(self):
+        if self._log_interval > 0:
+            logger.info("Latency: %s", self.report())
+        self._log_interval = 0.0
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+latency_probes = LatencyProbes()
+"""Latency probes of this process"""
@@ -43,6 +43,7 @@ if __name__ == "__main__":
                 # "mt5linux @ git+https://github.com/AwesomeTrading/mt5linux.git@master"
             ],
             "exchange-ccxt": ["lettrade[live]", "ccxt", "python-box"],
+            "jit": ["numba"],
             "test": ["pytest"],
             "all": [
                 "lettrade[backtest-extra]",
@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from lettrade import indicator as i
+from lettrade.data import data_compact, data_compact_validate
+from lettrade.exchange.backtest.data import CSVBackTestDataFeed
+
+
+class CompactDataFeedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data = CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+        self.compact = CSVBackTestDataFeed(
+            "test/assets/EURUSD_1h-0_1000.csv",
+            compact=True,
+        )
+
+    def test_dtypes(self):
+        for column in ("open", "high", "low", "close", "volume"):
+            self.assertEqual(self.compact[column].dtype, np.float32, column)
+        self.assertTrue(self.compact.meta["compact"], "Compact meta flag missing")
+
+    def test_values(self):
+        data_compact_validate(self.compact, self.data)
+
+    def test_signal(self):
+        df = self.data.copy(deep=True)
+        df["ema"] = i.ema(df.close, window=21)
+        df["signal"] = i.crossover(df.close, df.ema)
+        origin = df.copy(deep=True)
+
+        casted = data_compact(df, validate=True)
+        self.assertEqual(casted["ema"], np.float32, "Indicator is not float32")
+        # Signal indicators are int8 already
+        self.assertNotIn("signal", casted)
+        self.assertEqual(df["signal"].dtype, np.int8, "Signal is not int8")
+        self.assertTrue(np.array_equal(df["signal"].values, origin["signal"].values))
+
+        # Indicator computed from float32 prices match float64 within tolerance
+        compact_ema = i.ema(self.compact.close, window=21)
+        data_compact_validate(
+            pd.DataFrame(dict(ema=compact_ema)),
+            dict(ema=origin["ema"].values),
+            rtol=1e-5,
+        )
+
+    def test_bool_mask(self):
+        df = self.data.copy(deep=True)
+        df["flag"] = df.close > df.open
+        expected = df.loc[df.flag].index
+
+        casted = data_compact(df)
+        self.assertNotIn("flag", casted)
+        self.assertEqual(df["flag"].dtype, np.bool_, "Bool column is casted")
+        # Boolean mask still filters rows instead of selecting by label
+        self.assertTrue(df.loc[df.flag].index.equals(expected))
+        self.assertEqual(len(df[df.flag]), len(expected))
+
+    def test_validate(self):
+        df = self.data.copy(deep=True)
+        df["close"] = df["close"] + 1e-3
+        with self.assertRaises(RuntimeError):
+            data_compact_validate(df, self.data)
+
+    def test_next_to(self):
+        df = self.compact.copy(deep=True)
+        to = df.index[10] + pd.Timedelta(minutes=30)
+
+        self.assertTrue(df.next(to=to), "Data has next bar")
+        self.assertEqual(df.l.pointer, 10, "Data pointer wrong")
+
+        # Moving back does nothing
+        self.assertTrue(df.next(to=df.index[5]))
+        self.assertEqual(df.l.pointer, 10, "Data pointer wrong")
+
+        self.assertFalse(df.next(to=df.index[-1]), "Data has no next bar")
+        self.assertEqual(df.l.pointer, len(df) - 1, "Data pointer wrong")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,74 @@
+import pytest
+
+from lettrade.exchange.backtest.data import CSVBackTestDataFeed
+
+
+@pytest.fixture
+def data():
+    data = CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+    data._set_main()
+    return data
+
+
+def test_lazy_load_once(data: CSVBackTestDataFeed):
+    calls = []
+
+    def spread(df):
+        calls.append(1)
+        return df.high - df.low
+
+    data.lazy("spread", spread)
+    assert "spread" not in data.columns
+    assert not calls
+
+    # Load on first access, then cached as column
+    assert (data["spread"] == data.high - data.low).all()
+    assert "spread" in data.columns
+    assert data.l.spread[0] == data.high.iloc[0] - data.low.iloc[0]
+    assert len(calls) == 1
+
+
+def test_lazy_access(data: CSVBackTestDataFeed):
+    data.lazy("a", lambda df: df.close * 2)
+    data.lazy("b", lambda df: df.close * 3)
+    data.lazy("c", lambda df: df.close * 4)
+
+    assert data.a.iloc[0] == data.close.iloc[0] * 2
+    assert data.l.b[0] == data.close.iloc[0] * 3
+    assert list(data[["close", "c"]].columns) == ["close", "c"]
+
+
+def test_lazy_depends(data: CSVBackTestDataFeed):
+    data.lazy("ema", lambda df: df.i.ema(window=21))
+    data.lazy("unused", lambda df: df.i.ema(window=50))
+    data.lazy(
+        "signal",
+        lambda df: df.i.crossover(df.close, df["ema"]),
+        depends=["ema"],
+    )
+
+    data["signal"]
+    assert "ema" in data.columns
+    assert "unused" not in data.columns
+
+
+def test_lazy_cycle(data: CSVBackTestDataFeed):
+    data.lazy("a", lambda df: df["b"], depends=["b"])
+    data.lazy("b", lambda df: df["a"])
+
+    with pytest.raises(RuntimeError):
+        data["a"]
+
+    # Registration is kept after failure
+    data.lazy("b", lambda df: df.close)
+    assert (data["a"] == data.close).all()
+
+
+def test_lazy_copy_replace(data: CSVBackTestDataFeed):
+    data["x"] = 1.0
+    data.lazy("x", lambda df: df.close)
+    assert "x" not in data.columns
+
+    df = data.copy(deep=True)
+    assert (df["x"] == df.close).all()
+    assert "x" not in data.columns
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from lettrade.data import PanelDataFeed
+from lettrade.exchange.backtest.data import BackTestDataFeed, CSVBackTestDataFeed
+
+
+class PanelDataFeedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data = CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+        # Second symbol missing some bars
+        df = self.data.iloc[::2] * 2
+        self.other = BackTestDataFeed(data=df, name="OTHER", timeframe="2h")
+
+        self.panel = PanelDataFeed(datas=[self.data, self.other], name="forex")
+
+    def test_shape(self):
+        self.assertEqual(self.panel.values.shape, (1_000, 5, 2), "Panel shape wrong")
+        self.assertTrue(self.panel.values.flags["C_CONTIGUOUS"], "Panel not contiguous")
+        self.assertEqual(self.panel.symbols, ["EURUSD_1h", "OTHER"], "Symbols wrong")
+
+    def test_cross_section(self):
+        close = self.panel.l.close[0]
+        self.assertIsInstance(close, np.ndarray)
+        self.assertEqual(len(close), 2, "Cross section size wrong")
+        self.assertEqual(close[0], self.data.close.iloc[0])
+        self.assertEqual(close[1], self.data.close.iloc[0] * 2)
+
+    def test_next(self):
+        self.panel.next(3)
+        self.assertEqual(self.panel.l.pointer, 3, "Panel pointer wrong")
+        self.assertEqual(self.panel.now, self.data.index[3], "Panel now wrong")
+
+        # Missing bar of OTHER is forward filled
+        close = self.panel.l.close[0]
+        self.assertEqual(close[0], self.data.close.iloc[3])
+        self.assertEqual(close[1], self.data.close.iloc[2] * 2)
+
+        # Previous bars slice
+        closes = self.panel.l.close[-3:1]
+        self.assertEqual(closes.shape, (4, 2), "Panel slice shape wrong")
+
+    def test_next_to(self):
+        to = self.data.index[10] + pd.Timedelta(minutes=30)
+        self.assertTrue(self.panel.next(to=to))
+        self.assertEqual(self.panel.l.pointer, 10, "Panel pointer wrong")
+
+        self.assertFalse(self.panel.next(to=self.data.index[-1]))
+        self.assertFalse(self.panel.alive())
+
+    def test_field(self):
+        df = self.panel.field("open")
+        self.assertEqual(list(df.columns), self.panel.symbols)
+        self.assertTrue(np.array_equal(df["EURUSD_1h"].values, self.data.open.values))
+
+    def test_dataframe_symbols(self):
+        df = pd.DataFrame(self.data)
+        named = pd.DataFrame(self.other)
+        named.attrs = {"name": "NAMED"}
+
+        panel = PanelDataFeed(datas=[df, named], name="frames", timeframe="1h")
+        self.assertEqual(panel.symbols, ["data_0", "NAMED"], "Symbols wrong")
+        self.assertEqual(panel.values.shape, (1_000, 5, 2), "Panel shape wrong")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,75 @@
+import unittest
+
+import pandas as pd
+
+from lettrade.data import data_quality
+from lettrade.exchange.backtest.data import BackTestDataFeed, CSVBackTestDataFeed
+
+
+class DataQualityTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data = CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+        raw = pd.DataFrame(self.data).copy()
+        # Gap of 3 bars
+        raw = raw.drop(index=raw.index[10:13])
+        # Duplicate bar
+        raw = pd.concat([raw, raw.iloc[[20]]])
+        # Misaligned bar
+        index = raw.index.to_list()
+        index[30] = index[30] + pd.Timedelta(minutes=5)
+        raw.index = pd.DatetimeIndex(index, name="datetime")
+        # Zero range bar
+        raw.iloc[40, raw.columns.get_loc("high")] = raw.iloc[40]["low"]
+        self.raw = raw
+
+    def test_report(self):
+        report = data_quality(self.raw, timeframe="1h")
+
+        self.assertFalse(report.ok)
+        self.assertEqual(report.size, len(self.raw))
+        self.assertEqual(len(report.duplicates), 1)
+        self.assertEqual(len(report.unordered), 1)
+        self.assertEqual(len(report.misaligned), 1)
+        self.assertEqual(report.misaligned[0], self.raw.index[30])
+        self.assertEqual(len(report.zero_ranges), 1)
+
+        self.assertTrue(report.has_gaps)
+        self.assertEqual(report.gaps.iloc[0]["start"], self.data.index[9])
+        self.assertEqual(report.gaps.iloc[0]["end"], self.data.index[13])
+        self.assertEqual(report.gaps.iloc[0]["missing"], 3)
+
+    def test_repair(self):
+        report = data_quality(self.raw, timeframe="1h", repair=True)
+        self.assertTrue(report.index.is_monotonic_increasing)
+        self.assertTrue(report.index.is_unique)
+        self.assertEqual(len(report.index), len(self.data) - 3)
+
+        df = BackTestDataFeed(
+            self.raw, name="repaired", timeframe="1h", quality="repair"
+        )
+        self.assertEqual(len(df), len(self.data) - 3)
+        self.assertTrue(df.index.is_monotonic_increasing)
+        self.assertFalse(df.meta["gapless"])
+
+    def test_datafeed(self):
+        report = self.data.quality()
+        self.assertTrue(report.is_index_valid)
+        self.assertEqual(report.name, "EURUSD_1h")
+
+        with self.assertRaises(RuntimeError):
+            BackTestDataFeed(self.raw, name="raise", timeframe="1h", quality="raise")
+
+    def test_gapless(self):
+        df = BackTestDataFeed(
+            pd.DataFrame(self.data).iloc[:9],
+            name="gapless",
+            timeframe="1h",
+            quality="raise",
+        )
+        self.assertTrue(df.meta["gapless"])
+        self.assertTrue(df.next(to=df.index[3], missing="raise"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,5 +1,8 @@
+import copy
+import pickle
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from lettrade.data import TimeFrame
@@ -175,6 +178,67 @@ class DataFeedInjectTestCase(unittest.TestCase):
         ceil = tf.ceil(pd.Timestamp("2020-03-03 21:12:23"))
         self.assertEqual(ceil, pd.Timestamp("2020-03-09 00:00:00"))
 
+    def test_cache(self):
+        tf = TimeFrame("5m")
+        self.assertIs(tf, TimeFrame(5))
+        self.assertIs(tf, TimeFrame([5, "m"]))
+        self.assertIs(tf, TimeFrame(pd.Timedelta(minutes=5)))
+        self.assertIs(tf, TimeFrame(tf))
+        self.assertIs(tf, copy.deepcopy(tf))
+        self.assertIs(tf, pickle.loads(pickle.dumps(tf)))
+        self.assertEqual(hash(tf), hash("5m"))
+
+    def test_floor_array(self):
+        index = pd.date_range("2019-12-28", "2020-01-10", freq="7min", tz="UTC")
+        for value in ("5s", "5m", "15m", "1h", "4h", "7h", "1d", "1w"):
+            tf = TimeFrame(value)
+            floor = tf.floor(index)
+            self.assertIsInstance(floor, pd.DatetimeIndex)
+            self.assertEqual(floor.tz, index.tz)
+
+            expected = [tf.floor(dt) for dt in index]
+            if tf.unit in ["d", "w"]:
+                # Scalar day/week floor drop timezone
+                expected = [dt.tz_localize("UTC") for dt in expected]
+            self.assertTrue(floor.equals(pd.DatetimeIndex(expected)), value)
+
+    def test_ceil_array(self):
+        index = pd.date_range("2019-12-28", "2020-01-10", freq="7min", tz="UTC")
+        for value in ("5s", "5m", "15m", "1h", "4h", "7h"):
+            tf = TimeFrame(value)
+            ceil = tf.ceil(index)
+            expected = pd.DatetimeIndex([tf.ceil(dt) for dt in index])
+            self.assertTrue(ceil.equals(expected), value)
+
+        # Aligned values are kept
+        tf = TimeFrame("1d")
+        ceil = tf.ceil(pd.DatetimeIndex(["2020-01-01 00:00", "2020-01-01 00:01"]))
+        self.assertTrue(
+            ceil.equals(pd.DatetimeIndex(["2020-01-01", "2020-01-02"])),
+            "Ceil day wrong",
+        )
+
+    def test_floor_array_types(self):
+        tf = TimeFrame("1h")
+        values = np.array(
+            ["2020-01-01T01:30", "2020-01-01T03:59"], dtype="datetime64[ns]"
+        )
+        floor = tf.floor(values)
+        self.assertEqual(floor.dtype, np.dtype("datetime64[ns]"))
+        self.assertEqual(floor[1], np.datetime64("2020-01-01T03:00"))
+
+        floor = tf.floor(values.view(np.int64))
+        self.assertEqual(floor.dtype, np.int64)
+
+        series = pd.Series(values, name="dt")
+        floor = tf.floor(series)
+        self.assertIsInstance(floor, pd.Series)
+        self.assertEqual(floor.iloc[0], pd.Timestamp("2020-01-01 01:00"))
+
+        # Non UTC timezone round on wall time
+        index = pd.DatetimeIndex(["2020-01-01 01:30"]).tz_localize("Asia/Kolkata")
+        self.assertEqual(tf.floor(index)[0], index[0].floor("h"))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
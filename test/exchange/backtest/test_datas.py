@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from lettrade.exchange.backtest import (
+    ForexBackTestAccount,
+    LetTradeBackTest,
+    let_backtest,
+)
+from lettrade.lettrade import _run_bot_lazy
+
+from .backtest import BackTestStrategy
+
+_path = "example/data/data/EURUSD_5m-0_1000.csv"
+
+
+@pytest.fixture
+def frames() -> list[pd.DataFrame]:
+    df = pd.read_csv(_path, index_col=0, parse_dates=["datetime"])
+    return [df.iloc[: 250 * (i + 1)] for i in range(4)]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_datas_load(frames: list[pd.DataFrame], executor: str):
+    datas = LetTradeBackTest._load_datafeeds(frames, workers=2, executor=executor)
+
+    # Order of sources is kept
+    assert [d.name for d in datas] == ["data_0", "data_1", "data_2", "data_3"]
+    assert [len(d) for d in datas] == [250, 500, 750, 1000]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_datas_groups(frames: list[pd.DataFrame], executor: str):
+    groups = [frames[:2], frames[2:]]
+    datas = LetTradeBackTest._load_datafeeds(groups, workers=2, executor=executor)
+
+    # Index in group, grouped result in order
+    assert [[d.name for d in g] for g in datas] == [
+        ["data_0", "data_1"],
+        ["data_0", "data_1"],
+    ]
+    assert [[len(d) for d in g] for g in datas] == [[250, 500], [750, 1000]]
+
+
+def test_datas_lazy(frames: list[pd.DataFrame]):
+    groups = [[frames[3]], [frames[3]]]
+    lt = let_backtest(
+        strategy=BackTestStrategy,
+        datas=groups,
+        account=ForexBackTestAccount,
+        datas_lazy=True,
+    )
+
+    # Sources are kept raw until run() workers
+    assert lt._kwargs["datas"] is groups
+    lt.run(worker=2)
+
+
+def test_run_bot_lazy(frames: list[pd.DataFrame]):
+    groups = [frames[:2], frames[2:]]
+    bot_cls = MagicMock()
+
+    for group in groups:
+        _run_bot_lazy(LetTradeBackTest, datas=group, bot_cls=bot_cls, id=0)
+
+    # Every worker loads its own group in order, named as eager loaded groups
+    loaded = [call.kwargs["datas"] for call in bot_cls.run_bot.call_args_list]
+    assert [[len(d) for d in g] for g in loaded] == [[250, 500], [750, 1000]]
+    assert [[d.name for d in g] for g in loaded] == [
+        ["data_0", "data_1"],
+        ["data_0", "data_1"],
+    ]
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+import ccxt
+import pytest
+
+from lettrade.exchange.ccxt import CCXTAPI
+from lettrade.exchange.live import RequestPriority, RequestScheduler
+
+
+@pytest.fixture
+def rest():
+    return MagicMock()
+
+
+def test_scheduler_disable_ccxt_rate_limit():
+    kwargs = CCXTAPI._exchange_kwargs(scheduler=dict(rate=5), exchange="binance")
+    assert kwargs == dict(exchange="binance", enableRateLimit=False)
+
+    kwargs = CCXTAPI._exchange_kwargs(scheduler=False, exchange="binance")
+    assert "enableRateLimit" not in kwargs
+
+
+def test_scheduler_retry(rest: MagicMock):
+    rest.fetch_ohlcv.side_effect = [ccxt.ExchangeNotAvailable("down"), [[0] * 6]]
+    api = CCXTAPI(
+        exchange="binance",
+        key="",
+        secret="",
+        ccxt=rest,
+        scheduler=RequestScheduler(rate=100, backoff=0.01),
+    )
+
+    assert api.bars("BTC/USDT", "1m", to=1) == [[0] * 6]
+    assert rest.fetch_ohlcv.call_count == 2
+
+
+def test_scheduler_no_retry_order(rest: MagicMock):
+    rest.create_my_order.side_effect = ccxt.ExchangeNotAvailable("down")
+    api = CCXTAPI(
+        exchange="binance",
+        key="",
+        secret="",
+        ccxt=rest,
+        scheduler=RequestScheduler(rate=100, backoff=0.01),
+    )
+
+    with pytest.raises(ccxt.ExchangeNotAvailable):
+        api._request(rest.create_my_order, priority=RequestPriority.High)
+    assert rest.create_my_order.call_count == 1
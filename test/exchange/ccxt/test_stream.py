@@ -0,0 +1,142 @@
+import asyncio
+import queue
+import time
+from unittest.mock import MagicMock
+
+import ccxt
+import pandas as pd
+import pytest
+
+from lettrade.exchange.ccxt import CCXTAPI, CCXTDataFeed, CCXTDataFeeder, CCXTStream
+
+_minute = 60_000
+
+
+class FakeProExchange:
+    """Local mock of a `ccxt.pro` exchange, updates are emitted by test"""
+
+    def __init__(self) -> None:
+        self.queues = dict()
+        self.errors = dict()
+        self.closed = False
+
+    def emit(self, channel: str, payload, *args):
+        self.queues.setdefault((channel, *args), queue.Queue()).put(payload)
+
+    def disconnect(self, channel: str, *args):
+        self.errors[(channel, *args)] = ccxt.NetworkError("connection lost")
+
+    async def _watch(self, key):
+        if key in self.errors:
+            raise self.errors.pop(key)
+
+        q = self.queues.setdefault(key, queue.Queue())
+        while q.empty():
+            await asyncio.sleep(0.005)
+        return q.get()
+
+    async def watch_ohlcv(self, symbol, timeframe):
+        return await self._watch(("ohlcv", symbol, timeframe))
+
+    async def watch_orders(self):
+        return await self._watch(("orders",))
+
+    async def watch_my_trades(self):
+        return await self._watch(("my_trades",))
+
+    async def close(self):
+        self.closed = True
+
+
+def _candle(t: int, close: float) -> list:
+    return [t, close, close + 1, close - 1, close, 10.0]
+
+
+@pytest.fixture
+def server():
+    return FakeProExchange()
+
+
+@pytest.fixture
+def api(server: FakeProExchange):
+    start = (pd.Timestamp.now(tz="UTC").floor("1min") - pd.Timedelta(minutes=5)).value
+    start = start // 1_000_000
+
+    rest = MagicMock()
+    rest.fetch_ohlcv.side_effect = lambda symbol, timeframe, limit: [
+        _candle(start + i * _minute, 1.0) for i in range(limit)
+    ]
+
+    api = CCXTAPI(
+        exchange="binance",
+        key="",
+        secret="",
+        ccxt=rest,
+        stream=CCXTStream(server, reconnect_delay=0.01),
+    )
+    yield api
+    api.stop()
+
+
+def test_feeder_stream(server: FakeProExchange, api: CCXTAPI):
+    data = CCXTDataFeed(symbol="BTC/USDT", timeframe="1m", name="BTCUSDT_1m", api=api)
+    feeder = CCXTDataFeeder(api=api, tick=0)
+    feeder.init([data])
+    feeder.start(size=3)
+
+    assert len(data) == 3
+    assert api._ccxt.fetch_ohlcv.call_count == 1
+
+    building = data.now.value // 1_000_000 + _minute
+    server.disconnect("ohlcv", "BTC/USDT", "1m")
+    server.emit("ohlcv", [_candle(building, 2.0)], "BTC/USDT", "1m")
+    server.emit("ohlcv", [_candle(building, 3.0)], "BTC/USDT", "1m")
+    server.emit("ohlcv", [_candle(building + _minute, 4.0)], "BTC/USDT", "1m")
+
+    feeder.next()
+
+    # Last update of building bar is pushed when next bar arrives
+    assert len(data) == 4
+    assert data.now == pd.Timestamp(building, unit="ms", tz="UTC")
+    assert data.l.close[0] == 3.0
+    # No REST polling
+    assert api._ccxt.fetch_ohlcv.call_count == 1
+
+
+def test_feeder_stream_stalled(server: FakeProExchange, api: CCXTAPI):
+    data = CCXTDataFeed(symbol="BTC/USDT", timeframe="1m", name="BTCUSDT_1m", api=api)
+    feeder = CCXTDataFeeder(api=api, tick=0, stream_timeout=0.05)
+    feeder.init([data])
+    feeder.start(size=3)
+
+    # No stream update, bars are fetched by REST instead of blocking forever
+    feeder.next()
+    assert api._ccxt.fetch_ohlcv.call_count == 2
+
+
+def test_exchange_stream(server: FakeProExchange, api: CCXTAPI):
+    exchange = MagicMock()
+    api.start(exchange=exchange)
+
+    server.emit("orders", [{"id": "1", "status": "open"}])
+    server.emit("orders", [{"id": "1", "status": "closed"}, {"id": "2"}])
+    server.emit("my_trades", [{"id": "10", "order": "1"}])
+
+    deadline = time.time() + 2
+    while time.time() < deadline and not exchange.on_executions_event.called:
+        api.next()
+        time.sleep(0.01)
+
+    orders = [
+        o
+        for call in exchange.on_orders_event.call_args_list
+        for o in call.kwargs["new"]
+    ]
+    assert orders[-1].id == "2"
+    assert [o.status for o in orders if o.id == "1"][-1] == "closed"
+
+    trades = exchange.on_executions_event.call_args.args[0]
+    assert trades[0].order == "1"
+
+    api.stop()
+    assert server.closed
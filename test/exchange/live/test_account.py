@@ -0,0 +1,116 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from box import Box
+
+from lettrade.exchange.live import LiveAccount, LiveAPI
+
+_delay = 0.05
+
+
+def _position(id: str, pl: float) -> SimpleNamespace:
+    return SimpleNamespace(id=id, is_exited=True, exit_pl=pl, pl=pl)
+
+
+@pytest.fixture
+def account():
+    api = MagicMock(spec=LiveAPI)
+    api.account.return_value = Box(
+        balance=1_000.0,
+        equity=1_000.0,
+        margin=0.0,
+        leverage=1.0,
+    )
+
+    account = LiveAccount(api=api, refresh_delay=_delay)
+    account.init(exchange=MagicMock(positions={}, history_positions={}))
+    account.start()
+    yield account
+    account.stop()
+
+
+def _exit(account: LiveAccount, position: SimpleNamespace):
+    # Exchange moves exited position to history before notify account
+    account._exchange.history_positions[position.id] = position
+    account.on_positions([position])
+
+
+def test_positions_burst_coalesce(account: LiveAccount):
+    for i in range(10):
+        _exit(account, _position(str(i), 10.0))
+    # Recall of exited position is not counted twice
+    _exit(account, _position("0", 10.0))
+
+    # Balance is updated from events without API requests
+    assert account.balance == 1_100.0
+    assert account.equity == 1_100.0
+    assert account._api.account.call_count == 1
+
+    # One reconcile request for whole burst
+    time.sleep(_delay * 4)
+    assert account._api.account.call_count == 2
+    assert account.balance == 1_000.0
+
+
+def test_equity_open_positions(account: LiveAccount):
+    # PnL reported by last account refresh
+    account._api.account.return_value.equity = 1_020.0
+    account.account_refresh()
+    account._exchange.positions = dict(a=SimpleNamespace(pl=5.0))
+    assert account.equity == 1_020.0
+
+    # PnL estimated by pl() of open positions
+    account._pl_estimate = True
+    assert account.equity == 1_005.0
+    account._pl_estimate = False
+
+    # Reported PnL includes exited position, estimate until next refresh
+    _exit(account, _position("b", 10.0))
+    assert account.equity == 1_015.0
+
+    account._api.account.return_value.balance = 1_010.0
+    account._api.account.return_value.equity = 1_012.0
+    account.account_refresh()
+    assert account.equity == 1_012.0
+
+
+def test_refresh_outdated_by_exit(account: LiveAccount):
+    reply = account._api.account.return_value
+
+    def fetch():
+        # Exit event while request is in-flight, reply is not settled yet
+        _exit(account, _position("1", 10.0))
+        return reply
+
+    account._api.account.side_effect = fetch
+    account.account_refresh()
+    assert account.balance == 1_010.0
+
+    account._api.account.side_effect = None
+    reply.balance = 1_010.0
+    reply.equity = 1_010.0
+    account.account_refresh()
+    assert account.balance == 1_010.0
+
+
+def test_exited_prune(account: LiveAccount):
+    _exit(account, _position("1", 10.0))
+    assert account._exited == {"1"}
+
+    account._exchange.history_positions.clear()
+    _exit(account, _position("2", 10.0))
+    assert account._exited == {"2"}
+
+
+def test_refresh_disabled():
+    api = MagicMock(spec=LiveAPI)
+    account = LiveAccount(api=api, refresh_delay=None)
+    account.init(exchange=MagicMock(positions={}, history_positions={}))
+
+    account.on_positions([_position("1", 10.0)])
+    time.sleep(_delay)
+
+    assert not api.account.called
+    assert account.balance == 10.0
@@ -0,0 +1,109 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from lettrade.exchange.live import LiveAPI, LiveDataFeed, LiveDataFeeder
+
+_minute = pd.Timedelta(minutes=1)
+
+
+class FakeBars:
+    """Bars of 1 minute timeframe, last bar is building bar at `now`"""
+
+    def __init__(self) -> None:
+        self.now = pd.Timestamp.now(tz="UTC").floor("1min")
+        self.sizes = []
+
+    def __call__(self, symbol, timeframe, since, to):
+        self.sizes.append(to)
+        return [
+            [int((self.now - _minute * i).timestamp() * 1_000), 1.0, 2.0, 0.5, 1.5, 1]
+            for i in reversed(range(to))
+        ]
+
+
+@pytest.fixture
+def api():
+    api = MagicMock(spec=LiveAPI)
+    api.bars.side_effect = FakeBars()
+    return api
+
+
+def _feeder(api, cache) -> LiveDataFeeder:
+    feeder = LiveDataFeeder(api=api, tick=0, cache=str(cache))
+    feeder.init([LiveDataFeed(symbol="EURUSD", timeframe="1m", api=api)])
+    return feeder
+
+
+def test_warm_start(api, tmp_path):
+    bars: FakeBars = api.bars.side_effect
+
+    feeder = _feeder(api, tmp_path)
+    feeder.start(size=50)
+    assert bars.sizes == [51]
+    assert os.path.exists(tmp_path / "EURUSD_1m.pkl")
+
+    # Restart, only request last closed and building bar
+    bars.sizes.clear()
+    feeder = _feeder(api, tmp_path)
+    feeder.start(size=50)
+    assert bars.sizes == [2]
+    assert len(feeder.data) == 50
+    assert feeder.data.now == bars.now - _minute
+
+
+def test_catch_up(api, tmp_path):
+    bars: FakeBars = api.bars.side_effect
+
+    _feeder(api, tmp_path).start(size=50)
+
+    # Restart after 10 minutes, request grows until continuous with cache
+    bars.now += 10 * _minute
+    bars.sizes.clear()
+    feeder = _feeder(api, tmp_path)
+    feeder.start(size=50)
+
+    assert bars.sizes == [2, 5, 17]
+    assert len(feeder.data) == 60
+    assert feeder.data.now == bars.now - _minute
+    assert (feeder.data.index.to_series().diff().dropna() == _minute).all()
+
+    # Next bar
+    bars.now += _minute
+    bars.sizes.clear()
+    feeder.data.next()
+    assert bars.sizes == [2]
+    assert len(feeder.data) == 61
+
+
+def test_outdated_cache(api, tmp_path):
+    bars: FakeBars = api.bars.side_effect
+
+    _feeder(api, tmp_path).start(size=50)
+
+    bars.now += 1_000 * _minute
+    bars.sizes.clear()
+    feeder = _feeder(api, tmp_path)
+    feeder.start(size=50)
+
+    assert bars.sizes[-1] == 51
+    assert len(feeder.data) == 50
+    assert feeder.data.index[0] == bars.now - 50 * _minute
+
+
+def test_cache_save_on_new_bar(api, tmp_path):
+    bars: FakeBars = api.bars.side_effect
+
+    feeder = _feeder(api, tmp_path)
+    feeder.start(size=50)
+
+    with patch.object(LiveDataFeed, "cache_save") as cache_save:
+        # Building bar is updated, no new bar
+        feeder.data.next()
+        cache_save.assert_not_called()
+
+        bars.now += _minute
+        feeder.data.next()
+        cache_save.assert_called_once()
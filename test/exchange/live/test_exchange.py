@@ -0,0 +1,96 @@
+import itertools
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from lettrade.exchange import OrderResultOk, OrderState
+from lettrade.exchange.backtest.data import CSVBackTestDataFeed
+from lettrade.exchange.live import (
+    LiveAPI,
+    LiveExchange,
+    LiveOrder,
+    LiveOrderResultPending,
+)
+
+_delay = 0.2
+
+
+class FakeOrder(LiveOrder):
+    def place(self):
+        result = self._api.order_open(self)
+        self.id = result
+        return super(LiveOrder, self).place(at=self.data.l.index[0], raw=result)
+
+    def update(self, **kwargs):
+        raise NotImplementedError()
+
+    @classmethod
+    def from_raw(cls, raw, exchange):
+        return None
+
+    @classmethod
+    def from_position(cls, position):
+        return None
+
+
+class FakeLiveExchange(LiveExchange):
+    _order_cls = FakeOrder
+
+
+@pytest.fixture
+def exchange():
+    ids = itertools.count(1)
+    threads = set()
+
+    def order_open(order):
+        threads.add(threading.get_ident())
+        time.sleep(_delay)
+        return next(ids)
+
+    api = MagicMock(spec=LiveAPI)
+    api.order_open.side_effect = order_open
+
+    data = CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+    feeder = MagicMock(data=data, datas=[data])
+
+    exchange = FakeLiveExchange(api=api, orders_async=4)
+    exchange.init(brain=MagicMock(), feeder=feeder, account=MagicMock(), commander=None)
+    exchange.start()
+    exchange.threads = threads
+    yield exchange
+    exchange.stop()
+
+
+def test_orders_async(exchange: FakeLiveExchange):
+    start = time.perf_counter()
+    results = [exchange.new_order(size=1) for _ in range(4)]
+    assert time.perf_counter() - start < _delay
+
+    assert all(isinstance(r, LiveOrderResultPending) for r in results)
+    finals = [r.result(timeout=2) for r in results]
+    assert time.perf_counter() - start < 2 * _delay
+    assert all(isinstance(r, OrderResultOk) for r in finals)
+
+    # Order events are delivered in exchange thread on next cycle
+    assert exchange.orders == {}
+    assert threading.get_ident() not in exchange.threads
+    exchange.next_next()
+    assert sorted(exchange.orders) == [1, 2, 3, 4]
+    assert all(o.state == OrderState.Placed for o in exchange.orders.values())
+
+    assert exchange.order_latency.count == 4
+    assert exchange.order_latency.p50 >= _delay
+
+
+def test_orders_window(exchange: FakeLiveExchange):
+    start = time.perf_counter()
+    results = [exchange.new_order(size=1) for _ in range(6)]
+
+    # Window of 4 in-flight orders blocks the 5th until one answered
+    assert time.perf_counter() - start >= _delay
+    for result in results:
+        result.result(timeout=2)
+    exchange.next()
+    assert len(exchange.orders) == 6
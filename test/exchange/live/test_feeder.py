@@ -0,0 +1,57 @@
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from lettrade.exchange.live import AsyncLiveDataFeeder, LiveAPI, LiveDataFeed
+
+_delay = 0.2
+
+
+def _bars(symbol, timeframe, since, to):
+    time.sleep(_delay)
+    tf = pd.Timedelta(timeframe.replace("m", "min"))
+    now = pd.Timestamp.now(tz="UTC").floor(tf)
+    return [
+        [int((now - tf * i).timestamp() * 1_000), 1.0, 2.0, 0.5, 1.5, 10.0]
+        for i in reversed(range(to))
+    ]
+
+
+@pytest.fixture
+def feeder():
+    api = MagicMock(spec=LiveAPI)
+    api.bars.side_effect = _bars
+
+    datas = [
+        LiveDataFeed(symbol=f"SYMBOL{i}", timeframe="1m", api=api) for i in range(4)
+    ]
+    feeder = AsyncLiveDataFeeder(api=api, tick=0)
+    feeder.init(datas)
+    yield feeder
+    feeder.stop()
+
+
+def test_start_concurrent(feeder: AsyncLiveDataFeeder):
+    start = time.perf_counter()
+    feeder.start(size=5)
+    elapsed = time.perf_counter() - start
+
+    assert feeder._api.bars.call_count == 4
+    assert elapsed < 4 * _delay
+    for data in feeder.datas:
+        assert len(data) == 5
+
+
+def test_wakeup_on_bar_close(feeder: AsyncLiveDataFeeder):
+    feeder.start(size=5)
+
+    # Building bar closes after next minute
+    wakeup = feeder._wakeup_at()
+    assert wakeup == feeder.data.now + timedelta(minutes=2)
+    assert wakeup > datetime.now(tz=timezone.utc)
+
+    # No other bar closed yet, only main DataFeed is needed
+    assert feeder._needed_datas() == [feeder.data]
@@ -0,0 +1,76 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from lettrade.exchange.live import (
+    LiveAPI,
+    LiveDataFeed,
+    LiveDataFeeder,
+    LiveDataHub,
+    LiveDataHubClient,
+)
+
+
+def _bars(symbol, timeframe, since, to):
+    time.sleep(0.1)
+    now = pd.Timestamp.now(tz="UTC").floor("1min")
+    return [
+        [
+            int((now - pd.Timedelta(minutes=i)).timestamp() * 1_000),
+            1.0,
+            2.0,
+            0.5,
+            1.5,
+            1,
+        ]
+        for i in reversed(range(to))
+    ]
+
+
+def _client_bars(config: dict, size: int) -> int:
+    client = LiveDataHubClient(**config)
+    return len(client.bars(symbol="EURUSD", timeframe="1m", since=0, to=size))
+
+
+@pytest.fixture
+def hub():
+    api = MagicMock(spec=LiveAPI)
+    api.bars.side_effect = _bars
+
+    hub = LiveDataHub(api=api, ttl=5)
+    hub.start()
+    yield hub
+    hub.stop()
+
+
+def test_fanout(hub: LiveDataHub):
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        sizes = list(executor.map(_client_bars, [hub.config] * 8, [10] * 8))
+
+    assert sizes == [10] * 8
+    assert hub.requested == 8
+    # Fetch once for all bots
+    assert hub._api.bars.call_count == 1
+
+
+def test_feeder_hub(hub: LiveDataHub):
+    api = MagicMock(spec=LiveAPI)
+    datas = [LiveDataFeed(symbol="EURUSD", timeframe="1m", api=api) for _ in range(3)]
+
+    feeder = LiveDataFeeder(api=api, tick=0, hub=hub.config)
+    feeder.init(datas)
+    feeder.start(size=5)
+
+    for data in datas:
+        assert len(data) == 5
+    api.bars.assert_not_called()
+    assert hub._api.bars.call_count == 1
+
+    # Smaller size is served by cache, bigger size is fetched
+    assert len(feeder._hub.bars(symbol="EURUSD", timeframe="1m", to=3)) == 3
+    assert hub._api.bars.call_count == 1
+    assert len(feeder._hub.bars(symbol="EURUSD", timeframe="1m", to=20)) == 20
+    assert hub._api.bars.call_count == 2
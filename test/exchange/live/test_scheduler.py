@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from lettrade.exchange.live import RequestPriority, RequestScheduler, TokenBucket
+from lettrade.exchange.live.scheduler import backoff_jitter
+
+
+def _take(bucket) -> float:
+    return bucket.take(1, RequestPriority.Low)
+
+
+def test_bucket_priority():
+    bucket = TokenBucket(rate=1, capacity=2, reserve=1)
+
+    assert bucket.take(1, RequestPriority.Low) == 0
+    # Last token is reserved for orders
+    assert bucket.take(1, RequestPriority.Low) > 0
+    assert bucket.take(1, RequestPriority.High) == 0
+    assert bucket.take(1, RequestPriority.High) > 0
+
+
+def test_coalesce():
+    calls = []
+
+    def fetch(symbol):
+        calls.append(symbol)
+        time.sleep(0.2)
+        return [symbol]
+
+    scheduler = RequestScheduler(rate=100)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(scheduler.call, fetch, "BTC", key=("fetch", "BTC"))
+            for _ in range(5)
+        ]
+        results = [f.result() for f in futures]
+
+    assert calls == ["BTC"]
+    assert results == [["BTC"]] * 5
+    assert scheduler._inflight == {}
+
+
+def test_retry_backoff():
+    attempts = []
+
+    def flaky():
+        attempts.append(time.perf_counter())
+        if len(attempts) < 3:
+            raise TimeoutError()
+        return "ok"
+
+    scheduler = RequestScheduler(rate=100, retry=3, backoff=0.05)
+    assert scheduler.call(flaky, retry_on=(TimeoutError,)) == "ok"
+    assert len(attempts) == 3
+    assert attempts[1] - attempts[0] >= 0.025
+
+    attempts.clear()
+    scheduler = RequestScheduler(rate=100, retry=2, backoff=0.01)
+    with pytest.raises(TimeoutError):
+        scheduler.call(flaky, retry_on=(TimeoutError,))
+
+    for attempt in range(10):
+        delay = backoff_jitter(attempt, base=0.5, cap=4)
+        assert min(4, 0.5 * 2**attempt) / 2 <= delay <= min(4, 0.5 * 2**attempt)
+
+
+def test_priority_order():
+    scheduler = RequestScheduler(rate=20, capacity=1, reserve=0)
+    scheduler.acquire()
+    order = []
+
+    def request(name, priority):
+        scheduler.acquire(priority=priority)
+        order.append(name)
+
+    low = threading.Thread(target=request, args=("bars", RequestPriority.Low))
+    high = threading.Thread(target=request, args=("order", RequestPriority.High))
+    low.start()
+    time.sleep(0.01)
+    high.start()
+    low.join()
+    high.join()
+
+    assert order == ["order", "bars"]
+
+
+def test_multiprocess_bucket():
+    kwargs = dict(rate=0.1, capacity=2, reserve=0)
+    RequestScheduler.multiprocess(kwargs=kwargs)
+    scheduler = RequestScheduler(**kwargs)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_take, kwargs["bucket"]).result() == 0
+
+    assert scheduler._bucket.take(1, RequestPriority.Low) == 0
+    # Bucket is shared, no token left in any process
+    assert scheduler._bucket.take(1, RequestPriority.Low) > 0
+
+
+def test_parameters():
+    scheduler = RequestScheduler(rate=5, retry=2)
+    parameters = scheduler.parameters()
+
+    assert parameters["rate"] == 5
+    assert parameters["retry"] == 2
+    # Local bucket is not shared
+    assert "bucket" not in parameters
+
+    kwargs = dict(rate=5)
+    RequestScheduler.multiprocess(kwargs=kwargs)
+    scheduler = RequestScheduler(**kwargs)
+    assert scheduler.parameters()["bucket"] is kwargs["bucket"]
@@ -0,0 +1,147 @@
+from collections import Counter, namedtuple
+from datetime import datetime
+
+import pytest
+
+from lettrade.exchange.metatrader.reconcile import MetaTraderReconciler
+
+Order = namedtuple(
+    "Order",
+    "ticket time_setup sl tp volume_current price_open price_stoplimit state",
+)
+Position = namedtuple("Position", "ticket time_update sl tp volume type")
+Deal = namedtuple("Deal", "ticket time position_id type")
+
+
+class FakeMT5Server:
+    """Fake MetaTrader 5 terminal, count every RPC"""
+
+    def __init__(self) -> None:
+        self.calls = Counter()
+        self.orders: dict[int, Order] = dict()
+        self.history_orders: dict[int, Order] = dict()
+        self.positions: dict[int, Position] = dict()
+        self.deals: list[Deal] = []
+
+    @property
+    def rpc(self) -> int:
+        return sum(self.calls.values())
+
+    def orders_get(self, **kwargs):
+        self.calls["orders_get"] += 1
+        return tuple(self.orders.values())
+
+    def positions_get(self, **kwargs):
+        self.calls["positions_get"] += 1
+        return tuple(self.positions.values())
+
+    def history_deals_get(self, since, to):
+        self.calls["history_deals_get"] += 1
+        since = since.timestamp()
+        return tuple(d for d in self.deals if d.time >= since)
+
+    def history_orders_get(self, since=None, to=None, ticket=None):
+        self.calls["history_orders_get"] += 1
+        if ticket is not None:
+            return tuple(o for o in self.history_orders.values() if o.ticket == ticket)
+        since = since.timestamp()
+        return tuple(o for o in self.history_orders.values() if o.time_setup >= since)
+
+    # Helpers
+    def order_open(self, ticket: int, time_setup: int):
+        self.orders[ticket] = Order(ticket, time_setup, 1.0, 2.0, 0.1, 1.5, 0.0, 1)
+
+    def order_fill(self, ticket: int):
+        order = self.orders.pop(ticket)
+        self.history_orders[ticket] = order._replace(state=4)
+
+
+@pytest.fixture
+def server():
+    return FakeMT5Server()
+
+
+@pytest.fixture
+def reconciler():
+    return MetaTraderReconciler(deal_since=datetime.fromtimestamp(0))
+
+
+def test_orders_bulk(server: FakeMT5Server, reconciler: MetaTraderReconciler):
+    now = int(datetime.now().timestamp())
+    for ticket in range(1, 101):
+        server.order_open(ticket, now - ticket)
+
+    added, removed = reconciler.check_orders(server)
+    assert len(added) == 100
+    assert removed == []
+    assert server.rpc == 1
+
+    # Nothing changed
+    added, removed = reconciler.check_orders(server)
+    assert added == [] and removed == []
+    assert server.rpc == 2
+
+    # Modify one order
+    server.orders[5] = server.orders[5]._replace(sl=0.5)
+    added, removed = reconciler.check_orders(server)
+    assert [o.ticket for o in added] == [5]
+    assert server.rpc == 3
+
+    # Fill many orders, resolved by 1 history RPC
+    for ticket in range(1, 51):
+        server.order_fill(ticket)
+    added, removed = reconciler.check_orders(server)
+    assert added == []
+    assert sorted(o.ticket for o in removed) == list(range(1, 51))
+    assert all(o.state == 4 for o in removed)
+    assert server.calls["history_orders_get"] == 1
+    assert server.rpc == 5
+
+
+def test_positions_diff(server: FakeMT5Server, reconciler: MetaTraderReconciler):
+    for ticket in range(1, 201):
+        server.positions[ticket] = Position(ticket, 1, 1.0, 2.0, 0.1, 0)
+
+    added, removed = reconciler.check_positions(server)
+    assert len(added) == 200 and removed == []
+
+    server.positions[7] = server.positions[7]._replace(time_update=2)
+    exited = server.positions.pop(9)
+    added, removed = reconciler.check_positions(server)
+    assert [p.ticket for p in added] == [7]
+    assert removed == [exited]
+    assert server.rpc == 2
+
+
+def test_orders_hash_collision(server: FakeMT5Server, reconciler: MetaTraderReconciler):
+    server.order_open(1, int(datetime.now().timestamp()))
+    server.orders[1] = server.orders[1]._replace(sl=-1)
+    reconciler.check_orders(server)
+
+    # hash(-1) == hash(-2), update is still detected
+    server.orders[1] = server.orders[1]._replace(sl=-2)
+    added, removed = reconciler.check_orders(server)
+    assert [o.sl for o in added] == [-2]
+    assert removed == []
+
+
+def test_positions_retry(server: FakeMT5Server, reconciler: MetaTraderReconciler):
+    server.positions[1] = Position(1, 1, 1.0, 2.0, 0.1, 0)
+    reconciler.check_positions(server)
+
+    # All positions disappear without close deal, may be wrong account
+    server.positions.clear()
+    assert reconciler.check_positions(server) is None
+
+
+def test_deals(server: FakeMT5Server, reconciler: MetaTraderReconciler):
+    now = int(datetime.now().timestamp())
+    server.deals = [Deal(i, now - 10 + i, 1, 0) for i in range(5)]
+
+    deals = reconciler.check_deals(server)
+    assert len(deals) == 5
+    assert reconciler.deal_since == datetime.fromtimestamp(now - 10 + 4 + 1)
+
+    deals = reconciler.check_deals(server)
+    assert deals == []
+    assert server.rpc == 2
@@ -0,0 +1,152 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from lettrade import DataFeed, OrderType, Strategy
+from lettrade.exchange.replay import ReplayAPI, ReplayClock, let_replay
+from lettrade.utils.latency import latency_probes
+
+_path = "test/assets/EURUSD_1h-0_1000.csv"
+
+
+def _df(rows: list[tuple[float, float, float, float]]) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=len(rows), freq="1h", tz="UTC")
+    df = pd.DataFrame(rows, index=index, columns=["open", "high", "low", "close"])
+    df["volume"] = 1.0
+    return df
+
+
+def _order(size, type=OrderType.Market, limit=None, stop=None, sl=None, tp=None):
+    return SimpleNamespace(
+        data=SimpleNamespace(symbol="EURUSD"),
+        size=size,
+        type=type,
+        limit_price=limit,
+        stop_price=stop,
+        sl_price=sl,
+        tp_price=tp,
+        tag=None,
+    )
+
+
+def _step(api: ReplayAPI, bars: int = 1):
+    for _ in range(bars):
+        api.clock.wait(api.clock.now() + pd.Timedelta(hours=1))
+        api.next()
+
+
+@pytest.fixture
+def api():
+    df = _df(
+        [
+            (1.0, 1.1, 0.9, 1.0),
+            (1.0, 1.1, 0.9, 1.0),
+            (1.0, 1.2, 0.95, 1.1),
+            (1.1, 1.15, 0.8, 0.9),
+            (0.9, 1.0, 0.85, 0.95),
+        ]
+    )
+    api = ReplayAPI(datas={("EURUSD", "1h"): df}, start=1, contract_size=1)
+    api.start(exchange=MagicMock())
+    api.bars("EURUSD", "1h", since=0, to=2)
+    return api
+
+
+def test_bars_hide_building_bar(api: ReplayAPI):
+    bars = api.bars("EURUSD", "1h", since=0, to=10)
+
+    assert len(bars) == 2
+    # Building bar only knows its open price
+    assert bars[-1][1:] == [1.0, 1.0, 1.0, 1.0, 0.0]
+    assert bars[0][2] == 1.1
+
+
+def test_market_order_fill_and_sl(api: ReplayAPI):
+    result = api.order_open(_order(size=1, sl=0.85))
+    assert result.state == "filled"
+    assert result.price == 1.0
+
+    # Bars 1 and 2 do not hit sl, bar 3 does
+    _step(api, 2)
+    positions = api._exchange.on_positions_event.call_args.kwargs
+    assert positions["new"][0].ticket == result.order
+    assert api._exchange.on_positions_event.call_count == 1
+
+    _step(api)
+    positions = api._exchange.on_positions_event.call_args.kwargs
+    assert positions["old"][0].price_close == 0.85
+    assert api.account().balance == pytest.approx(10_000 - 0.15)
+
+
+def test_limit_order_fill(api: ReplayAPI):
+    result = api.order_open(_order(size=-1, type=OrderType.Limit, limit=1.15))
+    assert result.state == "place"
+    assert len(api.orders_get()) == 1
+
+    _step(api)
+    assert not api._exchange.on_orders_event.called
+
+    _step(api)
+    orders = api._exchange.on_orders_event.call_args.kwargs["old"]
+    assert orders[0].state == "filled"
+    assert orders[0].price_done == 1.15
+    assert api.positions_get()[0].size == -1
+
+
+def test_clock_speed():
+    clock = ReplayClock(speed=36_000)
+    clock.set(pd.Timestamp("2024-01-01", tz="UTC"))
+
+    start = time.perf_counter()
+    clock.wait(pd.Timestamp("2024-01-01 01:00", tz="UTC"))
+
+    assert 0.09 <= time.perf_counter() - start < 0.5
+    assert clock.now() >= pd.Timestamp("2024-01-01 01:00", tz="UTC")
+
+
+def test_latency(api: ReplayAPI):
+    api._latency = (0.01, 0.02)
+
+    start = time.perf_counter()
+    api.tick_get("EURUSD")
+
+    assert time.perf_counter() - start >= 0.01
+
+
+class _AlternateStrategy(Strategy):
+    def next(self, df: DataFeed):
+        if len(self.positions) or len(self.orders):
+            return
+
+        price = df.l.close[-1]
+        if len(df) % 2:
+            self.buy(size=0.01, sl=price - 0.002, tp=price + 0.002)
+        else:
+            self.sell(size=0.01, sl=price + 0.002, tp=price - 0.002)
+
+
+def test_let_replay():
+    latency_probes.reset()
+    lt = let_replay(
+        datas=[("EURUSD", "1h", "EURUSD_1h")],
+        strategy=_AlternateStrategy,
+        replay_datas={("EURUSD", "1h"): _path},
+        replay_start=800,
+        feeder_kwargs=dict(start_size=800),
+    )
+    lt.run()
+
+    exchange = lt._bot.exchange
+    assert exchange.data.now == pd.Timestamp("2022-12-16 14:00", tz="UTC")
+    assert len(exchange.history_positions) > 10
+    assert exchange.order_latency.count > 10
+    # Only SL/TP orders of last open position are left
+    assert len(exchange.orders) <= 2
+
+    stages = latency_probes.to_dict()
+    for stage in ("bars_load", "indicators", "strategy_next", "tick_to_order"):
+        assert stages[stage]["count"] > 0, stage
+    assert stages["order_open"]["count"] == exchange.order_latency.count
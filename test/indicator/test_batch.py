@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+import talib.abstract as ta
+
+from lettrade.exchange.backtest import CSVBackTestDataFeed
+from lettrade.indicator import bollinger_bands, ma, rsi
+from lettrade.indicator.utils import talib_ma_mode
+
+_windows = range(2, 60, 3)
+
+
+@pytest.fixture
+def dataframe():
+    return CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+
+@pytest.mark.parametrize("mode", ["sma", "ema", "wma"])
+def test_ma_batch(dataframe: CSVBackTestDataFeed, mode: str):
+    i = ma(dataframe.close, window=_windows, mode=mode)
+
+    assert i.shape == (len(dataframe), len(_windows))
+    for window in _windows:
+        expected = ma(dataframe.close, window=window, mode=mode)
+        np.testing.assert_allclose(i[window], expected, rtol=1e-12)
+
+
+def test_ma_batch_leading_nan(dataframe: CSVBackTestDataFeed):
+    series = pd.Series(np.nan, index=dataframe.index)
+    series.iloc[10:] = dataframe.close.iloc[10:]
+
+    i = ma(series, window=[1, 5, 20], mode="sma")
+    for window in (1, 5, 20):
+        expected = ma(series, window=window, mode="sma")
+        np.testing.assert_allclose(i[window], expected, rtol=1e-12)
+
+
+def test_ma_batch_inplace(dataframe: CSVBackTestDataFeed):
+    dataframe.i.ema(window=[9, 21], inplace=True)
+
+    np.testing.assert_array_equal(
+        dataframe["ema_21"],
+        ma(dataframe.close, window=21, mode="ema"),
+    )
+
+
+def test_rsi_batch(dataframe: CSVBackTestDataFeed):
+    i = rsi(dataframe.close, window=_windows)
+
+    for window in _windows:
+        np.testing.assert_array_equal(i[window], rsi(dataframe.close, window=window))
+
+
+@pytest.mark.parametrize("ma_mode", ["sma", "ema"])
+def test_bollinger_bands_batch(dataframe: CSVBackTestDataFeed, ma_mode: str):
+    stds = [1.0, 2.0, 2.5]
+    i = bollinger_bands(dataframe.close, window=_windows, std=stds, ma_mode=ma_mode)
+
+    assert i["bb_upper"].shape == (len(dataframe), len(_windows) * len(stds))
+    for window in _windows:
+        for std in stds:
+            upper, basis, lower = ta.BBANDS(
+                dataframe.close,
+                timeperiod=window,
+                nbdevup=std,
+                nbdevdn=std,
+                matype=talib_ma_mode(ma_mode),
+            )
+            np.testing.assert_allclose(i["bb_basis"][window], basis, rtol=1e-12)
+            np.testing.assert_allclose(i["bb_upper"][(window, std)], upper, rtol=1e-9)
+            np.testing.assert_allclose(i["bb_lower"][(window, std)], lower, rtol=1e-9)
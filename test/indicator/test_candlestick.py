@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from lettrade.exchange.backtest import CSVBackTestDataFeed
+from lettrade.indicator import (
+    DATAFRAME_PLOTTERS_NAME,
+    cdl_pattern,
+    cdl_patterns,
+    cdl_patterns_all,
+)
+
+
+@pytest.fixture
+def dataframe():
+    return CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_cdl_patterns_all(dataframe: CSVBackTestDataFeed, workers: int | None):
+    i = cdl_patterns_all(dataframe, workers=workers)
+
+    patterns = cdl_patterns()
+    assert len(patterns) > 60
+    assert i.shape == (len(dataframe), len(patterns))
+    assert (i.dtypes == np.int8).all()
+
+    for pattern in patterns:
+        expected = cdl_pattern(dataframe, pattern) // 100
+        np.testing.assert_array_equal(i[f"cdl_{pattern}"], expected)
+
+    assert not hasattr(dataframe, DATAFRAME_PLOTTERS_NAME)
+
+
+def test_cdl_patterns_all_subset_plot(dataframe: CSVBackTestDataFeed):
+    cdl_patterns_all(
+        dataframe,
+        ["Doji", "engulfing", "3whitesoldiers"],
+        prefix="p_",
+        inplace=True,
+        plot=["doji"],
+    )
+
+    assert {"p_doji", "p_engulfing", "p_3whitesoldiers"} <= set(dataframe.columns)
+    assert len(getattr(dataframe, DATAFRAME_PLOTTERS_NAME)) == 1
+    assert (dataframe["p_engulfing"] != 0).any()
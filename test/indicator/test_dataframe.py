@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdtest
+import pytest
+
+from lettrade.exchange.backtest import CSVBackTestDataFeed
+from lettrade.indicator import (
+    signal_condiction,
+    signal_direction,
+    signal_exist,
+    signal_repeat,
+)
+
+
+@pytest.fixture
+def dataframe():
+    return CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+
+def _legacy_condiction(dataframe, condictions, name, value=np.nan):
+    """Reference of `signal_condiction` by per condiction Series.update"""
+    indicators = []
+    for condiction in condictions:
+        series_value = pd.to_numeric(condiction["value"], errors="coerce")
+        series_index = dataframe.loc[condiction["series"]].index
+        series = pd.Series(series_value, index=series_index, name=condiction["name"])
+        series = series[~series.index.duplicated(keep="first")]
+        indicators.append(series)
+
+    series = pd.Series(value, index=dataframe.index, name=name)
+    for s in indicators:
+        series.update(s)
+    return series
+
+
+def test_signal_condiction(dataframe: CSVBackTestDataFeed):
+    condictions = [
+        dict(series=dataframe.close > dataframe.open, value=100, name="up"),
+        dict(series=dataframe.close < dataframe.open, value=-100, name="down"),
+        # Overlap with up, last condiction wins
+        dict(series=dataframe.high - dataframe.close < 1e-4, value=50, name="top"),
+        # NaN value never overrides
+        dict(series=dataframe.close > 0, value="invalid", name="nan"),
+    ]
+
+    for value in (np.nan, 0):
+        i = signal_condiction(dataframe, condictions, name="cdl", value=value)
+        expected = _legacy_condiction(dataframe, condictions, name="cdl", value=value)
+        pdtest.assert_series_equal(i, expected)
+
+    assert (i == 50).any()
+
+
+def test_signal_condiction_nan_series_value():
+    df = pd.DataFrame(dict(open=[0, 5, 0, 5, 0], close=[1.0, 2.0, 4.0, 3.0, 6.0]))
+    value = df.close.copy()
+    value.iloc[2] = np.nan
+    condictions = [
+        dict(series=df.close > df.open, value=100, name="up"),
+        # NaN of Series value keeps earlier matched condiction
+        dict(series=df.close > 3, value=value, name="close"),
+    ]
+
+    i = signal_condiction(df, condictions, name="signal")
+    pdtest.assert_series_equal(
+        i, pd.Series([100, np.nan, 100, np.nan, 6], name="signal")
+    )
+    pdtest.assert_series_equal(i, _legacy_condiction(df, condictions, name="signal"))
+
+
+def test_signal_condiction_labels(dataframe: CSVBackTestDataFeed):
+    condictions = [
+        dict(series=dataframe.close > dataframe.open, value=100, name="up"),
+        dict(series=list(dataframe.index[[1, 3, 5]]), value=-100, name="labels"),
+        dict(series=dataframe.index[10:20], value=50, name="index"),
+    ]
+
+    i = signal_condiction(dataframe, condictions, name="cdl", value=0)
+    expected = _legacy_condiction(dataframe, condictions, name="cdl", value=0)
+    pdtest.assert_series_equal(i, expected)
+
+
+def test_signal_direction(dataframe: CSVBackTestDataFeed):
+    up = dataframe.close > dataframe.open
+    down = dataframe.close < dataframe.open
+    signal_direction(dataframe, up=up, down=down, name="direction", inplace=True)
+
+    expected = _legacy_condiction(
+        dataframe,
+        [
+            dict(series=up, value=100, name="direction_up"),
+            dict(series=down, value=-100, name="direction_down"),
+        ],
+        name="direction",
+        value=0,
+    )
+    pdtest.assert_series_equal(dataframe["direction"], expected)
+
+
+@pytest.mark.parametrize("fn", [signal_exist, signal_repeat])
+def test_signal_exist_repeat(dataframe: CSVBackTestDataFeed, fn):
+    direction = signal_direction(
+        dataframe,
+        up=dataframe.close > dataframe.open,
+        down=dataframe.close < dataframe.open,
+    )
+    i = fn(dataframe, direction, window=3)
+
+    rolling_max = direction.rolling(window=3).max()
+    rolling_min = direction.rolling(window=3).min()
+    if fn is signal_exist:
+        up, down = rolling_max >= 100, rolling_min <= -100
+    else:
+        up, down = rolling_min >= 100, rolling_max <= -100
+
+    expected = _legacy_condiction(
+        dataframe,
+        [
+            dict(series=up, value=100, name="up"),
+            dict(series=down, value=-100, name="down"),
+        ],
+        name=i.name,
+        value=0,
+    )
+    pdtest.assert_series_equal(i, expected)
+    assert (i == 100).any() and (i == -100).any()
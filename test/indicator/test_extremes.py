@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
+
+from lettrade.exchange.backtest import CSVBackTestDataFeed
+from lettrade.indicator import RollingExtremes, rolling_extremes
+from lettrade.indicator.extremes import _rolling_max_blocks, _rolling_max_deque
+
+
+def _values(size: int = 500, nan: bool = False) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    # Rounded values have a lot of ties
+    values = np.round(rng.random(size) * 10)
+    if nan:
+        values[[3, 100, 101, 350]] = np.nan
+    return values
+
+
+def _expected(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    i_max = pd.Series(values).rolling(window).max().to_numpy()
+    i_argmax = np.full(len(values), -1, dtype=np.int64)
+    if window <= len(values):
+        views = sliding_window_view(values, window)
+        args = views.argmax(axis=1) + np.arange(len(views))
+        i_argmax[window - 1 :] = np.where(np.isnan(views).any(axis=1), -1, args)
+    return i_max, i_argmax
+
+
+@pytest.mark.parametrize("kernel", [_rolling_max_blocks, _rolling_max_deque])
+@pytest.mark.parametrize("window", [1, 2, 7, 52, 500, 600])
+@pytest.mark.parametrize("nan", [False, True])
+def test_rolling_max_kernel(kernel, window: int, nan: bool):
+    values = _values(nan=nan)
+    i_max, i_argmax = kernel(values, window)
+
+    expected_max, expected_argmax = _expected(values, window)
+    np.testing.assert_array_equal(i_max, expected_max)
+    np.testing.assert_array_equal(i_argmax, expected_argmax)
+
+
+def test_rolling_extremes():
+    df = CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+    i = df.i.rolling_extremes("high", "low", window=20, prefix="dc_")
+
+    np.testing.assert_array_equal(i["dc_max"], df.high.rolling(20).max())
+    np.testing.assert_array_equal(i["dc_min"], df.low.rolling(20).min())
+    assert i["dc_argmax"].iloc[19] == df.high.iloc[:20].argmax()
+    assert i["dc_argmin"].iloc[-1] == 980 + df.low.iloc[-20:].argmin()
+    assert (i["dc_argmin"].iloc[:19] == -1).all()
+
+
+def test_rolling_extremes_streaming():
+    high = _values(nan=True)
+    low = high - 1
+    i = rolling_extremes(pd.Series(high), pd.Series(low), window=7)
+
+    extremes = RollingExtremes(window=7)
+    for position, (h, l) in enumerate(zip(high, low)):
+        i_min, i_max, i_argmin, i_argmax = extremes.update(h, l)
+
+        np.testing.assert_equal(i_min, i["min"][position])
+        np.testing.assert_equal(i_max, i["max"][position])
+        assert i_argmin == i["argmin"][position]
+        assert i_argmax == i["argmax"][position]
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import testing as pdtest
+
+from lettrade.exchange.backtest import CSVBackTestDataFeed
+from lettrade.indicator import parabolic_sar
+
+
+def parabolic_sar_loop(
+    dataframe: pd.DataFrame,
+    af0: float = 0.02,
+    af: float = 0.02,
+    max_af: float = 0.2,
+) -> dict[str, pd.Series]:
+    """Reference row by row implementation of `parabolic_sar`"""
+    up = dataframe.high.iloc[1] - dataframe.high.iloc[0]
+    dn = dataframe.low.iloc[0] - dataframe.low.iloc[1]
+    falling = dn > up and dn > 0
+    ep = dataframe.low.iloc[0] if falling else dataframe.high.iloc[0]
+    sar = dataframe.close.iloc[0]
+
+    i_long = pd.Series(np.nan, index=dataframe.index)
+    i_short = i_long.copy()
+    i_reversal = pd.Series(0, index=dataframe.index)
+    i_af = i_long.copy()
+    i_af.iloc[0:2] = af0
+
+    m = dataframe.high.shape[0]
+    for row in range(1, m):
+        high_ = dataframe.high.iloc[row]
+        low_ = dataframe.low.iloc[row]
+
+        if falling:
+            _sar = sar + af * (ep - sar)
+            reverse = high_ > _sar
+
+            if low_ < ep:
+                ep = low_
+                af = min(af + af0, max_af)
+
+            _sar = max(dataframe.high.iloc[row - 1], dataframe.high.iloc[row - 2], _sar)
+        else:
+            _sar = sar + af * (ep - sar)
+            reverse = low_ < _sar
+
+            if high_ > ep:
+                ep = high_
+                af = min(af + af0, max_af)
+
+            _sar = min(dataframe.low.iloc[row - 1], dataframe.low.iloc[row - 2], _sar)
+
+        if reverse:
+            _sar = ep
+            af = af0
+            falling = not falling
+            ep = low_ if falling else high_
+
+        sar = _sar
+
+        if falling:
+            i_short.iloc[row] = sar
+        else:
+            i_long.iloc[row] = sar
+
+        i_af.iloc[row] = af
+        i_reversal.iloc[row] = int(reverse)
+
+    return dict(
+        psar_long=i_long,
+        psar_short=i_short,
+        psar_af=i_af,
+        psar_reversal=i_reversal,
+    )
+
+
+@pytest.fixture
+def dataframe():
+    return CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(af0=0.01, af=0.03, max_af=0.1),
+    ],
+)
+def test_parabolic_sar_identical(dataframe: CSVBackTestDataFeed, kwargs: dict):
+    expected = parabolic_sar_loop(dataframe, **kwargs)
+    result = parabolic_sar(dataframe, **kwargs)
+
+    for name, series in expected.items():
+        pdtest.assert_series_equal(result[name], series, check_exact=True)
+
+
+def test_parabolic_sar_rising_start(dataframe: CSVBackTestDataFeed):
+    # Reverse data to start with rising market
+    df = dataframe.iloc[::-1].reset_index(drop=True)
+    expected = parabolic_sar_loop(df)
+    result = parabolic_sar(df)
+
+    for name, series in expected.items():
+        pdtest.assert_series_equal(result[name], series, check_exact=True)
@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lettrade import DataFeed, Strategy
+from lettrade.exchange.backtest import CSVBackTestDataFeed, let_backtest
+from lettrade.indicator import (
+    IndicatorPipeline,
+    bollinger_bands,
+    crossover,
+    ema,
+    keltner_channel,
+)
+
+
+@pytest.fixture
+def dataframe():
+    return CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+
+def test_pipeline_outputs(dataframe: CSVBackTestDataFeed):
+    p = IndicatorPipeline()
+    ema21 = p.node(ema, "close", window=21)
+    bb = p.node(bollinger_bands, "close", window=20, std=2.0)
+
+    p.output("ema21", ema21)
+    p.output("bb_upper", bb["bb_upper"])
+    p.output("crossover", p.node(crossover, "close", ema21))
+
+    outputs = p.run(dataframe)
+
+    expected = ema(dataframe.close, window=21)
+    np.testing.assert_array_equal(dataframe["ema21"], expected)
+    np.testing.assert_array_equal(
+        outputs["bb_upper"],
+        bollinger_bands(dataframe.close, window=20, std=2.0)["bb_upper"],
+    )
+    pd.testing.assert_series_equal(
+        dataframe["crossover"],
+        crossover(dataframe.close, pd.Series(expected, index=dataframe.index)),
+        check_names=False,
+    )
+
+
+def test_pipeline_deduplicate(dataframe: CSVBackTestDataFeed):
+    calls = []
+
+    def counted(series: pd.Series, window: int):
+        calls.append(window)
+        return series.rolling(window).mean()
+
+    p = IndicatorPipeline()
+    a = p.node(counted, "close", window=20)
+    b = p.node(counted, "close", window=20)
+    assert a is b
+    assert p.node(counted, "close", window=10) is not a
+
+    p.output("sma20", a)
+    p.output("above", p.node(np.greater, "close", b))
+    p.output("below", p.node(np.less, "close", p.node(counted, "close", window=20)))
+    p.run(dataframe)
+
+    # Not used node is not evaluated
+    assert calls == [20]
+    assert len(p.nodes) == 4
+
+
+def test_pipeline_concurrent(dataframe: CSVBackTestDataFeed):
+    def slow(series: pd.Series, seconds: float):
+        time.sleep(seconds)
+        return series
+
+    p = IndicatorPipeline(workers=4)
+    for i in range(4):
+        p.output(f"slow{i}", p.node(slow, "close", seconds=0.1 + i * 0.001))
+
+    start = time.perf_counter()
+    p.run(dataframe, inplace=False)
+    assert time.perf_counter() - start < 0.3
+
+    # Every node has its timing
+    stages = p.probes.to_dict()
+    assert len(stages) == 4
+    for stage in stages.values():
+        assert stage["count"] == 1
+        assert stage["p50"] >= 0.09
+    assert "slow('close', seconds=0.1)" in p.report()
+
+
+def test_pipeline_sequential(dataframe: CSVBackTestDataFeed):
+    p = IndicatorPipeline(workers=1)
+    kc = p.node(keltner_channel, p.DATAFRAME, ma=21, atr=14)
+    p.output("kc_upper", kc["kc_upper"])
+    p.run(dataframe)
+
+    np.testing.assert_array_equal(
+        dataframe["kc_upper"],
+        keltner_channel(dataframe, ma=21, atr=14)["kc_upper"],
+    )
+
+
+class _PipelineStrategy(Strategy):
+    def pipeline(self):
+        p = IndicatorPipeline()
+        p.output("ema1", p.node(ema, "close", window=9))
+        p.output("ema2", p.node(ema, "close", window=21))
+        return p
+
+    def indicators(self, df: DataFeed):
+        df["signal_ema_crossover"] = df.i.crossover(df.ema1, df.ema2)
+
+    def next(self, df: DataFeed):
+        if len(self.positions) == 0 and df.l.signal_ema_crossover[-1]:
+            price = df.l.close[-1]
+            self.buy(size=0.1, sl=price - 0.001, tp=price + 0.001)
+
+
+def test_strategy_pipeline():
+    lt = let_backtest(
+        strategy=_PipelineStrategy,
+        datas="test/assets/EURUSD_1h-0_1000.csv",
+        plotter=None,
+    )
+    lt.run()
+
+    df = lt.data
+    assert "ema2" in df.columns
+    assert df["signal_ema_crossover"].abs().sum() > 0
+    assert len(lt._bot.exchange.history_positions) > 0
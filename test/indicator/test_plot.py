@@ -0,0 +1,36 @@
+import pytest
+
+from lettrade.exchange.backtest import CSVBackTestDataFeed
+from lettrade.indicator import (
+    DATAFRAME_PLOTTERS_NAME,
+    cdl_pattern,
+    ema,
+    indicator_plot_disabled,
+    indicator_plot_enabled,
+)
+
+
+@pytest.fixture
+def dataframe():
+    return CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+
+def test_plot_disabled(dataframe: CSVBackTestDataFeed):
+    with indicator_plot_disabled():
+        assert not indicator_plot_enabled()
+
+        ema("close", window=21, dataframe=dataframe, inplace=True, plot=True)
+        cdl_pattern(dataframe, "doji", inplace=True, plot=True, plot_type="mark")
+
+    assert indicator_plot_enabled()
+    assert "ema" in dataframe.columns
+    assert "cdl_doji" in dataframe.columns
+    assert not hasattr(dataframe, DATAFRAME_PLOTTERS_NAME)
+
+
+def test_plot_column_reference(dataframe: CSVBackTestDataFeed):
+    ema("close", window=21, dataframe=dataframe, inplace=True, plot=True)
+
+    plotters = getattr(dataframe, DATAFRAME_PLOTTERS_NAME)
+    assert len(plotters) == 1
+    assert plotters[0].kwargs["series"] == "ema"
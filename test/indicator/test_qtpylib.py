@@ -1,3 +1,10 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lettrade.exchange.backtest.data import CSVBackTestDataFeed
+from lettrade.indicator.vendor.qtpylib import qtpylib
+
 # import unittest
 
 # import numpy as np
@@ -93,3 +100,88 @@
 
 # if __name__ == "__main__":
 #     unittest.main(verbosity=2)
+
+
+def heikinashi_loop(bars: pd.DataFrame) -> pd.DataFrame:
+    """Reference of original qtpylib row loop"""
+    bars = bars.reset_index(drop=True)
+    bars["ha_close"] = (bars["open"] + bars["high"] + bars["low"] + bars["close"]) / 4
+
+    bars.at[0, "ha_open"] = (bars.at[0, "open"] + bars.at[0, "close"]) / 2
+    for i in range(1, len(bars)):
+        bars.at[i, "ha_open"] = (
+            bars.at[i - 1, "ha_open"] + bars.at[i - 1, "ha_close"]
+        ) / 2
+
+    bars["ha_high"] = bars.loc[:, ["high", "ha_open", "ha_close"]].max(axis=1)
+    bars["ha_low"] = bars.loc[:, ["low", "ha_open", "ha_close"]].min(axis=1)
+
+    return pd.DataFrame(
+        data={
+            "open": bars["ha_open"],
+            "high": bars["ha_high"],
+            "low": bars["ha_low"],
+            "close": bars["ha_close"],
+        },
+    )
+
+
+def rsi_loop(series: pd.Series, window: int = 14) -> pd.Series:
+    """Reference of original qtpylib row loop"""
+    deltas = np.diff(series)
+    seed = deltas[: window + 1]
+
+    ups = seed[seed > 0].sum() / window
+    downs = -seed[seed < 0].sum() / window
+    rsival = np.zeros_like(series)
+    rsival[:window] = 100.0 - 100.0 / (1.0 + ups / downs)
+
+    for i in range(window, len(series)):
+        delta = deltas[i - 1]
+        if delta > 0:
+            upval = delta
+            downval = 0
+        else:
+            upval = 0
+            downval = -delta
+
+        ups = (ups * (window - 1) + upval) / window
+        downs = (downs * (window - 1.0) + downval) / window
+        rsival[i] = 100.0 - 100.0 / (1.0 + ups / downs)
+
+    return pd.Series(index=series.index, data=rsival)
+
+
+@pytest.fixture
+def dataframe():
+    return CSVBackTestDataFeed("test/assets/EURUSD_1h-0_1000.csv")
+
+
+def test_heikinashi(dataframe: CSVBackTestDataFeed):
+    i = qtpylib.heikinashi(dataframe)
+    expected = heikinashi_loop(dataframe)
+
+    assert i.index.equals(dataframe.index)
+    np.testing.assert_allclose(i.to_numpy(), expected.to_numpy(), rtol=1e-13)
+
+
+def test_heikinashi_nan(dataframe: CSVBackTestDataFeed):
+    dataframe.loc[dataframe.index[100], "close"] = np.nan
+
+    i = qtpylib.heikinashi(dataframe)
+    expected = heikinashi_loop(dataframe)
+    np.testing.assert_allclose(i.to_numpy(), expected.to_numpy(), rtol=1e-13)
+
+
+@pytest.mark.parametrize("window", [2, 14, 50])
+def test_rsi(dataframe: CSVBackTestDataFeed, window: int):
+    i = qtpylib.rsi(dataframe.close, window=window)
+    expected = rsi_loop(dataframe.close, window=window)
+
+    assert i.index.equals(dataframe.index)
+    np.testing.assert_allclose(i, expected, rtol=1e-11)
+
+
+def test_rsi_short(dataframe: CSVBackTestDataFeed):
+    series = dataframe.close.iloc[:10]
+    np.testing.assert_allclose(qtpylib.rsi(series), rsi_loop(series))
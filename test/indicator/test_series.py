@@ -8,14 +8,18 @@ from lettrade.indicator import (
     below,
     crossover,
     crossunder,
+    direction,
     rolling_above,
     rolling_below,
+    rolling_direction,
     rolling_max,
     rolling_mean,
     rolling_min,
     s_above,
     s_below,
+    s_direction,
 )
+from lettrade.indicator.trend import ema
 
 
 @pytest.fixture
@@ -31,14 +35,14 @@ def series2():
 ### Test signal
 def test_s_above(series1: pd.Series, series2: pd.Series):
     i = s_above(series1, series2)
-    values = pd.Series([0] * 5 + [100] * 5 + [0] * 5)
+    values = pd.Series([0] * 5 + [100] * 5 + [0] * 5, dtype="int8")
 
     pdtest.assert_series_equal(i, values)
 
 
 def test_s_below(series1: pd.Series, series2: pd.Series):
     i = s_below(series1, series2)
-    values = pd.Series([-100] * 5 + [0] * 5 + [-100] * 5)
+    values = pd.Series([-100] * 5 + [0] * 5 + [-100] * 5, dtype="int8")
 
     pdtest.assert_series_equal(i, values)
 
@@ -46,14 +50,14 @@ def test_s_below(series1: pd.Series, series2: pd.Series):
 ### Test indicator above/below
 def test_above(series1: pd.Series, series2: pd.Series):
     i = above(series1, series2)
-    values = pd.Series([0] * 5 + [100] * 5 + [0] * 5)
+    values = pd.Series([0] * 5 + [100] * 5 + [0] * 5, dtype="int8")
 
     pdtest.assert_series_equal(i, values)
 
 
 def test_below(series1: pd.Series, series2: pd.Series):
     i = below(series1, series2)
-    values = pd.Series([-100] * 5 + [0] * 5 + [-100] * 5)
+    values = pd.Series([-100] * 5 + [0] * 5 + [-100] * 5, dtype="int8")
 
     pdtest.assert_series_equal(i, values)
 
@@ -61,14 +65,16 @@ def test_below(series1: pd.Series, series2: pd.Series):
 ### Test indicator rolling_above/rolling_below
 def test_rolling_above(series1: pd.Series, series2: pd.Series):
     i = rolling_above(series1, series2, window=3)
-    values = pd.Series([0] * 5 + [0, 0, 100, 100, 100] + [0] * 5)
+    values = pd.Series([0] * 5 + [0, 0, 100, 100, 100] + [0] * 5, dtype="int8")
 
     pdtest.assert_series_equal(i, values)
 
 
 def test_rolling_below(series1: pd.Series, series2: pd.Series):
     i = rolling_below(series1, series2, window=3)
-    values = pd.Series([0, 0, -100, -100, -100] + [0] * 5 + [0, 0, -100, -100, -100])
+    values = pd.Series(
+        [0, 0, -100, -100, -100] + [0] * 5 + [0, 0, -100, -100, -100], dtype="int8"
+    )
 
     pdtest.assert_series_equal(i, values)
 
@@ -76,14 +82,14 @@ def test_rolling_below(series1: pd.Series, series2: pd.Series):
 ### Test indicator crossover/crossunder
 def test_crossover(series1: pd.Series, series2: pd.Series):
     i = crossover(series1, series2)
-    values = pd.Series([0] * 5 + [100] + [0] * 9)
+    values = pd.Series([0] * 5 + [100] + [0] * 9, dtype="int8")
 
     pdtest.assert_series_equal(i, values)
 
 
 def test_crossunder(series1: pd.Series, series2: pd.Series):
     i = crossunder(series1, series2)
-    values = pd.Series([0] * 10 + [-100] + [0] * 4)
+    values = pd.Series([0] * 10 + [-100] + [0] * 4, dtype="int8")
 
     pdtest.assert_series_equal(i, values)
 
@@ -110,3 +116,74 @@ def test_rolling_mean(series1: pd.Series):
     )
 
     pdtest.assert_series_equal(i, values)
+
+
+### Test vectorized signals are same as per element implementation
+@pytest.fixture
+def close():
+    df = pd.read_csv(
+        "test/assets/EURUSD_1h-0_1000.csv",
+        index_col=0,
+        parse_dates=["datetime"],
+    )
+    return df.close
+
+
+def _legacy_above(s1, s2):
+    return (s1 - s2).apply(lambda v: 100 if v > 0 else 0)
+
+
+def _legacy_below(s1, s2):
+    return (s1 - s2).apply(lambda v: -100 if v < 0 else 0)
+
+
+def _legacy_direction(s1, s2):
+    return (s1 - s2).apply(lambda v: -100 if v < 0 else 100 if v > 0 else 0)
+
+
+def test_signals_legacy(close: pd.Series):
+    # EMA has NaN head
+    slow = pd.Series(ema(close, window=21), index=close.index)
+    fast = pd.Series(ema(close, window=9), index=close.index)
+
+    legacy = dict(
+        s_above=_legacy_above(fast, slow),
+        s_below=_legacy_below(fast, slow),
+        s_direction=_legacy_direction(fast, slow),
+        crossover=(
+            -_legacy_below(fast, slow).shift(1) + _legacy_above(fast, slow)
+        ).apply(lambda v: 100 if v >= 200 else 0),
+        crossunder=(
+            _legacy_below(fast, slow) - _legacy_above(fast, slow).shift(1)
+        ).apply(lambda v: -100 if v <= -200 else 0),
+        rolling_above=_legacy_above(close, slow)
+        .rolling(window=5)
+        .min()
+        .apply(lambda v: 100 if v >= 100 else 0),
+        rolling_below=_legacy_below(close, slow)
+        .rolling(window=5, min_periods=2)
+        .max()
+        .apply(lambda v: -100 if v <= -100 else 0),
+        rolling_direction=_legacy_direction(close, slow)
+        .rolling(window=5)
+        .mean()
+        .apply(lambda v: -100 if v <= -100 else 100 if v >= 100 else 0),
+    )
+    result = dict(
+        s_above=s_above(fast, slow),
+        s_below=s_below(fast, slow),
+        s_direction=s_direction(fast, slow),
+        crossover=crossover(fast, slow),
+        crossunder=crossunder(fast, slow),
+        rolling_above=rolling_above(close, slow, window=5),
+        rolling_below=rolling_below(close, slow, window=5, min_periods=2),
+        rolling_direction=rolling_direction(close, slow, window=5),
+    )
+
+    assert direction(fast, slow).dtype == np.int8
+    for name, expected in legacy.items():
+        assert result[name].dtype == np.int8, name
+        assert (expected != 0).any(), name
+        pdtest.assert_series_equal(
+            result[name], expected, check_dtype=False, check_names=False
+        )
@@ -0,0 +1,87 @@
+import json
+import math
+import time
+import unittest
+import urllib.request
+
+import numpy as np
+
+from lettrade.utils.latency import LatencyHistogram, LatencyProbes
+
+
+class LatencyHistogramTestCase(unittest.TestCase):
+    def setUp(self):
+        self.samples = np.random.default_rng(0).lognormal(-6, 1, size=10_000)
+        self.histogram = LatencyHistogram(name="test")
+        for sample in self.samples:
+            self.histogram.record(sample)
+
+    def test_percentile(self):
+        # Bucket upper edge, within one bucket width of exact percentile
+        width = 10 ** (1 / 20)
+        for q in (50, 90, 99):
+            exact = np.percentile(self.samples, q)
+            value = self.histogram.percentile(q)
+            self.assertGreaterEqual(value * 1.001, exact, f"p{q} too low")
+            self.assertLessEqual(value, exact * width * 1.001, f"p{q} too high")
+
+        self.assertEqual(self.histogram.count, len(self.samples))
+        self.assertAlmostEqual(self.histogram.mean, self.samples.mean())
+
+    def test_merge(self):
+        other = LatencyHistogram()
+        other.record(10.0)
+        self.histogram.merge(other)
+
+        self.assertEqual(self.histogram.count, len(self.samples) + 1)
+        self.assertEqual(self.histogram.max, 10.0)
+        self.assertEqual(self.histogram.percentile(100), 10.0)
+        self.assertEqual(sum(c for _, _, c in self.histogram.buckets()), 10_001)
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertTrue(math.isnan(histogram.p50))
+        self.assertEqual(histogram.to_dict()["count"], 0)
+
+
+class LatencyProbesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.probes = LatencyProbes()
+
+    def tearDown(self):
+        self.probes.stop()
+
+    def test_stages(self):
+        # No tick yet
+        self.probes.since_tick("tick_to_order")
+        self.assertNotIn("tick_to_order", self.probes.to_dict())
+
+        self.probes.tick()
+        with self.probes.measure("strategy_next"):
+            time.sleep(0.01)
+        self.probes.since_tick("tick_to_order")
+
+        stages = self.probes.to_dict()
+        self.assertEqual(stages["strategy_next"]["count"], 1)
+        self.assertGreaterEqual(stages["strategy_next"]["max"], 0.01)
+        self.assertGreaterEqual(
+            stages["tick_to_order"]["max"], stages["strategy_next"]["max"]
+        )
+        self.assertIn("strategy_next p50=", self.probes.report())
+
+    def test_endpoint(self):
+        self.probes.record("bars_load", 0.002)
+        self.probes.start(address=("127.0.0.1", 0))
+
+        host, port = self.probes.address
+        with urllib.request.urlopen(f"http://{host}:{port}/", timeout=5) as response:
+            stages = json.loads(response.read())
+
+        self.assertEqual(stages["bars_load"]["count"], 1)
+
+        self.probes.stop()
+        self.assertIsNone(self.probes.address)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)